@@ -10,9 +10,11 @@ __author__ = "Platform Foundation Core Holdings"
 
 from pf_cicd_agent.config.settings import Settings
 from pf_cicd_agent.agents.orchestrator import CICDOrchestrator
+from pf_cicd_agent.agents.async_orchestrator import AsyncCICDOrchestrator
 
 __all__ = [
     "Settings",
     "CICDOrchestrator",
+    "AsyncCICDOrchestrator",
     "__version__",
 ]
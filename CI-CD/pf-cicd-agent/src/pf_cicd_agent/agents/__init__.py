@@ -1,9 +1,15 @@
 """Agent implementations for the CI/CD system."""
 
 from pf_cicd_agent.agents.orchestrator import CICDOrchestrator
+from pf_cicd_agent.agents.async_orchestrator import AsyncCICDOrchestrator
 from pf_cicd_agent.agents.conversation import ConversationHandler
+from pf_cicd_agent.agents.planner import DAGExecutor, ExecutionPlan, PlanStep
 
 __all__ = [
     "CICDOrchestrator",
+    "AsyncCICDOrchestrator",
     "ConversationHandler",
+    "DAGExecutor",
+    "ExecutionPlan",
+    "PlanStep",
 ]
@@ -0,0 +1,387 @@
+"""
+Async CI/CD Orchestrator Agent.
+
+Asyncio variant of the orchestrator built on AsyncAnthropic, allowing a
+single process to serve many concurrent sessions.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+import structlog
+from anthropic import AsyncAnthropic
+
+from pf_cicd_agent.agents.metrics import elapsed_ms
+from pf_cicd_agent.agents.orchestrator import CICDOrchestrator
+from pf_cicd_agent.agents.planner import DAGExecutor, PlanStep
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.config.settings import Settings
+from pf_cicd_agent.tools.deadline import deadline_scope
+from pf_cicd_agent.tools.progress import progress_scope
+from pf_cicd_agent.tools.registry import ToolRegistry
+
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncCICDOrchestrator(CICDOrchestrator):
+    """
+    Async CI/CD Orchestrator Agent.
+
+    Same session, audit and progress-callback semantics as
+    CICDOrchestrator, but model requests and tool executions are awaited
+    instead of blocking the calling thread. The coroutine counterparts of
+    the orchestrator's methods carry an ``a`` prefix (achat,
+    aplan_and_execute, astart_session, aend_session, aclose); the blocking
+    chat() and plan_and_execute() are not available. Audit writes run in
+    a worker thread so they do not stall the event loop.
+    """
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        audit_service: AuditService | None = None,
+        tool_registry: ToolRegistry | None = None,
+        progress_callback: Callable[[str, dict[str, Any]], None] | None = None,
+    ) -> None:
+        """
+        Initialize the orchestrator.
+
+        Args:
+            settings: Application settings
+            audit_service: Audit service for logging
+            tool_registry: Pre-configured tool registry
+            progress_callback: Optional callback for progress updates
+        """
+        super().__init__(
+            settings=settings,
+            audit_service=audit_service,
+            tool_registry=tool_registry,
+            progress_callback=progress_callback,
+        )
+        self._tool_semaphore = asyncio.Semaphore(self.settings.agent_max_concurrent_tools)
+
+    def _create_client(self) -> Any:
+        """Create the async Anthropic API client."""
+        return AsyncAnthropic(api_key=self.settings.anthropic_api_key.get_secret_value())
+
+    async def aclose(self) -> None:
+        """
+        Close the provider clients' async connections and release what
+        close() does.
+
+        Call once the orchestrator is no longer used, on the event loop
+        that used it.
+        """
+        clients = [c for c in (self.github_client, self.do_client) if c is not None]
+        await asyncio.gather(*(client.aclose() for client in clients))
+        await asyncio.to_thread(self.close)
+
+    def chat(self, user_message: str) -> str:  # noqa: ARG002
+        """Not available: the async orchestrator's Anthropic client must be awaited."""
+        raise TypeError("AsyncCICDOrchestrator.chat() is not available; await achat() instead")
+
+    def plan_and_execute(self, request: str) -> str:  # noqa: ARG002
+        """Not available: the async orchestrator's Anthropic client must be awaited."""
+        raise TypeError(
+            "AsyncCICDOrchestrator.plan_and_execute() is not available; "
+            "await aplan_and_execute() instead"
+        )
+
+    async def astart_session(self) -> str:
+        """
+        Start a new agent session, writing its audit record in a worker thread.
+
+        Returns:
+            Session ID
+        """
+        return await asyncio.to_thread(self.start_session)
+
+    async def aend_session(self) -> dict[str, Any]:
+        """
+        End the current session, writing its audit record in a worker thread.
+
+        Returns:
+            Session summary
+        """
+        return await asyncio.to_thread(self.end_session)
+
+    async def achat(self, user_message: str) -> str:
+        """
+        Process a user message and return the agent's response.
+
+        Args:
+            user_message: The user's message
+
+        Returns:
+            Agent's response text
+        """
+        await asyncio.to_thread(self._record_user_message, user_message)
+
+        # Get response from Claude
+        response = await self._aget_response()
+
+        # Process the response (may involve tool calls)
+        final_response = await self._aprocess_response(response)
+
+        await asyncio.to_thread(self._finish_turn, final_response)
+        return final_response
+
+    async def _aget_response(self) -> Any:
+        """Get a response from Claude."""
+        self._compact_history()
+        started = time.perf_counter()
+        if self.settings.agent_stream_responses:
+            response = await self._astream_response()
+        else:
+            response = await self._client.messages.create(**self._build_request())
+
+        self._record_usage(response, elapsed_ms(started))
+        return response
+
+    async def _astream_response(self) -> Any:
+        """
+        Stream a response from Claude, reporting text deltas as they arrive.
+
+        Returns:
+            The final accumulated message
+        """
+        try:
+            async with self._client.messages.stream(**self._build_request()) as stream:
+                async for event in stream:
+                    self._handle_stream_event(event)
+                return await stream.get_final_message()
+        except BaseException:
+            await self._aabandon_dispatched()
+            raise
+
+    async def _aprocess_response(self, response: Any) -> str:
+        """
+        Process Claude's response, handling tool calls if needed.
+
+        The loop stops early with a partial result when the turn's
+        iteration, tool-call or wall-clock budget is exhausted.
+
+        Args:
+            response: Claude API response
+
+        Returns:
+            Final text response
+        """
+        while response.stop_reason == "tool_use":
+            tool_calls = [
+                block for block in response.content if block.type == "tool_use"
+            ]
+
+            reason = self._budget.check(len(tool_calls))
+            if reason:
+                partial = await asyncio.to_thread(
+                    self._stop_for_budget, reason, response, tool_calls
+                )
+                await self._adiscard_dispatched()
+                return partial
+            self._budget.consume(len(tool_calls))
+
+            started = time.perf_counter()
+            tool_results = await self._aexecute_tool_calls(tool_calls)
+            self.metrics.record_tool_wait(elapsed_ms(started))
+
+            self._messages.append(
+                {"role": "assistant", "content": response.content}
+            )
+            self._messages.append(
+                {"role": "user", "content": tool_results}
+            )
+
+            reason = self._budget.check()
+            if reason:
+                return await asyncio.to_thread(self._stop_for_budget, reason)
+
+            response = await self._aget_response()
+
+        await self._adiscard_dispatched()
+        return self._extract_text(response)
+
+    async def aplan_and_execute(self, request: str) -> str:
+        """
+        Process a request in plan-then-execute mode.
+
+        See CICDOrchestrator.plan_and_execute(); plan steps run as tasks
+        bounded by the configured concurrency limit.
+
+        Args:
+            request: The user's request
+
+        Returns:
+            Agent's response text
+        """
+        await asyncio.to_thread(self._record_user_message, request)
+        response = await self._arequest_plan(force=True)
+        final_response: str | None = None
+        failed_rounds = 0
+
+        while (plan_call := self._find_plan_call(response)) is not None:
+            plan, errors = self._parse_plan(plan_call)
+            reason = self._budget.check(len(plan.steps) if plan else 1)
+            if reason:
+                final_response = await asyncio.to_thread(
+                    self._stop_for_budget, reason, response, [plan_call]
+                )
+                break
+
+            if plan is None:
+                report, succeeded = self._plan_error_report(errors), False
+            else:
+                self._budget.consume(len(plan.steps))
+                executor = DAGExecutor(plan)
+                started = time.perf_counter()
+                await executor.arun(self._arun_plan_step)
+                self.metrics.record_tool_wait(elapsed_ms(started))
+                report, succeeded = self._plan_report(executor), executor.succeeded
+
+            self._messages.append({"role": "assistant", "content": response.content})
+            self._messages.append(
+                {"role": "user", "content": self._plan_results(response, report, succeeded)}
+            )
+
+            failed_rounds += not succeeded
+            if failed_rounds > self.settings.agent_plan_max_replans:
+                response = await self._aget_response()
+                break
+            response = await self._arequest_plan(force=False)
+
+        if final_response is None:
+            final_response = await self._aprocess_response(response)
+
+        await asyncio.to_thread(self._finish_turn, final_response)
+        return final_response
+
+    async def _arequest_plan(self, force: bool) -> Any:
+        """Ask Claude for a plan (or a final answer when not forced)."""
+        request = self._build_plan_request(force)
+        started = time.perf_counter()
+        response = await self._client.messages.create(**request)
+        self._record_usage(response, elapsed_ms(started))
+        return response
+
+    async def _arun_plan_step(self, step: PlanStep, tool_input: dict[str, Any]) -> Any:
+        """Execute one plan step within the concurrency limit."""
+        async with self._tool_semaphore:
+            self._report_progress("executing_tool", {"tool": step.tool, "id": step.id})
+            result = await self._aexecute_tool(step.tool, tool_input, step.id)
+        self._report_plan_step(step, result)
+        return result
+
+    def _dispatch_tool_call(self, tool_call: Any) -> None:
+        """Start a tool call as a task ahead of the response ending."""
+        logger.info("tool_dispatched_early", tool=tool_call.name, id=tool_call.id)
+        self._dispatched[tool_call.id] = asyncio.ensure_future(self._arun_bounded(tool_call))
+
+    async def _adiscard_dispatched(self) -> None:
+        """Wait for early-dispatched calls the model did not wait on."""
+        for tool_use_id, task in self._dispatched.items():
+            await task
+            logger.warning("dispatched_tool_result_discarded", id=tool_use_id)
+        self._dispatched.clear()
+
+    async def _aabandon_dispatched(self) -> None:
+        """
+        Cancel early-dispatched calls of a response that failed to arrive.
+
+        Cancellation reaches a running call at its next await; the calls
+        are waited for until they have all stopped.
+        """
+        tasks = list(self._dispatched.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for tool_use_id in self._dispatched:
+            logger.warning("dispatched_tool_call_abandoned", id=tool_use_id)
+        self._dispatched.clear()
+
+    async def _aexecute_tool_calls(self, tool_calls: list[Any]) -> list[dict[str, Any]]:
+        """
+        Execute the tool calls of a single model turn.
+
+        Calls run concurrently, bounded by the configured concurrency limit,
+        when parallel tool calls are enabled, and calls dispatched early
+        while streaming are awaited rather than re-run. Results are
+        returned in the order the calls appear in the response.
+
+        Args:
+            tool_calls: tool_use blocks from the response
+
+        Returns:
+            List of tool_result content blocks
+        """
+        tasks = [self._dispatched.pop(tool_call.id, None) for tool_call in tool_calls]
+
+        if not self.settings.agent_parallel_tool_calls and not any(tasks):
+            return [await self._arun_tool_call(tool_call) for tool_call in tool_calls]
+
+        pending = [
+            task or asyncio.ensure_future(self._arun_bounded(tool_call))
+            for task, tool_call in zip(tasks, tool_calls, strict=True)
+        ]
+        return list(await asyncio.gather(*pending))
+
+    async def _arun_bounded(self, tool_call: Any) -> dict[str, Any]:
+        """Run a tool call within the concurrency limit."""
+        async with self._tool_semaphore:
+            return await self._arun_tool_call(tool_call)
+
+    async def _arun_tool_call(self, tool_call: Any) -> dict[str, Any]:
+        """
+        Execute a single tool_use block and build its tool_result block.
+
+        Args:
+            tool_call: tool_use block from the response
+
+        Returns:
+            tool_result content block
+        """
+        self._report_progress(
+            "executing_tool",
+            {"tool": tool_call.name, "id": tool_call.id},
+        )
+
+        result = await self._aexecute_tool(tool_call.name, tool_call.input, tool_call.id)
+        return self._complete_tool_call(tool_call, result)
+
+    async def _aexecute_tool(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        call_id: str | None = None,
+    ) -> Any:
+        """
+        Execute a tool by name.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Tool input parameters
+            call_id: tool_use or plan step id, for progress events
+
+        Returns:
+            ToolResult from execution
+        """
+        logger.info("executing_tool", tool=tool_name, input_keys=list(tool_input.keys()))
+
+        # A tool call may not outlive the turn's wall-clock budget
+        turn_seconds = self._budget.remaining_seconds
+        with (
+            deadline_scope(turn_seconds),
+            progress_scope(self._tool_progress(tool_name, call_id)),
+        ):
+            result = await self.tools.aexecute(tool_name, **tool_input)
+        result = self._note_turn_cap(tool_name, tool_input, turn_seconds, result)
+
+        logger.info(
+            "tool_executed",
+            tool=tool_name,
+            success=result.is_success,
+            duration_ms=result.duration_ms,
+        )
+
+        return result
@@ -0,0 +1,87 @@
+"""
+Turn Budgets.
+
+Hard limits on the tool-use loop of a single chat turn, so a model that
+keeps requesting tools cannot run unbounded against GitHub and Digital Ocean.
+"""
+
+import time
+from typing import Any
+
+
+class TurnBudget:
+    """
+    Iteration, tool-call and wall-clock budget for one chat turn.
+
+    The clock starts when the budget is created.
+    """
+
+    def __init__(
+        self,
+        max_iterations: int,
+        max_tool_calls: int,
+        max_wall_clock_seconds: float,
+    ) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            max_iterations: Maximum tool-use loop iterations
+            max_tool_calls: Maximum tool calls executed
+            max_wall_clock_seconds: Maximum elapsed time for the turn
+        """
+        self.max_iterations = max_iterations
+        self.max_tool_calls = max_tool_calls
+        self.max_wall_clock_seconds = max_wall_clock_seconds
+        self.iterations = 0
+        self.tool_calls = 0
+        self._started = time.monotonic()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the turn started."""
+        return time.monotonic() - self._started
+
+    @property
+    def remaining_seconds(self) -> float:
+        """Wall-clock seconds left in the turn."""
+        return max(0.0, self.max_wall_clock_seconds - self.elapsed_seconds)
+
+    def check(self, pending_tool_calls: int = 0) -> str | None:
+        """
+        Check whether another iteration fits in the budget.
+
+        Args:
+            pending_tool_calls: Tool calls the next iteration would execute
+
+        Returns:
+            Description of the exhausted limit, or None if within budget
+        """
+        if self.elapsed_seconds >= self.max_wall_clock_seconds:
+            return f"wall-clock limit of {self.max_wall_clock_seconds:g}s reached"
+        if pending_tool_calls and self.iterations >= self.max_iterations:
+            return f"iteration limit of {self.max_iterations} reached"
+        if pending_tool_calls and self.tool_calls + pending_tool_calls > self.max_tool_calls:
+            return f"tool-call limit of {self.max_tool_calls} reached"
+        return None
+
+    def consume(self, tool_calls: int) -> None:
+        """
+        Record an executed iteration.
+
+        Args:
+            tool_calls: Number of tool calls executed in the iteration
+        """
+        self.iterations += 1
+        self.tool_calls += tool_calls
+
+    def to_dict(self) -> dict[str, Any]:
+        """Usage and limits for audit records."""
+        return {
+            "iterations": self.iterations,
+            "max_iterations": self.max_iterations,
+            "tool_calls": self.tool_calls,
+            "max_tool_calls": self.max_tool_calls,
+            "elapsed_seconds": round(self.elapsed_seconds, 1),
+            "max_wall_clock_seconds": self.max_wall_clock_seconds,
+        }
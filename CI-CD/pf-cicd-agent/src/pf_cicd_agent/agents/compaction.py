@@ -0,0 +1,248 @@
+"""
+History Compaction.
+
+Keeps the orchestrator's message history within an input-token budget
+while preserving valid tool_use/tool_result pairing.
+"""
+
+import json
+from typing import Any
+
+import structlog
+
+
+logger = structlog.get_logger(__name__)
+
+# Rough characters-per-token ratio used for budget estimates
+CHARS_PER_TOKEN = 4
+
+SUMMARY_HEADER = "[Summary of earlier conversation]"
+
+
+class HistoryCompactor:
+    """
+    Compacts conversation history to fit an input-token budget.
+
+    A turn starts at a plain-text user message and includes every
+    assistant/tool_result exchange that follows it. Compaction is applied
+    in three stages, stopping as soon as the history fits the budget:
+
+    1. Tool results and tool inputs in turns older than the most recent
+       ``keep_turns`` are truncated.
+    2. The oldest turns are elided entirely and replaced with a short
+       textual summary prepended to the first remaining user message.
+    3. Tool results and tool inputs of earlier exchanges within the recent
+       turns, including the one in progress, are truncated. The latest
+       exchange is kept whole, since the model has yet to act on it.
+
+    Whole turns are always kept or dropped together, so every tool_use
+    block keeps its matching tool_result.
+    """
+
+    def __init__(
+        self,
+        token_budget: int,
+        keep_turns: int = 2,
+        stale_content_chars: int = 500,
+        max_summary_lines: int = 40,
+    ) -> None:
+        """
+        Initialize the compactor.
+
+        Args:
+            token_budget: Target maximum input tokens for the history
+            keep_turns: Number of most recent turns never compacted
+            stale_content_chars: Maximum characters kept per stale tool result/input
+            max_summary_lines: Maximum lines kept in the elided-turn summary
+        """
+        self.token_budget = token_budget
+        self.keep_turns = max(1, keep_turns)
+        self.stale_content_chars = stale_content_chars
+        self.max_summary_lines = max_summary_lines
+
+    def compact(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Compact messages to fit the token budget.
+
+        Returns the input list unchanged when it already fits, so cached
+        prompt prefixes are not invalidated needlessly.
+
+        Args:
+            messages: Conversation history in Anthropic message format
+
+        Returns:
+            Compacted message list
+        """
+        before = self.estimate_tokens(messages)
+        if before <= self.token_budget:
+            return messages
+
+        turns = self._split_turns(messages)
+
+        # Stage 1: truncate stale tool payloads
+        stale = max(0, len(turns) - self.keep_turns)
+        turns = [self._truncate_turn(turn) for turn in turns[:stale]] + turns[stale:]
+        compacted = [message for turn in turns for message in turn]
+
+        # Stage 2: elide the oldest turns
+        summary: list[str] = []
+        elided = 0
+        while len(turns) > self.keep_turns and self.estimate_tokens(compacted) > self.token_budget:
+            elided += 1
+            summary.extend(self._summarize_turn(turns.pop(0)))
+            summary = summary[-self.max_summary_lines :]
+            compacted = self._with_summary(turns, summary)
+
+        # Stage 3: truncate earlier exchanges of the recent turns
+        if self.estimate_tokens(compacted) > self.token_budget:
+            latest = self._latest_exchange(compacted)
+            compacted = self._truncate_turn(compacted[:latest]) + compacted[latest:]
+
+        logger.info(
+            "history_compacted",
+            messages_before=len(messages),
+            messages_after=len(compacted),
+            tokens_before=before,
+            tokens_after=self.estimate_tokens(compacted),
+            elided_turns=elided,
+        )
+        return compacted
+
+    @classmethod
+    def estimate_tokens(cls, messages: list[dict[str, Any]]) -> int:
+        """
+        Estimate the input tokens used by a list of messages.
+
+        Args:
+            messages: Messages to measure
+
+        Returns:
+            Approximate token count
+        """
+        size = 0
+        for message in messages:
+            content = message["content"]
+            if isinstance(content, str):
+                size += len(content)
+            else:
+                size += sum(len(json.dumps(_block_to_dict(b), default=str)) for b in content)
+        return size // CHARS_PER_TOKEN
+
+    @staticmethod
+    def _split_turns(messages: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Group messages into turns that start at a plain-text user message."""
+        turns: list[list[dict[str, Any]]] = []
+        for message in messages:
+            starts_turn = message["role"] == "user" and isinstance(message["content"], str)
+            if starts_turn or not turns:
+                turns.append([])
+            turns[-1].append(message)
+        return turns
+
+    @staticmethod
+    def _latest_exchange(messages: list[dict[str, Any]]) -> int:
+        """Index of the last assistant message, where the latest exchange starts."""
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index]["role"] == "assistant":
+                return index
+        return len(messages)
+
+    def _truncate_turn(self, turn: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Truncate tool results and tool inputs within a turn (or any run of messages)."""
+        truncated = []
+        for message in turn:
+            content = message["content"]
+            if isinstance(content, str):
+                truncated.append(message)
+                continue
+            blocks = [self._truncate_block(_block_to_dict(block)) for block in content]
+            truncated.append({**message, "content": blocks})
+        return truncated
+
+    def _truncate_block(self, block: dict[str, Any]) -> dict[str, Any]:
+        """Truncate the payload of a single content block."""
+        if block.get("type") == "tool_result" and isinstance(block.get("content"), str):
+            return {**block, "content": self._truncate_text(block["content"])}
+        if block.get("type") == "tool_use" and isinstance(block.get("input"), dict):
+            return {
+                **block,
+                "input": {
+                    key: self._truncate_text(value) if isinstance(value, str) else value
+                    for key, value in block["input"].items()
+                },
+            }
+        return block
+
+    def _truncate_text(self, text: str) -> str:
+        """Truncate text to the stale content limit."""
+        if len(text) <= self.stale_content_chars:
+            return text
+        elided = len(text) - self.stale_content_chars
+        return f"{text[: self.stale_content_chars]}... [{elided} chars elided]"
+
+    def _summarize_turn(self, turn: list[dict[str, Any]]) -> list[str]:
+        """Build summary lines for a turn that is being elided."""
+        lines: list[str] = []
+        calls: dict[str, str] = {}
+        outcomes: dict[str, str] = {}
+        reply = ""
+
+        for message in turn:
+            content = message["content"]
+            if message["role"] == "user" and isinstance(content, str):
+                earlier, request = _split_summary(content)
+                lines.extend(earlier)
+                lines.append(f"- User: {_preview(request)}")
+            elif message["role"] == "assistant" and isinstance(content, str):
+                reply = content
+            elif not isinstance(content, str):
+                for block in map(_block_to_dict, content):
+                    if block.get("type") == "tool_use":
+                        calls[block["id"]] = block["name"]
+                    elif block.get("type") == "tool_result":
+                        outcomes[block["tool_use_id"]] = "error" if block.get("is_error") else "ok"
+
+        if calls:
+            tools = ", ".join(
+                f"{name} ({outcomes.get(call_id, 'no result')})" for call_id, name in calls.items()
+            )
+            lines.append(f"  Tools: {tools}")
+        if reply:
+            lines.append(f"  Agent: {_preview(reply)}")
+        return lines
+
+    @staticmethod
+    def _with_summary(
+        turns: list[list[dict[str, Any]]], summary: list[str]
+    ) -> list[dict[str, Any]]:
+        """Flatten turns, prefixing the first user message with the summary."""
+        first, *rest = turns
+        _, request = _split_summary(first[0]["content"])
+        header = "\n".join([SUMMARY_HEADER, *summary])
+        opening = {**first[0], "content": f"{header}\n\n{request}"}
+        return [opening, *first[1:], *(message for turn in rest for message in turn)]
+
+
+def _block_to_dict(block: Any) -> dict[str, Any]:
+    """Convert an API content block (dict or SDK object) to a plain dict."""
+    if isinstance(block, dict):
+        return block
+    if block.type == "tool_use":
+        return {"type": "tool_use", "id": block.id, "name": block.name, "input": block.input}
+    if block.type == "text":
+        return {"type": "text", "text": block.text}
+    return block.model_dump(exclude_none=True)
+
+
+def _split_summary(text: str) -> tuple[list[str], str]:
+    """Split a user message into any existing summary lines and the request."""
+    if not text.startswith(SUMMARY_HEADER):
+        return [], text
+    header, _, request = text.partition("\n\n")
+    return header.splitlines()[1:], request
+
+
+def _preview(text: str, limit: int = 120) -> str:
+    """Single-line preview of text."""
+    flat = " ".join(text.split())
+    return flat if len(flat) <= limit else f"{flat[:limit]}..."
@@ -0,0 +1,247 @@
+"""
+Session Metrics.
+
+Per-turn latency, token and cost accounting for orchestrator sessions.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+# USD per million tokens (input, output), matched by longest model prefix.
+# Cache writes cost 1.25x the input price and cache reads 0.1x.
+MODEL_PRICING: dict[str, tuple[float, float]] = {
+    "claude-opus-4-5": (5.0, 25.0),
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-haiku-4-5": (1.0, 5.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+}
+
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+
+def get_pricing(model: str) -> tuple[float, float] | None:
+    """
+    Get per-million-token pricing for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        (input, output) USD per million tokens, or None if unknown
+    """
+    for prefix in sorted(MODEL_PRICING, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_PRICING[prefix]
+    return None
+
+
+def elapsed_ms(started: float) -> float:
+    """
+    Milliseconds elapsed since a perf_counter() reading.
+
+    Args:
+        started: Earlier time.perf_counter() value
+
+    Returns:
+        Elapsed milliseconds
+    """
+    return (time.perf_counter() - started) * 1000
+
+
+class TurnMetrics(BaseModel):
+    """Metrics for a single chat turn (one user message and its tool loop)."""
+
+    turn: int
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    llm_calls: int = 0
+    llm_latency_ms: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    tool_calls: int = 0
+    tool_time_ms: float = Field(default=0.0, description="Sum of individual tool run times")
+    tool_wait_ms: float = Field(default=0.0, description="Time the loop was blocked on tools")
+    audit_ms: float = 0.0
+    total_ms: float = 0.0
+    cost_usd: float | None = None
+
+    @property
+    def bottleneck(self) -> str:
+        """Name the component that dominated this turn's latency."""
+        components = {
+            "model": self.llm_latency_ms,
+            "provider": self.tool_wait_ms,
+            "audit": self.audit_ms,
+        }
+        return max(components, key=components.__getitem__)
+
+
+class SessionMetrics:
+    """
+    Collects TurnMetrics for a session.
+
+    Tool timings are recorded from worker threads, so updates are locked.
+    """
+
+    def __init__(self, model: str) -> None:
+        """
+        Initialize the collector.
+
+        Args:
+            model: Model name used for cost estimates
+        """
+        self.model = model
+        self.turns: list[TurnMetrics] = []
+        self._current: TurnMetrics | None = None
+        self._turn_started = 0.0
+        self._audit_started = 0.0
+        self._lock = threading.Lock()
+
+    def start_turn(self, audit_ms: float) -> None:
+        """
+        Start measuring a new turn.
+
+        Args:
+            audit_ms: Audit service overhead so far
+        """
+        self._current = TurnMetrics(turn=len(self.turns) + 1)
+        self._turn_started = time.perf_counter()
+        self._audit_started = audit_ms
+
+    def record_llm_call(self, latency_ms: float, usage: Any) -> None:
+        """
+        Record a model request.
+
+        Args:
+            latency_ms: Request latency in milliseconds
+            usage: Usage object from the API response (may be None)
+        """
+        if self._current is None:
+            return
+
+        turn = self._current
+        turn.llm_calls += 1
+        turn.llm_latency_ms += latency_ms
+        if usage is not None:
+            turn.input_tokens += getattr(usage, "input_tokens", None) or 0
+            turn.output_tokens += getattr(usage, "output_tokens", None) or 0
+            turn.cache_read_input_tokens += getattr(usage, "cache_read_input_tokens", None) or 0
+            turn.cache_creation_input_tokens += (
+                getattr(usage, "cache_creation_input_tokens", None) or 0
+            )
+
+    def record_tool_call(self, duration_ms: float) -> None:
+        """
+        Record a finished tool call.
+
+        Args:
+            duration_ms: Tool run time in milliseconds
+        """
+        with self._lock:
+            if self._current is not None:
+                self._current.tool_calls += 1
+                self._current.tool_time_ms += duration_ms
+
+    def record_tool_wait(self, wait_ms: float) -> None:
+        """
+        Record time the agent loop spent blocked on tool results.
+
+        Args:
+            wait_ms: Blocked time in milliseconds
+        """
+        if self._current is not None:
+            self._current.tool_wait_ms += wait_ms
+
+    def end_turn(self, audit_ms: float) -> TurnMetrics | None:
+        """
+        Finish the current turn.
+
+        Args:
+            audit_ms: Audit service overhead so far
+
+        Returns:
+            The completed TurnMetrics, or None if no turn was started
+        """
+        turn = self._current
+        if turn is None:
+            return None
+
+        turn.total_ms = elapsed_ms(self._turn_started)
+        turn.audit_ms = audit_ms - self._audit_started
+        turn.cost_usd = self._cost(turn)
+        self.turns.append(turn)
+        self._current = None
+        return turn
+
+    def _cost(self, turn: TurnMetrics) -> float | None:
+        """Estimate the USD cost of a turn."""
+        pricing = get_pricing(self.model)
+        if pricing is None:
+            return None
+
+        input_price, output_price = pricing
+        cost = (
+            turn.input_tokens * input_price
+            + turn.cache_creation_input_tokens * input_price * CACHE_WRITE_MULTIPLIER
+            + turn.cache_read_input_tokens * input_price * CACHE_READ_MULTIPLIER
+            + turn.output_tokens * output_price
+        )
+        return cost / 1_000_000
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Aggregate metrics across all completed turns.
+
+        Returns:
+            Summary dict with totals and per-turn breakdown
+        """
+        totals: dict[str, Any] = {
+            "turns": len(self.turns),
+            "llm_calls": sum(t.llm_calls for t in self.turns),
+            "llm_latency_ms": round(sum(t.llm_latency_ms for t in self.turns)),
+            "input_tokens": sum(t.input_tokens for t in self.turns),
+            "output_tokens": sum(t.output_tokens for t in self.turns),
+            "cache_read_input_tokens": sum(t.cache_read_input_tokens for t in self.turns),
+            "cache_creation_input_tokens": sum(t.cache_creation_input_tokens for t in self.turns),
+            "tool_calls": sum(t.tool_calls for t in self.turns),
+            "tool_time_ms": round(sum(t.tool_time_ms for t in self.turns)),
+            "tool_wait_ms": round(sum(t.tool_wait_ms for t in self.turns)),
+            "audit_ms": round(sum(t.audit_ms for t in self.turns)),
+            "total_ms": round(sum(t.total_ms for t in self.turns)),
+        }
+
+        prompt_tokens = (
+            totals["input_tokens"]
+            + totals["cache_read_input_tokens"]
+            + totals["cache_creation_input_tokens"]
+        )
+        totals["cache_hit_rate"] = (
+            totals["cache_read_input_tokens"] / prompt_tokens if prompt_tokens else 0
+        )
+
+        # Unknown if any turn used a model without a known price
+        costs = [t.cost_usd for t in self.turns if t.cost_usd is not None]
+        totals["cost_usd"] = (
+            round(sum(costs), 6) if costs and len(costs) == len(self.turns) else None
+        )
+
+        components = {
+            "model": totals["llm_latency_ms"],
+            "provider": totals["tool_wait_ms"],
+            "audit": totals["audit_ms"],
+        }
+        totals["bottleneck"] = max(components, key=components.__getitem__) if self.turns else None
+        totals["per_turn"] = [
+            {**t.model_dump(mode="json"), "bottleneck": t.bottleneck} for t in self.turns
+        ]
+        return totals
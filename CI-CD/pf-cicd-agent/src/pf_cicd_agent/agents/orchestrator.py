@@ -4,25 +4,49 @@ CI/CD Orchestrator Agent.
 Implements WBS-2.4.2 & WBS-2.4.4: Primary orchestrator agent with tool integration.
 """
 
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, Callable
 from uuid import uuid4
 
 import structlog
 from anthropic import Anthropic
 
+from pf_cicd_agent.agents.budget import TurnBudget
+from pf_cicd_agent.agents.compaction import HistoryCompactor
+from pf_cicd_agent.agents.metrics import SessionMetrics, elapsed_ms
+from pf_cicd_agent.agents.planner import (
+    PLAN_TOOL,
+    PLAN_TOOL_NAME,
+    DAGExecutor,
+    ExecutionPlan,
+    PlanStep,
+)
 from pf_cicd_agent.agents.system_prompt import SYSTEM_PROMPT
 from pf_cicd_agent.audit.service import AuditService
-from pf_cicd_agent.audit.models import AuditEventCreate, AuditEventType
+from pf_cicd_agent.audit.models import AuditEventCreate, AuditEventType, AuditSeverity
 from pf_cicd_agent.config.settings import Settings, get_settings
+from pf_cicd_agent.tools.artifacts import ArtifactStore, FetchArtifactTool
+from pf_cicd_agent.tools.cache import ResultCache
+from pf_cicd_agent.tools.circuit_breaker import CircuitBreakerBoard
+from pf_cicd_agent.tools.deadline import deadline_scope
+from pf_cicd_agent.tools.progress import ProgressSink, progress_scope
+from pf_cicd_agent.tools.rate_limit import RateLimitScheduler
 from pf_cicd_agent.tools.registry import ToolRegistry
+from pf_cicd_agent.tools.retry import RetryPolicy
+from pf_cicd_agent.tools.serialization import ToolResultSerializer
 from pf_cicd_agent.tools.github import (
+    GitHubClient,
     CreateRepoTool,
     BranchProtectionTool,
     CreateEnvironmentTool,
     SetSecretTool,
+    SetSecretsTool,
     CreateWorkflowTool,
+    CheckReposTool,
 )
 from pf_cicd_agent.tools.digitalocean import (
+    DOClient,
     CreateDropletTool,
     ConfigureFirewallTool,
     BootstrapDropletTool,
@@ -32,6 +56,9 @@ from pf_cicd_agent.tools.digitalocean import (
 
 logger = structlog.get_logger(__name__)
 
+# Prompt cache breakpoint marker
+CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
 
 class CICDOrchestrator:
     """
@@ -62,14 +89,52 @@ class CICDOrchestrator:
         self.progress_callback = progress_callback
 
         # Initialize Anthropic client
-        self._client = Anthropic(api_key=self.settings.anthropic_api_key.get_secret_value())
+        self._client = self._create_client()
+
+        # Provider clients shared by the tools of the default registry; an
+        # injected registry brings its own tools, so none are created for it
+        self.rate_limits = RateLimitScheduler.from_settings(self.settings)
+        self.github_client: GitHubClient | None = None
+        self.do_client: DOClient | None = None
 
         # Initialize tool registry
-        self.tools = tool_registry or self._create_tool_registry()
+        self.tools = tool_registry if tool_registry is not None else self._create_tool_registry()
+
+        # Large tool outputs are kept out of the conversation as artifacts
+        self.artifacts = ArtifactStore(
+            directory=self.settings.agent_artifact_dir,
+            max_chars=self.settings.agent_artifact_max_chars,
+        )
+        self._serializer = ToolResultSerializer(
+            store=self.artifacts,
+            max_field_chars=self.settings.agent_tool_result_field_chars,
+            max_result_chars=self.settings.agent_tool_result_max_chars,
+        )
+        self.tools.register_instance(
+            FetchArtifactTool(
+                store=self.artifacts,
+                audit_service=self.audit_service,
+                page_size=self.settings.agent_tool_result_field_chars,
+            )
+        )
 
         # Conversation state
         self._messages: list[dict[str, Any]] = []
         self._session_id = uuid4()
+        self.metrics = SessionMetrics(model=self.settings.agent_model)
+        self._compactor = HistoryCompactor(
+            token_budget=self.settings.agent_history_token_budget,
+            keep_turns=self.settings.agent_history_keep_turns,
+            stale_content_chars=self.settings.agent_history_stale_content_chars,
+        )
+
+        # Tool execution state
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.settings.agent_max_concurrent_tools,
+            thread_name_prefix="pf-cicd-tool",
+        )
+        self._dispatched: dict[str, Any] = {}
+        self._budget = self._new_budget()
 
         logger.info(
             "orchestrator_initialized",
@@ -77,30 +142,101 @@ class CICDOrchestrator:
             tool_count=len(self.tools),
         )
 
+    def _create_client(self) -> Any:
+        """Create the Anthropic API client."""
+        return Anthropic(api_key=self.settings.anthropic_api_key.get_secret_value())
+
     def _create_tool_registry(self) -> ToolRegistry:
         """Create and populate the tool registry."""
-        registry = ToolRegistry(audit_service=self.audit_service)
+        result_cache = None
+        if self.settings.tool_cache_enabled:
+            result_cache = ResultCache(
+                max_entries=self.settings.tool_cache_max_entries,
+                default_ttl=self.settings.tool_cache_ttl_seconds,
+            )
+
+        circuit_breakers = None
+        if self.settings.tool_circuit_breaker_enabled:
+            circuit_breakers = CircuitBreakerBoard(
+                failure_threshold=self.settings.tool_circuit_failure_threshold,
+                reset_timeout=self.settings.tool_circuit_reset_seconds,
+                audit_service=self.audit_service,
+            )
+
+        registry = ToolRegistry(
+            audit_service=self.audit_service,
+            retry_policy=RetryPolicy.from_settings(self.settings),
+            result_cache=result_cache,
+            default_timeout=self.settings.tool_timeout_seconds,
+            circuit_breakers=circuit_breakers,
+        )
+
+        # Tools are built on first use and share one pooled client per
+        # provider (connections are opened lazily, and requests are paced
+        # against each provider's rate limit)
+        self.github_client = GitHubClient(
+            settings=self.settings,
+            rate_limiter=self.rate_limits.for_provider("github"),
+        )
+        self.do_client = DOClient(
+            settings=self.settings,
+            rate_limiter=self.rate_limits.for_provider("digitalocean"),
+        )
+        github = {"settings": self.settings, "github_client": self.github_client}
+        do = {"settings": self.settings, "do_client": self.do_client}
 
         # Register GitHub tools
-        registry.register(CreateRepoTool)
-        registry.register(BranchProtectionTool)
-        registry.register(CreateEnvironmentTool)
-        registry.register(SetSecretTool)
-        registry.register(CreateWorkflowTool)
+        registry.register(CreateRepoTool, **github)
+        registry.register(BranchProtectionTool, **github)
+        registry.register(CreateEnvironmentTool, **github)
+        registry.register(SetSecretTool, **github)
+        registry.register(SetSecretsTool, **github)
+        registry.register(CreateWorkflowTool, **github)
+        registry.register(CheckReposTool, **github)
 
         # Register Digital Ocean tools
-        registry.register(CreateDropletTool)
-        registry.register(ConfigureFirewallTool)
-        registry.register(BootstrapDropletTool)
-        registry.register(CreateDNSRecordTool)
+        registry.register(CreateDropletTool, **do)
+        registry.register(ConfigureFirewallTool, **do)
+        registry.register(BootstrapDropletTool, **do)
+        registry.register(CreateDNSRecordTool, **do)
 
         return registry
 
+    def _new_budget(self) -> TurnBudget:
+        """Create the tool-use loop budget for a chat turn."""
+        return TurnBudget(
+            max_iterations=self.settings.agent_max_iterations,
+            max_tool_calls=self.settings.agent_max_tool_calls,
+            max_wall_clock_seconds=self.settings.agent_max_turn_seconds,
+        )
+
     def _report_progress(self, status: str, data: dict[str, Any] | None = None) -> None:
         """Report progress to callback if set."""
         if self.progress_callback:
             self.progress_callback(status, data or {})
 
+    def _tool_progress(self, tool_name: str, call_id: str | None) -> ProgressSink | None:
+        """
+        Build the sink forwarding a tool call's progress events to the callback.
+
+        Args:
+            tool_name: Name of the tool
+            call_id: tool_use or plan step id
+
+        Returns:
+            Progress sink, or None without a progress callback
+        """
+        if not self.progress_callback:
+            return None
+
+        def sink(event: str, data: dict[str, Any]) -> None:
+            self._report_progress(
+                "tool_progress",
+                {"tool": tool_name, "id": call_id, "event": event, **data},
+            )
+
+        return sink
+
     def start_session(self) -> str:
         """
         Start a new agent session.
@@ -110,6 +246,9 @@ class CICDOrchestrator:
         """
         self._session_id = uuid4()
         self._messages = []
+        self.metrics = SessionMetrics(model=self.settings.agent_model)
+        if self.tools.result_cache:
+            self.tools.result_cache.clear()
         self.audit_service.start_session()
 
         self.audit_service.log_event(
@@ -132,6 +271,18 @@ class CICDOrchestrator:
             Session summary
         """
         summary = self.audit_service.get_session_summary()
+        summary["metrics"] = self.metrics.summary()
+        if self.tools.result_cache:
+            summary["tool_cache"] = self.tools.result_cache.stats()
+        if self.tools.circuit_breakers:
+            summary["circuits"] = self.tools.circuit_breakers.status()
+        summary["rate_limits"] = self.rate_limits.status()
+        if self.github_client is not None:
+            summary["github_objects"] = self.github_client.object_cache_stats()
+            if self.github_client.http_cache:
+                summary["github_http_cache"] = self.github_client.http_cache.stats()
+        summary["resource_locks"] = self.tools.resource_locks.stats()
+        summary["artifacts_deleted"] = self.artifacts.clear()
         self.audit_service.end_session(success=True, summary=summary)
 
         logger.info("session_ended", session_id=str(self._session_id), summary=summary)
@@ -147,6 +298,22 @@ class CICDOrchestrator:
         Returns:
             Agent's response text
         """
+        self._record_user_message(user_message)
+
+        # Get response from Claude
+        response = self._get_response()
+
+        # Process the response (may involve tool calls)
+        final_response = self._process_response(response)
+
+        self._finish_turn(final_response)
+        return final_response
+
+    def _record_user_message(self, user_message: str) -> None:
+        """Start a turn: add the user message to history, audit it and report progress."""
+        self.metrics.start_turn(audit_ms=self.audit_service.overhead_ms)
+        self._budget = self._new_budget()
+
         # Add user message to history
         self._messages.append({"role": "user", "content": user_message})
 
@@ -162,31 +329,209 @@ class CICDOrchestrator:
 
         self._report_progress("processing", {"message": "Processing your request..."})
 
-        # Get response from Claude
-        response = self._get_response()
-
-        # Process the response (may involve tool calls)
-        final_response = self._process_response(response)
-
+    def _finish_turn(self, final_response: str) -> None:
+        """End a turn: add the reply to history and record the turn's metrics."""
         # Add assistant response to history
         self._messages.append({"role": "assistant", "content": final_response})
 
-        return final_response
+        turn = self.metrics.end_turn(audit_ms=self.audit_service.overhead_ms)
+        if turn is None:
+            return
+
+        self.audit_service.log_event(
+            AuditEventCreate(
+                event_type=AuditEventType.AGENT_TURN,
+                action="chat.turn",
+                description=f"Turn {turn.turn} completed",
+                metadata={"metrics": turn.model_dump(mode="json"), "bottleneck": turn.bottleneck},
+            )
+        )
+        logger.info(
+            "turn_metrics",
+            session_id=str(self._session_id),
+            turn=turn.turn,
+            total_ms=round(turn.total_ms),
+            llm_latency_ms=round(turn.llm_latency_ms),
+            tool_wait_ms=round(turn.tool_wait_ms),
+            audit_ms=round(turn.audit_ms),
+            bottleneck=turn.bottleneck,
+        )
 
     def _get_response(self) -> Any:
         """Get a response from Claude."""
-        return self._client.messages.create(
-            model=self.settings.agent_model,
-            max_tokens=self.settings.agent_max_tokens,
-            system=SYSTEM_PROMPT,
-            tools=self.tools.get_definitions(),
-            messages=self._messages,
+        self._compact_history()
+        started = time.perf_counter()
+        if self.settings.agent_stream_responses:
+            response = self._stream_response()
+        else:
+            response = self._client.messages.create(**self._build_request())
+
+        self._record_usage(response, elapsed_ms(started))
+        return response
+
+    def _compact_history(self) -> None:
+        """Compact the conversation history if it exceeds the token budget."""
+        if not self.settings.agent_history_compaction:
+            return
+
+        self._messages = self._compactor.compact(self._messages)
+
+    def _build_request(self) -> dict[str, Any]:
+        """
+        Build the keyword arguments for a messages.create call.
+
+        With prompt caching enabled, cache breakpoints are placed on the
+        tool list, the system prompt and the end of the conversation so
+        each loop iteration only pays full price for the new suffix.
+        """
+        system: Any = SYSTEM_PROMPT
+        tools = self.tools.get_definitions()
+        messages = self._messages
+
+        if self.settings.agent_prompt_caching:
+            system = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": CACHE_CONTROL}]
+            if tools:
+                tools[-1] = {**tools[-1], "cache_control": CACHE_CONTROL}
+            messages = self._with_message_breakpoint(messages)
+
+        return {
+            "model": self.settings.agent_model,
+            "max_tokens": self.settings.agent_max_tokens,
+            "system": system,
+            "tools": tools,
+            "messages": messages,
+        }
+
+    @staticmethod
+    def _with_message_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Return messages with a cache breakpoint on the final content block.
+
+        The stored history is left untouched; only the last message is
+        copied.
+        """
+        if not messages:
+            return messages
+
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            blocks: list[Any] = [{"type": "text", "text": content}]
+        else:
+            blocks = list(content)
+
+        if not blocks or not isinstance(blocks[-1], dict):
+            return messages
+
+        blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+        return [*messages[:-1], {**last, "content": blocks}]
+
+    def _record_usage(self, response: Any, latency_ms: float) -> None:
+        """
+        Record latency and token usage for a model response.
+
+        Args:
+            response: Claude API response
+            latency_ms: Request latency in milliseconds
+        """
+        usage = getattr(response, "usage", None)
+        self.metrics.record_llm_call(latency_ms, usage)
+        if usage is None:
+            return
+
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        uncached = getattr(usage, "input_tokens", None) or 0
+
+        logger.info(
+            "llm_usage",
+            latency_ms=round(latency_ms),
+            cache_hit=cache_read > 0,
+            cache_read_input_tokens=cache_read,
+            cache_creation_input_tokens=cache_write,
+            input_tokens=uncached,
+            output_tokens=getattr(usage, "output_tokens", None) or 0,
         )
 
+    def _stream_response(self) -> Any:
+        """
+        Stream a response from Claude, reporting text deltas as they arrive.
+
+        Returns:
+            The final accumulated message
+        """
+        try:
+            with self._client.messages.stream(**self._build_request()) as stream:
+                for event in stream:
+                    self._handle_stream_event(event)
+                return stream.get_final_message()
+        except BaseException:
+            self._abandon_dispatched()
+            raise
+
+    def _handle_stream_event(self, event: Any) -> None:
+        """
+        Handle a single stream event.
+
+        Text deltas are reported as progress. When early dispatch is
+        enabled, a tool_use block is started as soon as it is complete
+        rather than after the whole response has been received.
+        """
+        if event.type == "text":
+            self._report_progress("text_delta", {"text": event.text})
+        elif (
+            event.type == "content_block_stop"
+            and event.content_block.type == "tool_use"
+            and self._early_dispatch_enabled
+            and self._budget.check(len(self._dispatched) + 1) is None
+        ):
+            self._dispatch_tool_call(event.content_block)
+
+    @property
+    def _early_dispatch_enabled(self) -> bool:
+        """Whether tool calls may start while the response is streaming."""
+        return (
+            self.settings.agent_early_tool_dispatch
+            and self.settings.agent_parallel_tool_calls
+        )
+
+    def _dispatch_tool_call(self, tool_call: Any) -> None:
+        """Start a tool call in the background ahead of the response ending."""
+        logger.info("tool_dispatched_early", tool=tool_call.name, id=tool_call.id)
+        self._dispatched[tool_call.id] = self._executor.submit(self._run_tool_call, tool_call)
+
+    def _discard_dispatched(self) -> None:
+        """
+        Wait for early-dispatched calls the model did not wait on.
+
+        This only happens when a response containing complete tool_use
+        blocks stops for another reason (e.g. max_tokens).
+        """
+        for tool_use_id, future in self._dispatched.items():
+            future.result()
+            logger.warning("dispatched_tool_result_discarded", id=tool_use_id)
+        self._dispatched.clear()
+
+    def _abandon_dispatched(self) -> None:
+        """
+        Drop early-dispatched calls of a response that failed to arrive.
+
+        Calls that have not started are cancelled; running ones cannot be
+        interrupted and are waited for, so they do not overlap a retry.
+        """
+        running = [future for future in self._dispatched.values() if not future.cancel()]
+        wait(running)
+        for tool_use_id in self._dispatched:
+            logger.warning("dispatched_tool_call_abandoned", id=tool_use_id)
+        self._dispatched.clear()
+
     def _process_response(self, response: Any) -> str:
         """
         Process Claude's response, handling tool calls if needed.
 
+        The loop stops early with a partial result when the turn's
+        iteration, tool-call or wall-clock budget is exhausted.
+
         Args:
             response: Claude API response
 
@@ -200,33 +545,17 @@ class CICDOrchestrator:
                 block for block in response.content if block.type == "tool_use"
             ]
 
-            # Execute each tool call
-            tool_results = []
-            for tool_call in tool_calls:
-                self._report_progress(
-                    "executing_tool",
-                    {"tool": tool_call.name, "id": tool_call.id},
-                )
-
-                result = self._execute_tool(tool_call.name, tool_call.input)
+            reason = self._budget.check(len(tool_calls))
+            if reason:
+                partial = self._stop_for_budget(reason, response, tool_calls)
+                self._discard_dispatched()
+                return partial
+            self._budget.consume(len(tool_calls))
 
-                tool_results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_call.id,
-                        "content": str(result.data) if result.is_success else result.error,
-                        "is_error": result.is_error,
-                    }
-                )
-
-                self._report_progress(
-                    "tool_complete",
-                    {
-                        "tool": tool_call.name,
-                        "success": result.is_success,
-                        "message": result.message,
-                    },
-                )
+            # Execute the tool calls (concurrently if enabled)
+            started = time.perf_counter()
+            tool_results = self._execute_tool_calls(tool_calls)
+            self.metrics.record_tool_wait(elapsed_ms(started))
 
             # Add assistant message with tool use and results
             self._messages.append(
@@ -236,27 +565,184 @@ class CICDOrchestrator:
                 {"role": "user", "content": tool_results}
             )
 
+            reason = self._budget.check()
+            if reason:
+                return self._stop_for_budget(reason)
+
             # Get next response
             response = self._get_response()
 
-        # Extract final text response
+        self._discard_dispatched()
+        return self._extract_text(response)
+
+    def _stop_for_budget(
+        self,
+        reason: str,
+        response: Any = None,
+        tool_calls: list[Any] | None = None,
+    ) -> str:
+        """
+        Audit an exhausted turn budget and build the partial result.
+
+        The unexecuted response is not added to history, so no tool_use
+        block is left without a matching tool_result.
+
+        Args:
+            reason: Description of the exhausted limit
+            response: Response whose tool calls will not be executed
+            tool_calls: tool_use blocks that will not be executed
+
+        Returns:
+            Partial response text
+        """
+        tool_calls = tool_calls or []
+        skipped = [call.name for call in tool_calls if call.id not in self._dispatched]
+        started = [call.name for call in tool_calls if call.id in self._dispatched]
+        budget = self._budget.to_dict()
+
+        self.audit_service.log_event(
+            AuditEventCreate(
+                event_type=AuditEventType.BUDGET_EXHAUSTED,
+                action="chat.budget_exhausted",
+                description=f"Tool-use loop stopped early: {reason}",
+                severity=AuditSeverity.WARNING,
+                metadata={
+                    "reason": reason,
+                    "budget": budget,
+                    "skipped_tools": skipped,
+                    "unreviewed_tools": started,
+                },
+            )
+        )
+        logger.warning(
+            "turn_budget_exhausted",
+            session_id=str(self._session_id),
+            reason=reason,
+            skipped_tools=skipped,
+            **budget,
+        )
+        self._report_progress("budget_exhausted", {"reason": reason, "skipped_tools": skipped})
+
+        note = f"[Stopped early: {reason}."
+        if skipped:
+            note += f" Requested tool calls not run: {', '.join(skipped)}."
+        if started:
+            note += f" Tool calls already started, results not reviewed: {', '.join(started)}."
+        if not tool_calls:
+            note += " The results of the last tool calls have not been reviewed."
+        note += " Send a follow-up message to continue.]"
+
+        preamble = self._extract_text(response) if response is not None else ""
+        return f"{preamble}\n\n{note}" if preamble else note
+
+    @staticmethod
+    def _extract_text(response: Any) -> str:
+        """Extract the text blocks of a response."""
         text_blocks = [block for block in response.content if hasattr(block, "text")]
         return "\n".join(block.text for block in text_blocks)
 
-    def _execute_tool(self, tool_name: str, tool_input: dict[str, Any]) -> Any:
+    def _execute_tool_calls(self, tool_calls: list[Any]) -> list[dict[str, Any]]:
+        """
+        Execute the tool calls of a single model turn.
+
+        Independent calls run concurrently on a bounded thread pool when
+        parallel tool calls are enabled, and calls dispatched early while
+        streaming are awaited rather than re-run. Results are always
+        returned in the order the calls appear in the response.
+
+        Args:
+            tool_calls: tool_use blocks from the response
+
+        Returns:
+            List of tool_result content blocks
+        """
+        futures: list[Future[dict[str, Any]] | None] = [
+            self._dispatched.pop(tool_call.id, None) for tool_call in tool_calls
+        ]
+        parallel = self.settings.agent_parallel_tool_calls and len(tool_calls) > 1
+
+        if not parallel and not any(futures):
+            return [self._run_tool_call(tool_call) for tool_call in tool_calls]
+
+        pending = [
+            future or self._executor.submit(self._run_tool_call, tool_call)
+            for future, tool_call in zip(futures, tool_calls, strict=True)
+        ]
+        return [future.result() for future in pending]
+
+    def _run_tool_call(self, tool_call: Any) -> dict[str, Any]:
+        """
+        Execute a single tool_use block and build its tool_result block.
+
+        Args:
+            tool_call: tool_use block from the response
+
+        Returns:
+            tool_result content block
+        """
+        self._report_progress(
+            "executing_tool",
+            {"tool": tool_call.name, "id": tool_call.id},
+        )
+
+        result = self._execute_tool(tool_call.name, tool_call.input, tool_call.id)
+        return self._complete_tool_call(tool_call, result)
+
+    def _complete_tool_call(self, tool_call: Any, result: Any) -> dict[str, Any]:
+        """
+        Report a finished tool call and build its tool_result block.
+
+        Args:
+            tool_call: tool_use block from the response
+            result: ToolResult from execution
+
+        Returns:
+            tool_result content block
+        """
+        self.metrics.record_tool_call(result.duration_ms)
+        self._report_progress(
+            "tool_complete",
+            {
+                "tool": tool_call.name,
+                "success": result.is_success,
+                "message": result.message,
+            },
+        )
+
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_call.id,
+            "content": self._serializer.serialize(tool_call.name, result),
+            "is_error": result.is_error,
+        }
+
+    def _execute_tool(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        call_id: str | None = None,
+    ) -> Any:
         """
         Execute a tool by name.
 
         Args:
             tool_name: Name of the tool
             tool_input: Tool input parameters
+            call_id: tool_use or plan step id, for progress events
 
         Returns:
             ToolResult from execution
         """
         logger.info("executing_tool", tool=tool_name, input_keys=list(tool_input.keys()))
 
-        result = self.tools.execute(tool_name, **tool_input)
+        # A tool call may not outlive the turn's wall-clock budget
+        turn_seconds = self._budget.remaining_seconds
+        with (
+            deadline_scope(turn_seconds),
+            progress_scope(self._tool_progress(tool_name, call_id)),
+        ):
+            result = self.tools.execute(tool_name, **tool_input)
+        result = self._note_turn_cap(tool_name, tool_input, turn_seconds, result)
 
         logger.info(
             "tool_executed",
@@ -267,6 +753,300 @@ class CICDOrchestrator:
 
         return result
 
+    def _note_turn_cap(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        turn_seconds: float,
+        result: Any,
+    ) -> Any:
+        """
+        Say so in a timed-out result when the turn budget set its deadline.
+
+        The turn's remaining wall-clock budget caps every tool call's own
+        limit; without this note a cut-short call would look like the tool
+        itself being too slow.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Tool input parameters
+            turn_seconds: Turn budget left when the call started
+            result: ToolResult from execution
+
+        Returns:
+            The result, annotated if the turn budget cut it short
+        """
+        if result.error_code != "TIMEOUT":
+            return result
+        tool = self.tools.get(tool_name)
+        limit = tool.call_timeout(**tool_input) if tool else None
+        if limit is not None and limit <= turn_seconds:
+            return result
+
+        note = (
+            f"the turn had {turn_seconds:.0f}s left of AGENT_MAX_TURN_SECONDS"
+            + (f", less than the tool's {limit:.0f}s limit" if limit is not None else "")
+        )
+        logger.warning("tool_deadline_capped_by_turn", tool=tool_name, note=note)
+        error = f"{result.error} ({note})"
+        return result.model_copy(
+            update={
+                "error": error,
+                "message": error,
+                "metadata": {**result.metadata, "turn_budget_seconds": round(turn_seconds)},
+            }
+        )
+
+    def plan_and_execute(self, request: str) -> str:
+        """
+        Process a request in plan-then-execute mode.
+
+        The model submits the whole request as a dependency graph of tool
+        calls in one response. The graph is run locally with maximum safe
+        parallelism and the model is only consulted again to summarize the
+        results or, on failure, to submit a revised plan.
+
+        Args:
+            request: The user's request
+
+        Returns:
+            Agent's response text
+        """
+        self._record_user_message(request)
+        response = self._request_plan(force=True)
+        final_response: str | None = None
+        failed_rounds = 0
+
+        while (plan_call := self._find_plan_call(response)) is not None:
+            plan, errors = self._parse_plan(plan_call)
+            reason = self._budget.check(len(plan.steps) if plan else 1)
+            if reason:
+                final_response = self._stop_for_budget(reason, response, [plan_call])
+                break
+
+            if plan is None:
+                report, succeeded = self._plan_error_report(errors), False
+            else:
+                self._budget.consume(len(plan.steps))
+                executor = DAGExecutor(plan)
+                started = time.perf_counter()
+                executor.run(self._run_plan_step, self._executor)
+                self.metrics.record_tool_wait(elapsed_ms(started))
+                report, succeeded = self._plan_report(executor), executor.succeeded
+
+            self._messages.append({"role": "assistant", "content": response.content})
+            self._messages.append(
+                {"role": "user", "content": self._plan_results(response, report, succeeded)}
+            )
+
+            failed_rounds += not succeeded
+            if failed_rounds > self.settings.agent_plan_max_replans:
+                # Out of replans: fall back to step-by-step tool use
+                response = self._get_response()
+                break
+            response = self._request_plan(force=False)
+
+        if final_response is None:
+            final_response = self._process_response(response)
+
+        self._finish_turn(final_response)
+        return final_response
+
+    def _build_plan_request(self, force: bool) -> dict[str, Any]:
+        """
+        Build a request offering the submit_plan tool.
+
+        Args:
+            force: Require the model to call submit_plan
+
+        Returns:
+            messages.create keyword arguments
+        """
+        self._compact_history()
+        request = self._build_request()
+        request["tools"] = [*request["tools"], PLAN_TOOL]
+        request["tool_choice"] = (
+            {"type": "tool", "name": PLAN_TOOL_NAME} if force else {"type": "auto"}
+        )
+        return request
+
+    def _request_plan(self, force: bool) -> Any:
+        """Ask Claude for a plan (or a final answer when not forced)."""
+        request = self._build_plan_request(force)
+        started = time.perf_counter()
+        response = self._client.messages.create(**request)
+        self._record_usage(response, elapsed_ms(started))
+        return response
+
+    @staticmethod
+    def _find_plan_call(response: Any) -> Any:
+        """Get the submit_plan tool_use block of a response, if any."""
+        if response.stop_reason != "tool_use":
+            return None
+        return next(
+            (
+                block
+                for block in response.content
+                if block.type == "tool_use" and block.name == PLAN_TOOL_NAME
+            ),
+            None,
+        )
+
+    def _parse_plan(self, plan_call: Any) -> tuple[ExecutionPlan | None, list[str]]:
+        """
+        Parse and validate a submitted plan.
+
+        Args:
+            plan_call: submit_plan tool_use block
+
+        Returns:
+            (plan, errors); plan is None when invalid
+        """
+        try:
+            plan = ExecutionPlan.model_validate(plan_call.input)
+        except ValueError as e:
+            return None, [str(e)]
+
+        errors = plan.validate_plan(set(self.tools.list_tools()))
+        if errors:
+            return None, errors
+
+        self._report_progress(
+            "plan_ready",
+            {
+                "summary": plan.summary,
+                "steps": [{"id": step.id, "tool": step.tool} for step in plan.steps],
+            },
+        )
+        logger.info("plan_submitted", steps=len(plan.steps), summary=plan.summary)
+        return plan, []
+
+    def _run_plan_step(self, step: PlanStep, tool_input: dict[str, Any]) -> Any:
+        """
+        Execute one plan step.
+
+        Args:
+            step: Plan step
+            tool_input: Step input with references resolved
+
+        Returns:
+            ToolResult from execution
+        """
+        self._report_progress("executing_tool", {"tool": step.tool, "id": step.id})
+        result = self._execute_tool(step.tool, tool_input, step.id)
+        self._report_plan_step(step, result)
+        return result
+
+    def _report_plan_step(self, step: PlanStep, result: Any) -> None:
+        """Record metrics and report progress for a finished plan step."""
+        self.metrics.record_tool_call(result.duration_ms)
+        self._report_progress(
+            "tool_complete",
+            {"tool": step.tool, "success": result.is_success, "message": result.message},
+        )
+
+    def _plan_report(self, executor: DAGExecutor) -> str:
+        """
+        Build the tool_result content describing a plan run.
+
+        Args:
+            executor: Executor that ran the plan
+
+        Returns:
+            Compact JSON report (the step statuses and an artifact handle
+            when the full report exceeds the result size cap)
+        """
+        steps = []
+        for outcome in executor.outcomes.values():
+            entry: dict[str, Any] = {
+                "id": outcome.step.id,
+                "tool": outcome.step.tool,
+                "status": outcome.status.value,
+            }
+            if outcome.result is not None:
+                entry["result"] = self._serializer.to_payload(outcome.step.tool, outcome.result)
+            if outcome.reason:
+                entry["reason"] = outcome.reason
+            steps.append(entry)
+
+        summary: dict[str, Any] = {
+            "status": "succeeded" if executor.succeeded else "failed",
+            "steps": [{k: v for k, v in step.items() if k != "result"} for step in steps],
+        }
+        if not executor.succeeded:
+            summary["next"] = (
+                "Submit a revised plan for the remaining work with submit_plan, "
+                "without repeating succeeded steps, or explain the problem to the user."
+            )
+        return self._serializer.dumps_capped(
+            {**summary, "steps": steps}, summary, f"{PLAN_TOOL_NAME}.report"
+        )
+
+    def _plan_error_report(self, errors: list[str]) -> str:
+        """Build the tool_result content for an invalid plan."""
+        summary = {
+            "status": "invalid",
+            "next": "Fix the plan and submit it again with submit_plan.",
+        }
+        return self._serializer.dumps_capped(
+            {**summary, "errors": errors}, summary, f"{PLAN_TOOL_NAME}.errors"
+        )
+
+    @staticmethod
+    def _plan_results(response: Any, report: str, succeeded: bool) -> list[dict[str, Any]]:
+        """
+        Build tool_result blocks answering a plan response.
+
+        Any other tool calls made alongside submit_plan are rejected, so
+        every tool_use block still receives a tool_result.
+
+        Args:
+            response: Response containing the submit_plan call
+            report: Plan report content
+            succeeded: Whether the plan ran successfully
+
+        Returns:
+            tool_result content blocks
+        """
+        results = []
+        for block in response.content:
+            if block.type != "tool_use":
+                continue
+            if block.name == PLAN_TOOL_NAME:
+                results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": report,
+                        "is_error": not succeeded,
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": "Not executed: include every step in the submit_plan call.",
+                        "is_error": True,
+                    }
+                )
+        return results
+
+    def close(self) -> None:
+        """
+        Release the tool execution worker threads and the provider clients'
+        connections, close the GitHub conditional request cache and delete
+        the session's artifacts.
+
+        Call once the orchestrator is no longer used.
+        """
+        self._executor.shutdown(wait=True)
+        self.artifacts.close()
+        if self.github_client is not None:
+            self.github_client.close()
+        if self.do_client is not None:
+            self.do_client.close()
+
     def execute_command(self, command: str, **kwargs: Any) -> dict[str, Any]:
         """
         Execute a direct command without chat interface.
@@ -287,7 +1067,9 @@ class CICDOrchestrator:
             "configure_branch_protection": "configure_branch_protection",
             "create_environment": "create_environment",
             "set_secret": "set_secret",
+            "set_secrets": "set_secrets",
             "create_workflow": "create_workflow",
+            "check_repos": "check_repos",
             "configure_firewall": "configure_firewall",
             "bootstrap_droplet": "bootstrap_droplet",
             "create_dns_record": "create_dns_record",
@@ -317,11 +1099,12 @@ class CICDOrchestrator:
         """
         return [
             {
-                "name": tool.name,
-                "description": tool.description,
-                "category": tool.category,
+                "name": info["name"],
+                "description": info["description"],
+                "category": info["category"],
             }
-            for tool in self.tools
+            for info in map(self.tools.get_tool_info, self.tools.list_tools())
+            if info is not None
         ]
 
     @property
@@ -329,6 +1112,32 @@ class CICDOrchestrator:
         """Get current session ID."""
         return str(self._session_id)
 
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Get prompt cache token counts for the completed turns of the session."""
+        summary = self.metrics.summary()
+        return {
+            "requests": summary["llm_calls"],
+            "cache_read_input_tokens": summary["cache_read_input_tokens"],
+            "cache_creation_input_tokens": summary["cache_creation_input_tokens"],
+            "uncached_input_tokens": summary["input_tokens"],
+        }
+
+    def get_rate_limits(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Get the remaining API budget of each provider.
+
+        Args:
+            refresh: Fetch the current GitHub quota instead of relying on
+                the last response seen
+
+        Returns:
+            List of per-provider rate limit status
+        """
+        if refresh and self.github_client is not None:
+            self.github_client.refresh_rate_limit()
+        return self.rate_limits.status()
+
     @property
     def message_count(self) -> int:
         """Get number of messages in current session."""
@@ -0,0 +1,329 @@
+"""
+Plan-then-Execute Planner.
+
+The model submits a whole provisioning plan as a dependency graph of tool
+invocations, which is then run locally with maximum safe parallelism.
+"""
+
+import asyncio
+import re
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+import structlog
+from pydantic import BaseModel, ConfigDict, Field
+
+from pf_cicd_agent.tools.base import ToolResult
+
+
+logger = structlog.get_logger(__name__)
+
+PLAN_TOOL_NAME = "submit_plan"
+
+# ${steps.<step_id>.data.<path>} references to earlier step results
+REFERENCE_PATTERN = re.compile(r"\$\{steps\.([A-Za-z0-9_\-]+)\.data((?:\.[A-Za-z0-9_\-]+)*)\}")
+
+PLAN_TOOL: dict[str, Any] = {
+    "name": PLAN_TOOL_NAME,
+    "description": """Submit the complete plan for the user's request as a dependency graph of tool calls.
+
+Each step invokes one of the available tools. Steps run in parallel unless
+one depends on another. A step input can use the output of an earlier step
+with ${steps.<id>.data.<field>} (e.g. "${steps.droplet.data.ip_address}");
+referencing a step makes it a dependency automatically. You will receive the
+results of all steps once the plan has run, or a report of what failed.""",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {
+                "type": "string",
+                "description": "One-line description of what the plan achieves",
+            },
+            "steps": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string", "description": "Unique step ID (e.g. 'repo')"},
+                        "tool": {"type": "string", "description": "Name of the tool to call"},
+                        "input": {"type": "object", "description": "Tool input parameters"},
+                        "depends_on": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "IDs of steps that must succeed first",
+                        },
+                        "description": {"type": "string"},
+                    },
+                    "required": ["id", "tool", "input"],
+                },
+            },
+        },
+        "required": ["summary", "steps"],
+    },
+}
+
+
+class PlanStep(BaseModel):
+    """A single tool invocation in an execution plan."""
+
+    id: str = Field(..., description="Unique step ID")
+    tool: str = Field(..., description="Tool name")
+    input: dict[str, Any] = Field(default_factory=dict, description="Tool input parameters")
+    depends_on: list[str] = Field(default_factory=list, description="Prerequisite step IDs")
+    description: str = Field(default="", description="What the step does")
+
+    @property
+    def dependencies(self) -> set[str]:
+        """Explicit dependencies plus steps referenced from the input."""
+        return set(self.depends_on) | _referenced_steps(self.input)
+
+
+class ExecutionPlan(BaseModel):
+    """A dependency graph of tool invocations."""
+
+    summary: str = Field(default="", description="What the plan achieves")
+    steps: list[PlanStep] = Field(default_factory=list)
+
+    def get_step(self, step_id: str) -> PlanStep | None:
+        """Get a step by ID."""
+        return next((step for step in self.steps if step.id == step_id), None)
+
+    def validate_plan(self, tool_names: set[str]) -> list[str]:
+        """
+        Validate the plan against the available tools.
+
+        Args:
+            tool_names: Names of tools the plan may call
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        errors: list[str] = []
+        if not self.steps:
+            return ["Plan has no steps"]
+
+        ids = [step.id for step in self.steps]
+        duplicates = sorted({step_id for step_id in ids if ids.count(step_id) > 1})
+        if duplicates:
+            errors.append(f"Duplicate step IDs: {', '.join(duplicates)}")
+
+        for step in self.steps:
+            if step.tool not in tool_names:
+                errors.append(f"Step '{step.id}' uses unknown tool '{step.tool}'")
+            for dependency in sorted(step.dependencies - set(ids)):
+                errors.append(f"Step '{step.id}' depends on unknown step '{dependency}'")
+
+        if not errors and self._has_cycle():
+            errors.append("Plan dependencies contain a cycle")
+
+        return errors
+
+    def _has_cycle(self) -> bool:
+        """Check the dependency graph for cycles (Kahn's algorithm)."""
+        remaining = {step.id: set(step.dependencies) for step in self.steps}
+        while remaining:
+            ready = [step_id for step_id, deps in remaining.items() if not deps]
+            if not ready:
+                return True
+            for step_id in ready:
+                del remaining[step_id]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return False
+
+
+class StepStatus(str, Enum):
+    """Execution status of a plan step."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class StepOutcome(BaseModel):
+    """Outcome of a plan step."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    step: PlanStep
+    status: StepStatus = StepStatus.PENDING
+    result: ToolResult[Any] | None = None
+    reason: str | None = Field(default=None, description="Why the step failed or was skipped")
+
+
+class DAGExecutor:
+    """
+    Runs an ExecutionPlan with maximum safe parallelism.
+
+    A step starts as soon as all of its dependencies have succeeded. When a
+    step fails, its transitive dependents are skipped while independent
+    branches keep running, so a single report covers everything that can
+    be done before going back to the model.
+    """
+
+    def __init__(self, plan: ExecutionPlan) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            plan: Validated execution plan
+        """
+        self.plan = plan
+        self.outcomes: dict[str, StepOutcome] = {
+            step.id: StepOutcome(step=step) for step in plan.steps
+        }
+
+    def run(
+        self,
+        run_step: Callable[[PlanStep, dict[str, Any]], ToolResult[Any]],
+        pool: Executor,
+    ) -> dict[str, StepOutcome]:
+        """
+        Run the plan on a thread pool.
+
+        Args:
+            run_step: Callable executing a step with its resolved input
+            pool: Executor to run steps on
+
+        Returns:
+            Step outcomes keyed by step ID
+        """
+        running: dict[Future[ToolResult[Any]], str] = {}
+        while True:
+            for step, tool_input in self._start_ready():
+                running[pool.submit(run_step, step, tool_input)] = step.id
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._finish(running.pop(future), future)
+
+        return self.outcomes
+
+    async def arun(
+        self,
+        run_step: Callable[[PlanStep, dict[str, Any]], Awaitable[ToolResult[Any]]],
+    ) -> dict[str, StepOutcome]:
+        """
+        Run the plan as asyncio tasks.
+
+        Args:
+            run_step: Coroutine function executing a step with its resolved input
+
+        Returns:
+            Step outcomes keyed by step ID
+        """
+        running: dict[asyncio.Future[ToolResult[Any]], str] = {}
+        while True:
+            for step, tool_input in self._start_ready():
+                running[asyncio.ensure_future(run_step(step, tool_input))] = step.id
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self._finish(running.pop(task), task)
+
+        return self.outcomes
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every step succeeded."""
+        return all(o.status == StepStatus.SUCCEEDED for o in self.outcomes.values())
+
+    def _start_ready(self) -> list[tuple[PlanStep, dict[str, Any]]]:
+        """Mark steps whose dependencies succeeded as running and resolve their input."""
+        ready = []
+        for outcome in self.outcomes.values():
+            step = outcome.step
+            if outcome.status != StepStatus.PENDING:
+                continue
+            if any(self.outcomes[dep].status != StepStatus.SUCCEEDED for dep in step.dependencies):
+                continue
+
+            try:
+                tool_input = self._resolve(step.input)
+            except KeyError as e:
+                self._fail(step.id, f"Unresolved reference: {e.args[0]}")
+                continue
+
+            outcome.status = StepStatus.RUNNING
+            ready.append((step, tool_input))
+        return ready
+
+    def _finish(self, step_id: str, future: Any) -> None:
+        """Record a finished step from its future or task."""
+        error = future.exception()
+        if error is not None:
+            self._fail(step_id, str(error))
+            return
+
+        result = future.result()
+        outcome = self.outcomes[step_id]
+        outcome.result = result
+        if result.is_success:
+            outcome.status = StepStatus.SUCCEEDED
+        else:
+            self._fail(step_id, result.error or result.message)
+
+    def _fail(self, step_id: str, reason: str) -> None:
+        """Mark a step failed and skip everything that depends on it."""
+        outcome = self.outcomes[step_id]
+        outcome.status = StepStatus.FAILED
+        outcome.reason = reason
+        logger.warning("plan_step_failed", step=step_id, tool=outcome.step.tool, reason=reason)
+
+        blocked = {step_id}
+        changed = True
+        while changed:
+            changed = False
+            for other in self.outcomes.values():
+                if other.status == StepStatus.PENDING and other.step.dependencies & blocked:
+                    other.status = StepStatus.SKIPPED
+                    other.reason = f"Depends on failed step '{step_id}'"
+                    blocked.add(other.step.id)
+                    changed = True
+
+    def _resolve(self, value: Any) -> Any:
+        """Substitute ${steps.<id>.data.<path>} references in a step input."""
+        if isinstance(value, dict):
+            return {key: self._resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        if not isinstance(value, str):
+            return value
+
+        match = REFERENCE_PATTERN.fullmatch(value)
+        if match:
+            return self._lookup(match.group(1), match.group(2))
+        return REFERENCE_PATTERN.sub(
+            lambda m: str(self._lookup(m.group(1), m.group(2))), value
+        )
+
+    def _lookup(self, step_id: str, path: str) -> Any:
+        """Look up a field of a completed step's result data."""
+        result = self.outcomes[step_id].result
+        value = result.data if result else None
+        for key in filter(None, path.split(".")):
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            else:
+                raise KeyError(f"steps.{step_id}.data{path}")
+        return value
+
+
+def _referenced_steps(value: Any) -> set[str]:
+    """Collect step IDs referenced anywhere in a step input."""
+    if isinstance(value, dict):
+        return set().union(*(_referenced_steps(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_referenced_steps(item) for item in value))
+    if isinstance(value, str):
+        return {match.group(1) for match in REFERENCE_PATTERN.finditer(value)}
+    return set()
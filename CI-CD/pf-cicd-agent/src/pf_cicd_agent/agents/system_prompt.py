@@ -22,7 +22,9 @@ You help users provision and manage PF-CORE platform instances, products, and wh
 - `configure_branch_protection`: Set up branch protection rules
 - `create_environment`: Create deployment environments (dev, staging, prod)
 - `set_secret`: Set repository or environment secrets
-- `create_workflow`: Create GitHub Actions workflow files
+- `set_secrets`: Set several repository/environment secrets in one call
+- `create_workflow`: Create GitHub Actions workflow files (pass a set in `workflows` to commit them together)
+- `check_repos`: Report the state of many repositories at once and flag drift from expected settings
 
 ### Digital Ocean Tools
 - `create_droplet`: Provision a new VPS/droplet
@@ -30,6 +32,9 @@ You help users provision and manage PF-CORE platform instances, products, and wh
 - `bootstrap_droplet`: Execute setup scripts on a droplet via SSH
 - `create_dns_record`: Create DNS records for domains
 
+### General Tools
+- `fetch_artifact`: Read the full text of a large tool output by its artifact handle
+
 ## Configuration Hierarchy
 
 The platform uses a 4-level configuration inheritance system:
@@ -54,9 +54,13 @@ class AuditEventType(str, Enum):
     AGENT_START = "agent.start"
     AGENT_COMPLETE = "agent.complete"
     AGENT_ERROR = "agent.error"
+    AGENT_TURN = "agent.turn"
+    BUDGET_EXHAUSTED = "agent.budget_exhausted"
     TOOL_INVOKE = "tool.invoke"
     TOOL_COMPLETE = "tool.complete"
     TOOL_ERROR = "tool.error"
+    TOOL_RETRY = "tool.retry"
+    CIRCUIT_STATE_CHANGE = "tool.circuit"
 
     # Provisioning events
     INSTANCE_PROVISION = "instance.provision"
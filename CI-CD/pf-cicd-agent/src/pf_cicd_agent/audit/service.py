@@ -4,6 +4,8 @@ Audit Service.
 Implements WBS-1.4.2 & WBS-1.4.3: Audit service with Supabase storage.
 """
 
+import threading
+import time
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -50,6 +52,8 @@ class AuditService:
         self._client = supabase_client
         self._session_id: UUID | None = None
         self._in_memory_events: list[AuditEvent] = []
+        self._overhead_ms = 0.0
+        self._overhead_lock = threading.Lock()
 
     @property
     def client(self) -> Client | None:
@@ -106,6 +110,17 @@ class AuditService:
         """Get current session ID."""
         return self._session_id
 
+    @property
+    def overhead_ms(self) -> float:
+        """Total time spent logging and completing events, in milliseconds."""
+        return self._overhead_ms
+
+    def _add_overhead(self, started: float) -> None:
+        """Add the time elapsed since a perf_counter() reading to the overhead."""
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._overhead_lock:
+            self._overhead_ms += elapsed
+
     def log_event(
         self,
         event_create: AuditEventCreate,
@@ -123,6 +138,7 @@ class AuditService:
         Returns:
             Created AuditEvent
         """
+        started = time.perf_counter()
         event = AuditEvent(
             event_type=event_create.event_type,
             action=event_create.action,
@@ -152,6 +168,7 @@ class AuditService:
             severity=event.severity.value,
         )
 
+        self._add_overhead(started)
         return event
 
     def complete_event(
@@ -175,6 +192,7 @@ class AuditService:
         Returns:
             Updated AuditEvent
         """
+        started = time.perf_counter()
         event.completed_at = datetime.utcnow()
         event.success = success
         event.output_data = output_data or {}
@@ -191,6 +209,7 @@ class AuditService:
         # Update stored event
         self._update_event(event)
 
+        self._add_overhead(started)
         return event
 
     def _store_event(self, event: AuditEvent) -> None:
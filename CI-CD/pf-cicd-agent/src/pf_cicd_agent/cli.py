@@ -5,10 +5,12 @@ Provides interactive and command-line interfaces for the agent.
 """
 
 import sys
+import threading
 from typing import Optional
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -51,6 +53,86 @@ def progress_callback(status: str, data: dict) -> None:
             console.print(f"[green]✓ {data.get('message', 'Complete')}[/green]")
         else:
             console.print(f"[red]✗ {data.get('message', 'Failed')}[/red]")
+    elif status == "plan_ready":
+        steps = data.get("steps", [])
+        console.print(f"[cyan]📋 Plan: {data.get('summary', '')} ({len(steps)} steps)[/cyan]")
+        for step in steps:
+            console.print(f"[dim]   • {step['id']}: {step['tool']}[/dim]")
+    elif status == "tool_progress":
+        event = data.get("event")
+        if event == "droplet_status":
+            console.print(f"[dim]   ⏱ {data.get('droplet')}: {data.get('status')}[/dim]")
+        elif event == "ssh_connect":
+            console.print(
+                f"[dim]   🔌 SSH to {data.get('host')} (attempt {data.get('attempt')})[/dim]"
+            )
+        elif event == "output":
+            style = "red" if data.get("stream") == "stderr" else "dim"
+            console.print(f"   │ {data.get('line', '')}", style=style, markup=False, highlight=False)
+    elif status == "budget_exhausted":
+        console.print(f"[red]⛔ Stopped early: {data.get('reason', 'budget exhausted')}[/red]")
+
+
+def agent_panel(text: str) -> Panel:
+    """Render agent response text as a panel."""
+    return Panel(
+        Markdown(text),
+        title="[bold green]Agent[/bold green]",
+        border_style="green",
+    )
+
+
+class StreamingProgress:
+    """
+    Progress handler that renders streamed response text incrementally.
+
+    Text deltas are drawn into a rich Live panel as they arrive; any other
+    progress update closes the live panel and is printed as usual. Tools
+    may report progress from worker threads while text is still streaming,
+    so updates are serialized.
+    """
+
+    def __init__(self, console: Console) -> None:
+        self._console = console
+        self._live: Live | None = None
+        self._text = ""
+        self._lock = threading.RLock()
+        self.streamed = False
+
+    def __call__(self, status: str, data: dict) -> None:
+        with self._lock:
+            if status == "text_delta":
+                self._append(data.get("text", ""))
+            else:
+                self.finish()
+                progress_callback(status, data)
+
+    def _append(self, delta: str) -> None:
+        if self._live is None:
+            self._text = ""
+            self._console.print()
+            self._live = Live(
+                agent_panel(self._text),
+                console=self._console,
+                refresh_per_second=12,
+                vertical_overflow="visible",
+            )
+            self._live.start()
+        self._text += delta
+        self._live.update(agent_panel(self._text))
+        self.streamed = True
+
+    def finish(self) -> None:
+        """Stop the live panel, leaving the rendered text on screen."""
+        with self._lock:
+            if self._live is not None:
+                self._live.stop()
+                self._live = None
+
+    def reset(self) -> None:
+        """Prepare for the next chat turn."""
+        self.finish()
+        self.streamed = False
 
 
 @app.command()
@@ -61,6 +143,12 @@ def chat(
         "-m",
         help="Claude model to use",
     ),
+    stream: bool | None = typer.Option(
+        None,
+        "--stream/--no-stream",
+        help="Render the agent's response as it is generated [default: AGENT_STREAM_RESPONSES]",
+        show_default=False,
+    ),
 ) -> None:
     """Start an interactive chat session with the CI/CD agent."""
     print_banner()
@@ -70,6 +158,8 @@ def chat(
         settings = Settings()
         if model:
             settings.agent_model = model
+        if stream is not None:
+            settings.agent_stream_responses = stream
     except Exception as e:
         console.print(f"[red]Error loading settings: {e}[/red]")
         console.print("[dim]Make sure you have a .env file with required variables[/dim]")
@@ -77,10 +167,11 @@ def chat(
 
     # Initialize agent
     console.print("[dim]Initializing agent...[/dim]")
+    streaming = StreamingProgress(console) if settings.agent_stream_responses else None
     try:
         agent = CICDOrchestrator(
             settings=settings,
-            progress_callback=progress_callback,
+            progress_callback=streaming or progress_callback,
         )
         session_id = agent.start_session()
         console.print(f"[green]Session started: {session_id[:8]}...[/green]\n")
@@ -91,37 +182,59 @@ def chat(
     console.print("Type your requests, or 'exit' to quit.\n")
 
     # Main chat loop
-    while True:
-        try:
-            user_input = Prompt.ask("[bold blue]You[/bold blue]")
-
-            if user_input.lower() in ("exit", "quit", "bye"):
-                summary = agent.end_session()
-                console.print("\n[dim]Session Summary:[/dim]")
-                console.print(f"  Messages: {summary.get('total_events', 0)}")
-                console.print(f"  Success Rate: {summary.get('success_rate', 0):.1%}")
-                console.print("\n[green]Goodbye![/green]")
-                break
-
-            if not user_input.strip():
-                continue
-
-            # Get response
-            response = agent.chat(user_input)
-
-            # Display response
-            console.print()
-            console.print(Panel(
-                Markdown(response),
-                title="[bold green]Agent[/bold green]",
-                border_style="green",
-            ))
-            console.print()
-
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Interrupted. Type 'exit' to quit.[/yellow]")
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+    try:
+        while True:
+            try:
+                user_input = Prompt.ask("[bold blue]You[/bold blue]")
+
+                if user_input.lower() in ("exit", "quit", "bye"):
+                    summary = agent.end_session()
+                    console.print("\n[dim]Session Summary:[/dim]")
+                    console.print(f"  Messages: {summary.get('total_events', 0)}")
+                    console.print(f"  Success Rate: {summary.get('success_rate', 0):.1%}")
+                    metrics = summary.get("metrics", {})
+                    if metrics.get("turns"):
+                        console.print(
+                            f"  Time: model {metrics['llm_latency_ms']}ms, "
+                            f"tools {metrics['tool_wait_ms']}ms, audit {metrics['audit_ms']}ms "
+                            f"({metrics['bottleneck']}-bound)"
+                        )
+                        console.print(
+                            f"  Tokens: {metrics['input_tokens']} in, "
+                            f"{metrics['output_tokens']} out, "
+                            f"{metrics['cache_read_input_tokens']} cached"
+                        )
+                        if metrics.get("cost_usd") is not None:
+                            console.print(f"  Estimated Cost: ${metrics['cost_usd']:.4f}")
+                    console.print("\n[green]Goodbye![/green]")
+                    break
+
+                if not user_input.strip():
+                    continue
+
+                # Get response
+                if streaming:
+                    streaming.reset()
+                response = agent.chat(user_input)
+
+                # Display response (already rendered if it was streamed)
+                if streaming and streaming.streamed:
+                    streaming.finish()
+                else:
+                    console.print()
+                    console.print(agent_panel(response))
+                console.print()
+
+            except KeyboardInterrupt:
+                if streaming:
+                    streaming.finish()
+                console.print("\n[yellow]Interrupted. Type 'exit' to quit.[/yellow]")
+            except Exception as e:
+                if streaming:
+                    streaming.finish()
+                console.print(f"[red]Error: {e}[/red]")
+    finally:
+        agent.close()
 
 
 @app.command()
@@ -147,6 +260,7 @@ def exec(
                     kwargs[key] = value
 
     # Initialize and execute
+    agent: CICDOrchestrator | None = None
     try:
         settings = Settings()
         agent = CICDOrchestrator(settings=settings)
@@ -163,11 +277,47 @@ def exec(
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
+
+
+@app.command()
+def plan(
+    request: str = typer.Argument(..., help="What to provision, in plain language"),
+    model: str = typer.Option(
+        None,
+        "--model",
+        "-m",
+        help="Claude model to use",
+    ),
+) -> None:
+    """Plan a request up front and execute it as a dependency graph of tool calls."""
+    agent: CICDOrchestrator | None = None
+    try:
+        settings = Settings()
+        if model:
+            settings.agent_model = model
+        agent = CICDOrchestrator(settings=settings, progress_callback=progress_callback)
+        agent.start_session()
+
+        response = agent.plan_and_execute(request)
+        console.print()
+        console.print(agent_panel(response))
+        agent.end_session()
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
 
 
 @app.command()
 def tools() -> None:
     """List available tools."""
+    agent: CICDOrchestrator | None = None
     try:
         settings = Settings()
         agent = CICDOrchestrator(settings=settings)
@@ -181,6 +331,37 @@ def tools() -> None:
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
+
+
+@app.command()
+def limits() -> None:
+    """Show the remaining API rate limit budget per provider."""
+    agent: CICDOrchestrator | None = None
+    try:
+        settings = Settings()
+        agent = CICDOrchestrator(settings=settings)
+
+        console.print("\n[bold]Rate Limits:[/bold]\n")
+
+        for status in agent.get_rate_limits(refresh=True):
+            if status["remaining"] is None:
+                console.print(f"  [cyan]{status['provider']}[/cyan]: [dim]no requests yet[/dim]")
+                continue
+            console.print(
+                f"  [cyan]{status['provider']}[/cyan]: "
+                f"{status['remaining']}/{status['limit']} remaining, "
+                f"resets in {status['reset_in_seconds']}s"
+            )
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
 
 
 @app.command()
@@ -45,6 +45,210 @@ class Settings(BaseSettings):
         description="Temperature for agent responses",
     )
 
+    agent_prompt_caching: bool = Field(
+        default=True,
+        description="Mark the system prompt, tools and conversation prefix as cacheable",
+    )
+    agent_stream_responses: bool = Field(
+        default=True,
+        description="Stream model responses and report text deltas as they arrive",
+    )
+
+    # -------------------------------------------------------------------------
+    # Conversation History Configuration
+    # -------------------------------------------------------------------------
+    agent_history_compaction: bool = Field(
+        default=True,
+        description="Compact conversation history when it exceeds the token budget",
+    )
+    agent_history_token_budget: int = Field(
+        default=60000,
+        ge=1000,
+        description="Approximate input-token budget for conversation history",
+    )
+    agent_history_keep_turns: int = Field(
+        default=2,
+        ge=1,
+        description="Number of most recent turns that are never elided or truncated as a whole",
+    )
+    agent_history_stale_content_chars: int = Field(
+        default=500,
+        ge=50,
+        description="Maximum characters kept per tool result or input in compacted turns",
+    )
+
+    # -------------------------------------------------------------------------
+    # Tool-Use Loop Budgets (per chat turn)
+    # -------------------------------------------------------------------------
+    agent_max_iterations: int = Field(
+        default=25,
+        ge=1,
+        description="Maximum tool-use loop iterations per chat turn",
+    )
+    agent_max_tool_calls: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum tool calls executed per chat turn",
+    )
+    # Tool calls run under what is left of this budget, so it should exceed
+    # the longest tool deadline (bootstrap_droplet: up to 3600s plus 300s to
+    # connect); a call cut short by it reports the cap in its TIMEOUT error
+    agent_max_turn_seconds: float = Field(
+        default=4200.0,
+        gt=0,
+        description=(
+            "Maximum wall-clock seconds per chat turn; also caps the deadline of each tool call"
+        ),
+    )
+    agent_plan_max_replans: int = Field(
+        default=2,
+        ge=0,
+        description="Revised plans requested after failures in plan-then-execute mode",
+    )
+
+    # -------------------------------------------------------------------------
+    # Tool Execution Configuration
+    # -------------------------------------------------------------------------
+    agent_parallel_tool_calls: bool = Field(
+        default=True,
+        description="Execute the tool calls of a single model turn concurrently",
+    )
+    agent_max_concurrent_tools: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of tool calls executed at once",
+    )
+    agent_early_tool_dispatch: bool = Field(
+        default=True,
+        description="Start tool calls as soon as their block is streamed, before the response ends",
+    )
+    agent_tool_result_field_chars: int = Field(
+        default=2000,
+        ge=200,
+        le=20000,
+        description="Maximum characters per tool result field before it is moved to an artifact",
+    )
+    agent_tool_result_max_chars: int = Field(
+        default=8000,
+        ge=1000,
+        description="Maximum characters for a serialized tool result",
+    )
+    agent_artifact_dir: str | None = Field(
+        default=None,
+        description="Directory for large tool output artifacts (temporary directory if unset)",
+    )
+    agent_artifact_max_chars: int = Field(
+        default=50_000_000,
+        ge=100_000,
+        description="Characters of artifacts kept per session before the oldest are deleted",
+    )
+
+    # -------------------------------------------------------------------------
+    # Tool Retry Configuration
+    # -------------------------------------------------------------------------
+    tool_retry_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        le=10,
+        description="Attempts per tool call for transient failures, including the first",
+    )
+    tool_retry_base_delay: float = Field(
+        default=1.0,
+        ge=0,
+        description="Backoff delay before the first retry in seconds",
+    )
+    tool_retry_max_delay: float = Field(
+        default=30.0,
+        ge=0,
+        description="Maximum backoff delay between retries in seconds",
+    )
+    tool_retry_budget_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Total time budget for retrying a tool call in seconds",
+    )
+
+    # -------------------------------------------------------------------------
+    # Tool Timeout Configuration
+    # -------------------------------------------------------------------------
+    tool_timeout_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Default deadline for a tool call in seconds, including retries",
+    )
+    tool_request_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Timeout for a single provider API request in seconds",
+    )
+
+    # -------------------------------------------------------------------------
+    # Circuit Breaker Configuration
+    # -------------------------------------------------------------------------
+    tool_circuit_breaker_enabled: bool = Field(
+        default=True,
+        description="Fail fast when a provider keeps failing",
+    )
+    tool_circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive provider failures that open the circuit",
+    )
+    tool_circuit_reset_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds an open circuit waits before allowing a trial call",
+    )
+
+    # -------------------------------------------------------------------------
+    # Rate Limit Configuration
+    # -------------------------------------------------------------------------
+    rate_limit_github_per_second: float = Field(
+        default=10.0,
+        gt=0,
+        description="Sustained GitHub API request rate",
+    )
+    rate_limit_github_burst: int = Field(
+        default=20,
+        ge=1,
+        description="GitHub API requests allowed in a burst",
+    )
+    rate_limit_do_per_second: float = Field(
+        default=4.0,
+        gt=0,
+        description="Sustained Digital Ocean API request rate (250 per minute allowed)",
+    )
+    rate_limit_do_burst: int = Field(
+        default=10,
+        ge=1,
+        description="Digital Ocean API requests allowed in a burst",
+    )
+    rate_limit_reserve_fraction: float = Field(
+        default=0.1,
+        ge=0,
+        lt=1,
+        description="Share of the hourly quota below which requests are paced until reset",
+    )
+
+    # -------------------------------------------------------------------------
+    # Tool Result Cache Configuration
+    # -------------------------------------------------------------------------
+    tool_cache_enabled: bool = Field(
+        default=True,
+        description="Cache read-only tool results and coalesce identical concurrent reads",
+    )
+    tool_cache_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Default lifetime of a cached tool result in seconds",
+    )
+    tool_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum cached tool results before least-recently-used eviction",
+    )
+
     # -------------------------------------------------------------------------
     # GitHub Configuration
     # -------------------------------------------------------------------------
@@ -60,6 +264,29 @@ class Settings(BaseSettings):
         default="pf-core-template",
         description="Template repository for new projects",
     )
+    github_object_cache_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Lifetime of cached organization and repository objects (0 disables)",
+    )
+    github_object_cache_max_entries: int = Field(
+        default=128,
+        ge=1,
+        description="Maximum cached organization and repository objects",
+    )
+    github_http_cache_enabled: bool = Field(
+        default=True,
+        description="Revalidate repeated GitHub reads with conditional requests (ETag)",
+    )
+    github_http_cache_max_entries: int = Field(
+        default=512,
+        ge=1,
+        description="Maximum cached GitHub responses",
+    )
+    github_http_cache_path: str | None = Field(
+        default=None,
+        description="SQLite file keeping cached GitHub responses across restarts (memory only if unset)",
+    )
 
     # -------------------------------------------------------------------------
     # Digital Ocean Configuration
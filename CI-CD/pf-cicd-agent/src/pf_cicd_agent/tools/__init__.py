@@ -2,10 +2,27 @@
 
 from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
 from pf_cicd_agent.tools.registry import ToolRegistry
+from pf_cicd_agent.tools.cache import ResultCache
+from pf_cicd_agent.tools.circuit_breaker import CircuitBreaker, CircuitBreakerBoard
+from pf_cicd_agent.tools.rate_limit import RateLimiter, RateLimitScheduler
+from pf_cicd_agent.tools.locks import ResourceLockManager
+from pf_cicd_agent.tools.retry import RetryPolicy
+from pf_cicd_agent.tools.artifacts import ArtifactStore, FetchArtifactTool
+from pf_cicd_agent.tools.serialization import ToolResultSerializer
 
 __all__ = [
     "BaseTool",
     "ToolResult",
     "ToolError",
     "ToolRegistry",
+    "ResultCache",
+    "CircuitBreaker",
+    "CircuitBreakerBoard",
+    "RateLimiter",
+    "RateLimitScheduler",
+    "ResourceLockManager",
+    "RetryPolicy",
+    "ArtifactStore",
+    "FetchArtifactTool",
+    "ToolResultSerializer",
 ]
@@ -0,0 +1,256 @@
+"""
+Artifact Store.
+
+Keeps large tool outputs (SSH logs, rendered files) on local disk so only a
+short preview and a handle need to be sent back to the model.
+"""
+
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+from pf_cicd_agent.tools.base import BaseTool, ToolResult
+from pf_cicd_agent.audit.service import AuditService
+
+
+logger = structlog.get_logger(__name__)
+
+
+class ArtifactStore:
+    """
+    Local store for large tool output blobs.
+
+    Each blob is written to its own file and addressed by an opaque handle.
+    Once the stored blobs exceed ``max_chars`` the oldest are deleted, and
+    clear() / close() delete the store's files.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_chars: int | None = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory to write artifacts to (a temporary directory if omitted)
+            max_chars: Total characters kept before the oldest blobs are deleted
+                (unlimited if omitted)
+        """
+        self._temporary = directory is None
+        self.directory = Path(directory or tempfile.mkdtemp(prefix="pf-cicd-artifacts-"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_chars = max_chars
+        self._index: dict[str, dict[str, Any]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, content: str, label: str = "") -> str:
+        """
+        Store a blob.
+
+        Args:
+            content: Text to store
+            label: Short description of the blob (e.g. "bootstrap_droplet.stdout")
+
+        Returns:
+            Artifact handle
+        """
+        handle = f"artifact-{uuid4().hex[:12]}"
+        path = self.directory / f"{handle}.txt"
+        path.write_text(content, encoding="utf-8")
+
+        with self._lock:
+            self._index[handle] = {"path": path, "label": label, "size": len(content)}
+            self._size += len(content)
+            # The newest blob is kept even if it alone exceeds the limit
+            while self.max_chars is not None and self._size > self.max_chars:
+                oldest = next(iter(self._index))
+                if oldest == handle:
+                    break
+                self._remove(oldest)
+                logger.debug("artifact_evicted", handle=oldest)
+
+        logger.debug("artifact_stored", handle=handle, label=label, size=len(content))
+        return handle
+
+    def get(self, handle: str, offset: int = 0, limit: int | None = None) -> str | None:
+        """
+        Read a blob, or a slice of it.
+
+        Args:
+            handle: Artifact handle
+            offset: Character offset to start from
+            limit: Maximum characters to return
+
+        Returns:
+            Blob text or None if the handle is unknown
+        """
+        entry = self.info(handle)
+        if entry is None:
+            return None
+
+        try:
+            content = entry["path"].read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None  # deleted since the lookup
+        end = None if limit is None else offset + limit
+        return content[offset:end]
+
+    def info(self, handle: str) -> dict[str, Any] | None:
+        """
+        Get metadata for a blob.
+
+        Args:
+            handle: Artifact handle
+
+        Returns:
+            Dict with path, label and size, or None if unknown
+        """
+        with self._lock:
+            return self._index.get(handle)
+
+    def clear(self) -> int:
+        """
+        Delete every stored blob.
+
+        Returns:
+            Number of blobs deleted
+        """
+        with self._lock:
+            handles = list(self._index)
+            for handle in handles:
+                self._remove(handle)
+
+        if handles:
+            logger.info("artifacts_cleared", count=len(handles))
+        return len(handles)
+
+    def close(self) -> None:
+        """Delete every stored blob, and the directory if the store created it."""
+        self.clear()
+        if self._temporary:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _remove(self, handle: str) -> None:
+        """Delete a blob and forget it; caller holds the lock."""
+        entry = self._index.pop(handle)
+        self._size -= entry["size"]
+        entry["path"].unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._index
+
+
+class FetchArtifactTool(BaseTool):
+    """
+    Tool for reading stored tool output artifacts.
+
+    Large fields in tool results are replaced with a preview and an
+    artifact handle; this tool lets the model page through the full text.
+    """
+
+    name = "fetch_artifact"
+    description = """Read the full content of a large tool output by artifact handle.
+
+Tool results replace long fields (such as SSH stdout/stderr) with a preview
+and an "artifact" handle. Use this tool to page through the full text with
+offset and limit when the preview is not enough."""
+    version = "1.0.0"
+    category = "general"
+
+    # Artifacts never change once stored
+    cacheable = True
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        audit_service: AuditService | None = None,
+        page_size: int = 2000,
+    ) -> None:
+        """
+        Initialize the tool.
+
+        Args:
+            store: Artifact store to read from
+            audit_service: Optional audit service for logging
+            page_size: Maximum characters returned per call
+        """
+        super().__init__(audit_service=audit_service)
+        self._store = store
+        self._page_size = page_size
+
+    def cache_tags(self, **kwargs: Any) -> set[str]:
+        """Tag cached pages with their artifact."""
+        return {f"artifact:{kwargs.get('handle')}"}
+
+    def get_input_schema(self) -> dict[str, Any]:
+        """Get JSON schema for tool input."""
+        return {
+            "type": "object",
+            "properties": {
+                "handle": {
+                    "type": "string",
+                    "description": "Artifact handle from a previous tool result",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Character offset to start reading from",
+                    "default": 0,
+                    "minimum": 0,
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Characters to read (max {self._page_size})",
+                    "default": self._page_size,
+                    "minimum": 1,
+                    "maximum": self._page_size,
+                },
+            },
+            "required": ["handle"],
+        }
+
+    def execute(self, **kwargs: Any) -> ToolResult[dict[str, Any]]:
+        """
+        Read a page of an artifact.
+
+        Args:
+            handle: Artifact handle
+            offset: Character offset
+            limit: Characters to read
+
+        Returns:
+            ToolResult with the requested content
+        """
+        handle = kwargs["handle"]
+        offset = max(0, int(kwargs.get("offset", 0)))
+        limit = min(max(1, int(kwargs.get("limit", self._page_size))), self._page_size)
+
+        info = self._store.info(handle)
+        content = self._store.get(handle, offset=offset, limit=limit)
+        if info is None or content is None:
+            return ToolResult.failure(
+                error=f"Artifact '{handle}' not found (it may have been deleted)",
+                error_code="ARTIFACT_NOT_FOUND",
+            )
+
+        return ToolResult.success(
+            data={
+                "handle": handle,
+                "label": info["label"],
+                "offset": offset,
+                "length": len(content),
+                "total_size": info["size"],
+                "content": content,
+            },
+            message=f"Read {len(content)} of {info['size']} characters",
+        )
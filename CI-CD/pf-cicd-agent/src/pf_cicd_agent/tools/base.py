@@ -4,20 +4,36 @@ Base Tool Framework.
 Implements WBS-2.1.1 & WBS-2.1.3: Tool base class and result handling.
 """
 
+import asyncio
+import inspect
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 import structlog
+from jsonschema import Draft7Validator
 from pydantic import BaseModel, Field
 
-from pf_cicd_agent.audit.models import AuditEventType
+from pf_cicd_agent.audit.models import AuditEvent, AuditEventCreate, AuditEventType, AuditSeverity
 from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+from pf_cicd_agent.tools.rate_limit import RateLimitWaitExceeded
+from pf_cicd_agent.tools.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+if TYPE_CHECKING:
+    from pf_cicd_agent.tools.circuit_breaker import CircuitBreaker
 
 
 logger = structlog.get_logger(__name__)
 
+# Validators of class-level input schemas, compiled once per tool class
+_class_validators: dict[type, Draft7Validator] = {}
+_class_validators_lock = threading.Lock()
+
 
 class ToolStatus(str, Enum):
     """Status of a tool execution."""
@@ -37,15 +53,18 @@ class ToolError(Exception):
         code: str | None = None,
         details: dict[str, Any] | None = None,
         retryable: bool = False,
+        retry_after: float | None = None,
     ) -> None:
         super().__init__(message)
         self.message = message
         self.code = code or "TOOL_ERROR"
         self.details = details or {}
         self.retryable = retryable
+        self.retry_after = retry_after
 
 
 T = TypeVar("T")
+_R = TypeVar("_R")
 
 
 class ToolResult(BaseModel, Generic[T]):
@@ -79,7 +98,7 @@ class ToolResult(BaseModel, Generic[T]):
         )
 
     @classmethod
-    def error(
+    def failure(
         cls,
         error: str,
         error_code: str = "ERROR",
@@ -143,10 +162,12 @@ class BaseTool(ABC):
     Abstract base class for all tools.
 
     Provides:
-    - Standard execution interface
+    - Standard execution interface (run, and arun for async callers)
     - Audit logging integration
     - Error handling
-    - Retry logic support
+    - Retries of transient (retryable) ToolErrors
+    - A deadline around execution (TIMEOUT error when exceeded)
+    - A provider circuit breaker that fails fast while the provider is down
     """
 
     # Tool metadata (override in subclasses)
@@ -158,6 +179,26 @@ class BaseTool(ABC):
     # Audit configuration
     audit_event_type: AuditEventType = AuditEventType.TOOL_INVOKE
 
+    # Retry configuration (None uses the registry/default policy)
+    retry_policy: RetryPolicy | None = None
+
+    # Circuit breaker shared by the tools of this provider (set by the registry)
+    circuit_breaker: "CircuitBreaker | None" = None
+
+    # Execution timeout in seconds (None uses the registry default)
+    timeout_seconds: float | None = None
+
+    # Result cache configuration: only read-only tools are cacheable; calls
+    # to any other tool invalidate cached results sharing a cache tag
+    cacheable: bool = False
+    cache_ttl: float | None = None  # None uses the cache default
+
+    # Resources a call reads and writes, as templates filled from its
+    # parameters (e.g. "github:repo:{repo_name}"). The registry serializes
+    # calls that write a resource another call reads or writes.
+    reads: tuple[str, ...] = ()
+    writes: tuple[str, ...] = ()
+
     def __init__(self, audit_service: AuditService | None = None) -> None:
         """
         Initialize the tool.
@@ -167,17 +208,25 @@ class BaseTool(ABC):
         """
         self._audit_service = audit_service
         self._logger = structlog.get_logger(self.__class__.__name__)
+        self._input_schema: dict[str, Any] | None = None
+        self._input_validator: Draft7Validator | None = None
 
     @property
     def audit_service(self) -> AuditService | None:
         """Get the audit service."""
         return self._audit_service
 
+    @classmethod
     @abstractmethod
-    def get_input_schema(self) -> dict[str, Any]:
+    def get_input_schema(cls) -> dict[str, Any]:
         """
         Get the JSON schema for tool input.
 
+        Defined on the class so the registry can describe a tool without
+        instantiating it. A tool whose schema depends on its configuration
+        may override this as an instance method; the registry then builds
+        the tool to describe it.
+
         Returns:
             JSON schema dict
         """
@@ -196,6 +245,118 @@ class BaseTool(ABC):
         """
         pass
 
+    @property
+    def input_schema(self) -> dict[str, Any]:
+        """Get the JSON schema for tool input, built once per tool."""
+        if self._input_schema is None:
+            self._input_schema = self.get_input_schema()
+        return self._input_schema
+
+    @property
+    def input_validator(self) -> Draft7Validator:
+        """
+        Get the validator for the input schema.
+
+        It is compiled once per tool class, so every instance of a tool
+        shares it; a tool with an instance-level schema compiles its own.
+        """
+        if self._input_validator is None:
+            tool_class = type(self)
+            if not tool_class.has_class_schema():
+                self._input_validator = self._compile_validator()
+            else:
+                with _class_validators_lock:
+                    validator = _class_validators.get(tool_class)
+                    if validator is None:
+                        validator = _class_validators[tool_class] = self._compile_validator()
+                self._input_validator = validator
+        return self._input_validator
+
+    def _compile_validator(self) -> Draft7Validator:
+        """Check the input schema and compile its validator."""
+        Draft7Validator.check_schema(self.input_schema)
+        return Draft7Validator(self.input_schema)
+
+    @classmethod
+    def has_class_schema(cls) -> bool:
+        """Whether get_input_schema() is a classmethod, i.e. the same for every instance."""
+        return isinstance(inspect.getattr_static(cls, "get_input_schema"), classmethod)
+
+    def check_input(self, arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Check arguments against the input schema.
+
+        Args:
+            arguments: Tool parameters
+
+        Returns:
+            List of structured schema violations (empty if valid)
+        """
+        validator = self.input_validator
+        if validator.is_valid(arguments):
+            return []
+
+        errors = sorted(validator.iter_errors(arguments), key=lambda e: [str(p) for p in e.path])
+        return [
+            {
+                "field": ".".join(str(p) for p in error.absolute_path) or None,
+                "message": error.message,
+                "rule": error.validator,
+            }
+            for error in errors
+        ]
+
+    def reject_input(
+        self, kwargs: dict[str, Any], violations: list[dict[str, Any]]
+    ) -> ToolResult[Any]:
+        """
+        Log and audit a call whose arguments failed schema validation.
+
+        The audit record lists the failing fields and rules but not the
+        messages, which can quote argument values (including secrets).
+
+        Args:
+            kwargs: Tool parameters
+            violations: Schema violations from check_input()
+
+        Returns:
+            VALIDATION_ERROR result listing the violations
+        """
+        error = "Invalid input: " + "; ".join(
+            f"{v['field']}: {v['message']}" if v["field"] else v["message"] for v in violations
+        )
+        self._logger.warning("tool_input_invalid", tool=self.name, violations=violations)
+
+        if self._audit_service:
+            audit_event = self._audit_service.log_event(
+                AuditEventCreate(
+                    event_type=self.audit_event_type,
+                    action=f"tool.{self.name}",
+                    description=f"Rejected invalid input for tool: {self.name}",
+                    severity=AuditSeverity.WARNING,
+                    metadata={
+                        "params": self._audit_params(kwargs),
+                        "violations": [
+                            {"field": v["field"], "rule": v["rule"]} for v in violations
+                        ],
+                    },
+                )
+            )
+            self._audit_service.complete_event(
+                audit_event,
+                success=False,
+                error_message="Invalid input: " + ", ".join(
+                    sorted({v["field"] or "(root)" for v in violations})
+                ),
+                error_code="VALIDATION_ERROR",
+            )
+
+        return ToolResult.failure(
+            error=error,
+            error_code="VALIDATION_ERROR",
+            metadata={"violations": violations},
+        )
+
     def get_definition(self) -> ToolDefinition:
         """
         Get the tool definition for Claude.
@@ -206,7 +367,7 @@ class BaseTool(ABC):
         return ToolDefinition(
             name=self.name,
             description=self.description,
-            input_schema=self.get_input_schema(),
+            input_schema=self.input_schema,
         )
 
     def to_anthropic_tool(self) -> dict[str, Any]:
@@ -219,9 +380,38 @@ class BaseTool(ABC):
         return {
             "name": self.name,
             "description": self.description,
-            "input_schema": self.get_input_schema(),
+            "input_schema": self.input_schema,
+        }
+
+    @classmethod
+    def class_definition(cls) -> dict[str, Any]:
+        """
+        Get the tool in Anthropic tool format without instantiating it.
+
+        Returns:
+            Dict in Anthropic tool format
+        """
+        return {
+            "name": cls.name,
+            "description": cls.description,
+            "input_schema": cls.get_input_schema(),
         }
 
+    async def aexecute(self, **kwargs: Any) -> ToolResult[Any]:
+        """
+        Execute the tool without blocking the event loop.
+
+        The default runs execute() in a worker thread. Tools backed by an
+        async provider API override this to await it natively.
+
+        Args:
+            **kwargs: Tool-specific parameters
+
+        Returns:
+            ToolResult with execution outcome
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+
     def run(self, **kwargs: Any) -> ToolResult[Any]:
         """
         Run the tool with logging and error handling.
@@ -236,99 +426,415 @@ class BaseTool(ABC):
             ToolResult with execution outcome
         """
         start_time = datetime.utcnow()
+        audit_event = self._start(kwargs)
 
-        # Log start
+        try:
+            with deadline.deadline_scope(self.call_timeout(**kwargs)):
+                result, attempts = self._execute_with_retry(audit_event, kwargs)
+            return self._complete(result, attempts, start_time, audit_event)
+        except Exception as e:
+            return self._fail(e, start_time, audit_event)
+
+    async def arun(self, **kwargs: Any) -> ToolResult[Any]:
+        """
+        Async counterpart of run(), wrapping aexecute().
+
+        Logging, auditing, retries, the deadline and the circuit breaker
+        behave as in run(); audit writes are offloaded to a worker thread.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult with execution outcome
+        """
+        start_time = datetime.utcnow()
+        audit_event = await self._audit_call(self._start, kwargs)
+
+        try:
+            with deadline.deadline_scope(self.call_timeout(**kwargs)):
+                result, attempts = await self._aexecute_with_retry(audit_event, kwargs)
+            return await self._audit_call(
+                self._complete, result, attempts, start_time, audit_event
+            )
+        except Exception as e:
+            return await self._audit_call(self._fail, e, start_time, audit_event)
+
+    async def _audit_call(self, func: Callable[..., _R], *args: Any) -> _R:
+        """Call a helper that may write to the audit service, off the event loop if it does."""
+        if self._audit_service is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _start(self, kwargs: dict[str, Any]) -> AuditEvent | None:
+        """Log the start of a call and open its audit event."""
         self._logger.info(
             "tool_start",
             tool=self.name,
             params={k: v for k, v in kwargs.items() if "secret" not in k.lower()},
         )
 
-        # Audit event
-        audit_event = None
-        if self._audit_service:
-            from pf_cicd_agent.audit.models import AuditEventCreate
-
-            audit_event = self._audit_service.log_event(
-                AuditEventCreate(
-                    event_type=self.audit_event_type,
-                    action=f"tool.{self.name}",
-                    description=f"Executing tool: {self.name}",
-                    metadata={"params": {k: "***" if "secret" in k.lower() else v for k, v in kwargs.items()}},
-                )
+        if not self._audit_service:
+            return None
+        return self._audit_service.log_event(
+            AuditEventCreate(
+                event_type=self.audit_event_type,
+                action=f"tool.{self.name}",
+                description=f"Executing tool: {self.name}",
+                metadata={"params": self._audit_params(kwargs)},
             )
+        )
 
-        try:
-            result = self.execute(**kwargs)
+    @staticmethod
+    def _audit_params(kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Tool parameters for the audit log, with secret parameters masked."""
+        return {k: "***" if "secret" in k.lower() else v for k, v in kwargs.items()}
 
-            # Calculate duration
-            duration = datetime.utcnow() - start_time
-            result.duration_ms = int(duration.total_seconds() * 1000)
+    def _complete(
+        self,
+        result: ToolResult[Any],
+        attempts: int,
+        start_time: datetime,
+        audit_event: AuditEvent | None,
+    ) -> ToolResult[Any]:
+        """Log a finished call and complete its audit event."""
+        if attempts > 1:
+            result.metadata["attempts"] = attempts
+
+        # Calculate duration
+        duration = datetime.utcnow() - start_time
+        result.duration_ms = int(duration.total_seconds() * 1000)
+
+        # Log completion
+        self._logger.info(
+            "tool_complete",
+            tool=self.name,
+            status=result.status.value,
+            duration_ms=result.duration_ms,
+        )
 
-            # Log completion
-            self._logger.info(
-                "tool_complete",
-                tool=self.name,
-                status=result.status.value,
-                duration_ms=result.duration_ms,
+        # Complete audit
+        if audit_event and self._audit_service:
+            self._audit_service.complete_event(
+                audit_event,
+                success=result.is_success,
+                output_data={"status": result.status.value, "message": result.message},
             )
 
-            # Complete audit
-            if audit_event and self._audit_service:
-                self._audit_service.complete_event(
-                    audit_event,
-                    success=result.is_success,
-                    output_data={"status": result.status.value, "message": result.message},
-                )
-
-            return result
+        return result
 
-        except ToolError as e:
-            duration = datetime.utcnow() - start_time
+    def _fail(
+        self,
+        error: Exception,
+        start_time: datetime,
+        audit_event: AuditEvent | None,
+    ) -> ToolResult[Any]:
+        """Log a failed call, complete its audit event and build the error result."""
+        duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+
+        if isinstance(error, DeadlineExceeded):
             self._logger.error(
-                "tool_error",
+                "tool_rate_limited" if isinstance(error, RateLimitWaitExceeded) else "tool_timeout",
                 tool=self.name,
-                error=e.message,
-                code=e.code,
-                duration_ms=int(duration.total_seconds() * 1000),
+                error=error.message,
+                duration_ms=duration_ms,
             )
-
-            if audit_event and self._audit_service:
-                self._audit_service.complete_event(
-                    audit_event,
-                    success=False,
-                    error_message=e.message,
-                    error_code=e.code,
-                )
-
-            return ToolResult.error(
-                error=e.message,
-                error_code=e.code,
-                metadata=e.details,
+            message, code = error.message, error.code
+            metadata: dict[str, Any] = {"timeout_seconds": error.timeout}
+            if error.retry_after is not None:
+                metadata["retry_after_seconds"] = round(error.retry_after, 1)
+        elif isinstance(error, ToolError):
+            self._logger.error(
+                "tool_error",
+                tool=self.name,
+                error=error.message,
+                code=error.code,
+                duration_ms=duration_ms,
             )
-
-        except Exception as e:
-            duration = datetime.utcnow() - start_time
+            message, code, metadata = error.message, error.code, error.details
+        else:
             self._logger.exception(
                 "tool_exception",
                 tool=self.name,
-                error=str(e),
-                duration_ms=int(duration.total_seconds() * 1000),
+                error=str(error),
+                duration_ms=duration_ms,
+            )
+            message, code, metadata = str(error), type(error).__name__, {}
+
+        if audit_event and self._audit_service:
+            self._audit_service.complete_event(
+                audit_event,
+                success=False,
+                error_message=message,
+                error_code=code,
             )
 
-            if audit_event and self._audit_service:
-                self._audit_service.complete_event(
-                    audit_event,
-                    success=False,
-                    error_message=str(e),
-                    error_code=type(e).__name__,
-                )
+        return ToolResult.failure(error=message, error_code=code, metadata=metadata)
+
+    def _execute_with_retry(
+        self,
+        audit_event: AuditEvent | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[ToolResult[Any], int]:
+        """
+        Call execute(), retrying retryable ToolErrors per the retry policy.
+
+        Each attempt is admitted by, and reported to, the provider's circuit
+        breaker. An attempt stopped by the deadline or the rate limiter is
+        not counted as a provider failure.
+
+        Args:
+            audit_event: Parent audit event for retry records
+            kwargs: Tool parameters
+
+        Returns:
+            Tuple of (result, number of attempts)
+
+        Raises:
+            ToolError: If the error is not retryable or the policy is exhausted
+        """
+        policy = self.retry_policy or DEFAULT_RETRY_POLICY
+        started = time.monotonic()
+        attempt = 1
+        breaker = self.circuit_breaker
+
+        while True:
+            deadline.check(f"attempt {attempt} of {self.name}")
+            if breaker:
+                breaker.before_call()
+            try:
+                result = self.execute(**kwargs)
+            except ToolError as e:
+                if breaker:
+                    # A non-retryable error means the provider answered
+                    if e.retryable:
+                        breaker.record_failure(e.message)
+                    else:
+                        breaker.record_success()
+                delay = self._retry_delay(e, policy, attempt, started)
+                self._record_retry(audit_event, attempt, delay, e)
+                time.sleep(delay)
+                attempt += 1
+            except DeadlineExceeded:
+                # Out of time or rate-limit budget: no verdict on the provider
+                if breaker:
+                    breaker.release()
+                raise
+            except Exception as e:
+                if breaker:
+                    breaker.record_failure(str(e) or type(e).__name__)
+                raise
+            else:
+                if breaker:
+                    breaker.record_success()
+                return result, attempt
+
+    async def _aexecute_with_retry(
+        self,
+        audit_event: AuditEvent | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[ToolResult[Any], int]:
+        """
+        Async counterpart of _execute_with_retry(), calling aexecute().
+
+        Each attempt is cancelled when the deadline passes.
+
+        Args:
+            audit_event: Parent audit event for retry records
+            kwargs: Tool parameters
+
+        Returns:
+            Tuple of (result, number of attempts)
+
+        Raises:
+            ToolError: If the error is not retryable or the policy is exhausted
+        """
+        policy = self.retry_policy or DEFAULT_RETRY_POLICY
+        started = time.monotonic()
+        attempt = 1
+        breaker = self.circuit_breaker
+
+        while True:
+            deadline.check(f"attempt {attempt} of {self.name}")
+            if breaker:
+                await breaker.abefore_call()
+            try:
+                async with deadline.cancel_at_deadline(f"attempt {attempt} of {self.name}"):
+                    result = await self.aexecute(**kwargs)
+            except ToolError as e:
+                if breaker:
+                    # A non-retryable error means the provider answered
+                    if e.retryable:
+                        await breaker.arecord_failure(e.message)
+                    else:
+                        await breaker.arecord_success()
+                delay = self._retry_delay(e, policy, attempt, started)
+                await self._audit_call(self._record_retry, audit_event, attempt, delay, e)
+                await asyncio.sleep(delay)
+                attempt += 1
+            except DeadlineExceeded:
+                # Out of time or rate-limit budget: no verdict on the provider
+                if breaker:
+                    breaker.release()
+                raise
+            except Exception as e:
+                if breaker:
+                    await breaker.arecord_failure(str(e) or type(e).__name__)
+                raise
+            else:
+                if breaker:
+                    await breaker.arecord_success()
+                return result, attempt
+
+    def _retry_delay(
+        self,
+        error: ToolError,
+        policy: RetryPolicy,
+        attempt: int,
+        started: float,
+    ) -> float:
+        """
+        Decide whether and when to retry a failed attempt.
+
+        Args:
+            error: Error raised by the attempt
+            policy: Retry policy in effect
+            attempt: Number of the failed attempt
+            started: Monotonic time the first attempt started
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            ToolError: The error itself, if it is not to be retried
+        """
+        delay = None
+        if error.retryable:
+            delay = policy.next_delay(attempt, time.monotonic() - started, error.retry_after)
+        current = deadline.current_deadline()
+        if delay is not None and current is not None and delay >= current.remaining:
+            delay = None  # the retry would start after the deadline
+        if delay is None:
+            if attempt > 1:
+                error.details.setdefault("attempts", attempt)
+            raise error
+        return delay
+
+    def _record_retry(
+        self,
+        audit_event: AuditEvent | None,
+        attempt: int,
+        delay: float,
+        error: ToolError,
+    ) -> None:
+        """Log a failed attempt that is about to be retried as a child audit event."""
+        self._logger.warning(
+            "tool_retry",
+            tool=self.name,
+            attempt=attempt,
+            delay_seconds=round(delay, 2),
+            error=error.message,
+            code=error.code,
+        )
 
-            return ToolResult.error(
-                error=str(e),
-                error_code=type(e).__name__,
+        if self._audit_service:
+            retry_event = self._audit_service.log_event(
+                AuditEventCreate(
+                    event_type=AuditEventType.TOOL_RETRY,
+                    action=f"tool.{self.name}.retry",
+                    description=f"Attempt {attempt} failed, retrying in {delay:.1f}s",
+                    severity=AuditSeverity.WARNING,
+                    metadata={
+                        "attempt": attempt,
+                        "delay_seconds": round(delay, 2),
+                        "retry_after": error.retry_after,
+                    },
+                ),
+                parent_event_id=audit_event.event_id if audit_event else None,
+            )
+            self._audit_service.complete_event(
+                retry_event,
+                success=False,
+                error_message=error.message,
+                error_code=error.code,
             )
 
+    def call_timeout(self, **kwargs: Any) -> float | None:  # noqa: ARG002
+        """
+        Get the deadline for a call.
+
+        Override when the time a call needs depends on its parameters.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            Seconds the call may take, or None for no limit
+        """
+        return self.timeout_seconds
+
+    def cache_tags(self, **kwargs: Any) -> set[str]:
+        """
+        Get the resources a call reads (cacheable tools) or modifies (others).
+
+        The default derives tags from common resource parameters. Override
+        when a tool names its resource differently. A mutating call with no
+        tags invalidates every cached result.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            Set of resource tags (e.g. "github:repo:my-app")
+        """
+        tags = set()
+        if kwargs.get("repo_name"):
+            # A repository change also stales organization-wide reads
+            tags.update({f"github:repo:{kwargs['repo_name']}", "github:org"})
+        for key in ("droplet_id", "droplet_name"):
+            if kwargs.get(key):
+                tags.add(f"do:droplet:{kwargs[key]}")
+        if kwargs.get("domain"):
+            tags.add(f"do:domain:{kwargs['domain']}")
+        return tags
+
+    def resource_access(self, **kwargs: Any) -> tuple[set[str], set[str]]:
+        """
+        Get the resources a call reads and writes.
+
+        The ``reads`` and ``writes`` templates are filled from the call's
+        parameters, with schema defaults for omitted ones; a template whose
+        parameter is not set is skipped. A tool that declares neither reads
+        its cache tags if cacheable and writes them otherwise.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            Tuple of (resources read, resources written)
+        """
+        if not self.reads and not self.writes:
+            tags = self.cache_tags(**kwargs)
+            return (tags, set()) if self.cacheable else (set(), tags)
+
+        params = {
+            name: spec["default"]
+            for name, spec in self.input_schema.get("properties", {}).items()
+            if "default" in spec
+        }
+        params.update({name: value for name, value in kwargs.items() if value is not None})
+
+        def fill(templates: tuple[str, ...]) -> set[str]:
+            keys = set()
+            for template in templates:
+                try:
+                    keys.add(template.format_map(params))
+                except KeyError:
+                    continue
+            return keys
+
+        return fill(self.reads), fill(self.writes)
+
     def validate_input(self, **kwargs: Any) -> list[str]:
         """
         Validate input parameters.
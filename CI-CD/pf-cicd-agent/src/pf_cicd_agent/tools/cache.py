@@ -0,0 +1,280 @@
+"""
+Tool Result Cache.
+
+Session-scoped cache for ToolRegistry.execute: read-only tool results are
+reused for a TTL, identical concurrent reads share one execution, and
+mutating tools invalidate the cached reads of the resources they touch.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import structlog
+
+from pf_cicd_agent.tools.base import BaseTool, ToolResult
+
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _CacheEntry:
+    """A cached tool result."""
+
+    result: ToolResult[Any]
+    expires_at: float
+    tags: set[str] = field(default_factory=set)
+
+
+class ResultCache:
+    """
+    TTL + LRU cache of tool results with single-flight de-duplication.
+
+    Keys are the tool name plus its canonicalized arguments. Only successful
+    results of cacheable (read-only) tools are stored, and only their calls
+    are coalesced with an identical call already in flight, so a model that
+    issues the same read twice in one batch runs it once. Mutating calls
+    always run: a repeated write may be intended.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 300.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached results before LRU eviction
+            default_ttl: TTL for tools that do not define cache_ttl (seconds)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._in_flight: dict[str, Future[ToolResult[Any]]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(tool_name: str, kwargs: dict[str, Any]) -> str:
+        """
+        Build a cache key from a tool name and its arguments.
+
+        Args:
+            tool_name: Tool name
+            kwargs: Tool parameters
+
+        Returns:
+            Canonical key (argument order does not matter)
+        """
+        arguments = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{tool_name}:{arguments}"
+
+    def run(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        execute: Callable[[], ToolResult[Any]],
+    ) -> ToolResult[Any]:
+        """
+        Run a tool call through the cache.
+
+        Args:
+            tool: Tool being called
+            kwargs: Tool parameters
+            execute: Callable that runs the tool
+
+        Returns:
+            Cached, shared or fresh ToolResult
+        """
+        if not tool.cacheable:
+            try:
+                return execute()
+            finally:
+                self._invalidate_for(tool, kwargs)
+
+        key = self.make_key(tool.name, kwargs)
+        cached, future, generation = self._claim(key)
+        if future is None:
+            return cached  # type: ignore[return-value]
+
+        if generation is None:
+            logger.debug("tool_call_coalesced", tool=tool.name)
+            return self._copy(future.result(), marker="coalesced")
+
+        try:
+            result = execute()
+        except BaseException as e:
+            self._abandon(key, future, e)
+            raise
+        return self._settle(tool, kwargs, key, future, generation, result)
+
+    async def arun(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        execute: Callable[[], Awaitable[ToolResult[Any]]],
+    ) -> ToolResult[Any]:
+        """
+        Async counterpart of run().
+
+        Calls are coalesced with identical calls in flight on any thread or
+        event loop.
+
+        Args:
+            tool: Tool being called
+            kwargs: Tool parameters
+            execute: Coroutine function that runs the tool
+
+        Returns:
+            Cached, shared or fresh ToolResult
+        """
+        if not tool.cacheable:
+            try:
+                return await execute()
+            finally:
+                self._invalidate_for(tool, kwargs)
+
+        key = self.make_key(tool.name, kwargs)
+        cached, future, generation = self._claim(key)
+        if future is None:
+            return cached  # type: ignore[return-value]
+
+        if generation is None:
+            logger.debug("tool_call_coalesced", tool=tool.name)
+            return self._copy(await asyncio.wrap_future(future), marker="coalesced")
+
+        try:
+            result = await execute()
+        except BaseException as e:
+            self._abandon(key, future, e)
+            raise
+        return self._settle(tool, kwargs, key, future, generation, result)
+
+    def _claim(
+        self,
+        key: str,
+    ) -> tuple[ToolResult[Any] | None, Future[ToolResult[Any]] | None, int | None]:
+        """
+        Look up a call to a cacheable tool.
+
+        Returns:
+            Tuple of (cached result, in-flight future, generation). On a
+            hit only the cached result is set. Otherwise the generation is
+            set when the caller leads the call and must run it, and None
+            when it should wait on the leader's future.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry.result, marker="cached"), None, None
+            if entry is not None:
+                del self._entries[key]
+
+            leader = self._in_flight.get(key)
+            if leader is not None:
+                self.coalesced += 1
+                return None, leader, None
+
+            future: Future[ToolResult[Any]] = Future()
+            self._in_flight[key] = future
+            self.misses += 1
+            return None, future, self._generation
+
+    def _abandon(self, key: str, future: Future[ToolResult[Any]], error: BaseException) -> None:
+        """Fail a call that raised, and the calls waiting on it."""
+        with self._lock:
+            del self._in_flight[key]
+        future.set_exception(error)
+
+    def _settle(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        key: str,
+        future: Future[ToolResult[Any]],
+        generation: int,
+        result: ToolResult[Any],
+    ) -> ToolResult[Any]:
+        """Store a call's result and hand it to waiting calls."""
+        tags = tool.cache_tags(**kwargs)
+        with self._lock:
+            del self._in_flight[key]
+            if result.is_success and generation == self._generation:
+                ttl = tool.cache_ttl if tool.cache_ttl is not None else self.default_ttl
+                self._entries[key] = _CacheEntry(
+                    result=self._copy(result),
+                    expires_at=time.monotonic() + ttl,
+                    tags=tags,
+                )
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        future.set_result(result)
+        return result
+
+    def _invalidate_for(self, tool: BaseTool, kwargs: dict[str, Any]) -> None:
+        """Drop the results a mutating call may have staled (even a failed one may have)."""
+        with self._lock:
+            self._invalidate(tool.cache_tags(**kwargs))
+
+    def invalidate(self, tags: set[str] | None = None) -> int:
+        """
+        Drop cached results.
+
+        Args:
+            tags: Resource tags to invalidate (None or empty drops everything)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._invalidate(tags or set())
+
+    def clear(self) -> None:
+        """Drop all cached results and reset statistics."""
+        with self._lock:
+            self._invalidate(set())
+            self.hits = self.misses = self.coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+    def _invalidate(self, tags: set[str]) -> int:
+        """Drop entries sharing a tag (all entries if tags is empty); caller holds the lock."""
+        self._generation += 1
+        if not tags:
+            removed = len(self._entries)
+            self._entries.clear()
+        else:
+            stale = [key for key, entry in self._entries.items() if entry.tags & tags]
+            for key in stale:
+                del self._entries[key]
+            removed = len(stale)
+
+        if removed:
+            logger.debug("tool_cache_invalidated", tags=sorted(tags), removed=removed)
+        return removed
+
+    @staticmethod
+    def _copy(result: ToolResult[Any], marker: str | None = None) -> ToolResult[Any]:
+        """Copy a result so callers cannot mutate the cached one, flagging reuse in metadata."""
+        copy = result.model_copy(deep=True)
+        if marker:
+            copy.metadata[marker] = True
+        return copy
@@ -0,0 +1,309 @@
+"""
+Provider Circuit Breakers.
+
+One breaker per provider (tool category) is shared by all of its tools.
+After repeated provider failures the breaker opens and calls fail fast
+with a retry-after hint instead of adding latency and burning rate limit
+against a degraded API; after a cool-down a few trial calls decide
+whether it closes again.
+"""
+
+import asyncio
+import threading
+import time
+from enum import Enum
+from typing import Any
+
+import structlog
+
+from pf_cicd_agent.audit.models import AuditEventCreate, AuditEventType, AuditSeverity
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.tools.base import ToolError
+
+
+logger = structlog.get_logger(__name__)
+
+# Tool categories that talk to an external provider
+PROVIDER_CATEGORIES = frozenset({"github", "digitalocean"})
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ToolError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+    def __init__(self, provider: str, retry_after: float) -> None:
+        super().__init__(
+            message=(
+                f"{provider} is failing; calls are paused for {retry_after:.1f}s "
+                "to let it recover"
+            ),
+            code="CIRCUIT_OPEN",
+            details={"provider": provider, "retry_after_seconds": round(retry_after, 1)},
+            retry_after=retry_after,
+        )
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one provider.
+
+    Only provider failures count: retryable errors (5xx, 429, timeouts)
+    and unexpected exceptions. A non-retryable error such as a 404 or 422
+    means the provider answered, so it counts as a success.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        audit_service: AuditService | None = None,
+    ) -> None:
+        """
+        Initialize the breaker.
+
+        Args:
+            provider: Provider name (tool category)
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before trial calls
+            half_open_max_calls: Concurrent trial calls allowed while half-open
+            audit_service: Optional audit service for state transitions
+        """
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._audit_service = audit_service
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open circuit reports half-open)."""
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._retry_after() <= 0:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or its trial calls are taken
+        """
+        self._emit(self._admit())
+
+    async def abefore_call(self) -> None:
+        """Async counterpart of before_call(), auditing off the event loop."""
+        await self._aemit(self._admit())
+
+    def record_success(self) -> None:
+        """Record a call the provider answered."""
+        self._emit(self._succeed())
+
+    async def arecord_success(self) -> None:
+        """Async counterpart of record_success(), auditing off the event loop."""
+        await self._aemit(self._succeed())
+
+    def release(self) -> None:
+        """
+        Record an admitted call that ended without reaching a verdict.
+
+        A call stopped by its own deadline or by the rate limiter says
+        nothing about the provider; a trial slot it held is freed.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def record_failure(self, error: str | None = None) -> None:
+        """
+        Record a provider failure.
+
+        Args:
+            error: Failure description for the audit log
+        """
+        self._emit(self._fail(error))
+
+    async def arecord_failure(self, error: str | None = None) -> None:
+        """Async counterpart of record_failure(), auditing off the event loop."""
+        await self._aemit(self._fail(error))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Breaker state for status output."""
+        state = self.state
+        with self._lock:
+            return {
+                "provider": self.provider,
+                "state": state.value,
+                "consecutive_failures": self._failures,
+                "retry_after_seconds": round(max(0.0, self._retry_after()), 1)
+                if state == CircuitState.OPEN
+                else None,
+            }
+
+    def _admit(self) -> AuditEventCreate | None:
+        """Admit a call; returns the audit record of a state change."""
+        transition = None
+        with self._lock:
+            if self._state == CircuitState.OPEN:
+                if self._retry_after() > 0:
+                    raise CircuitOpenError(self.provider, self._retry_after())
+                transition = self._transition(CircuitState.HALF_OPEN)
+
+            if self._state == CircuitState.HALF_OPEN:
+                if self._trial_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.provider, self.reset_timeout)
+                self._trial_calls += 1
+        return transition
+
+    def _succeed(self) -> AuditEventCreate | None:
+        """Record a success; returns the audit record of a state change."""
+        with self._lock:
+            self._failures = 0
+            if self._state == CircuitState.HALF_OPEN:
+                return self._transition(CircuitState.CLOSED)
+        return None
+
+    def _fail(self, error: str | None) -> AuditEventCreate | None:
+        """Record a failure; returns the audit record of a state change."""
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED and self._failures >= self.failure_threshold
+            ):
+                return self._transition(CircuitState.OPEN, error)
+        return None
+
+    def _emit(self, transition: AuditEventCreate | None) -> None:
+        """
+        Write the audit record of a state change.
+
+        Called once the lock is released, so callers waiting on the breaker
+        are not held up by the audit service's network write.
+        """
+        if transition is not None and self._audit_service:
+            self._audit_service.log_event(transition)
+
+    async def _aemit(self, transition: AuditEventCreate | None) -> None:
+        """Write the audit record of a state change from a worker thread."""
+        if transition is not None:
+            await asyncio.to_thread(self._emit, transition)
+
+    def _retry_after(self) -> float:
+        """Seconds until an open circuit admits trial calls; caller holds the lock."""
+        return self._opened_at + self.reset_timeout - time.monotonic()
+
+    def _transition(
+        self,
+        state: CircuitState,
+        error: str | None = None,
+    ) -> AuditEventCreate | None:
+        """
+        Change state and log the transition; caller holds the lock.
+
+        Returns:
+            Audit record of the transition for _emit(), or None without an audit service
+        """
+        previous = self._state
+        self._state = state
+        self._trial_calls = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.CLOSED:
+            self._failures = 0
+
+        log = logger.warning if state == CircuitState.OPEN else logger.info
+        log(
+            "circuit_state_changed",
+            provider=self.provider,
+            previous=previous.value,
+            state=state.value,
+            failures=self._failures,
+        )
+
+        if not self._audit_service:
+            return None
+        return AuditEventCreate(
+            event_type=AuditEventType.CIRCUIT_STATE_CHANGE,
+            action=f"circuit.{self.provider}.{state.value}",
+            description=f"{self.provider} circuit {previous.value} -> {state.value}",
+            severity=AuditSeverity.WARNING if state == CircuitState.OPEN else AuditSeverity.INFO,
+            metadata={
+                "provider": self.provider,
+                "previous_state": previous.value,
+                "state": state.value,
+                "consecutive_failures": self._failures,
+                "reset_timeout": self.reset_timeout,
+                "last_error": error,
+            },
+        )
+
+
+class CircuitBreakerBoard:
+    """The circuit breakers of all providers, created on first use."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        audit_service: AuditService | None = None,
+    ) -> None:
+        """
+        Initialize the board.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds a circuit stays open before trial calls
+            half_open_max_calls: Concurrent trial calls allowed while half-open
+            audit_service: Optional audit service for state transitions
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._audit_service = audit_service
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_provider(self, provider: str) -> CircuitBreaker | None:
+        """
+        Get the shared breaker for a provider.
+
+        Args:
+            provider: Tool category
+
+        Returns:
+            CircuitBreaker, or None if the category is not an external provider
+        """
+        if provider not in PROVIDER_CATEGORIES:
+            return None
+
+        with self._lock:
+            if provider not in self._breakers:
+                self._breakers[provider] = CircuitBreaker(
+                    provider,
+                    failure_threshold=self.failure_threshold,
+                    reset_timeout=self.reset_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                    audit_service=self._audit_service,
+                )
+            return self._breakers[provider]
+
+    def status(self) -> list[dict[str, Any]]:
+        """State of every breaker created so far."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.to_dict() for breaker in breakers]
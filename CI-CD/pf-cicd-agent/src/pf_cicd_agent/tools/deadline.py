@@ -0,0 +1,184 @@
+"""
+Tool Deadlines.
+
+A deadline is set around each tool execution and carried in a context
+variable, so provider clients, polling loops and SSH channels deep inside
+a tool can bound their waits by the time the call has left and stop
+cooperatively once it has run out.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a tool call runs past its deadline."""
+
+    code = "TIMEOUT"
+
+    def __init__(
+        self,
+        message: str,
+        timeout: float | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.timeout = timeout
+        self.retry_after = retry_after
+
+
+class Deadline:
+    """Point in time by which a tool call must finish."""
+
+    def __init__(self, seconds: float) -> None:
+        """
+        Initialize the deadline.
+
+        Args:
+            seconds: Time allowed from now
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+
+_current: ContextVar[Deadline | None] = ContextVar("tool_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """Get the deadline of the tool call running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline | None]:
+    """
+    Run a block under a deadline.
+
+    A nested scope can only shorten the enclosing deadline, so a per-call
+    limit set by the caller also bounds the tool's own timeout.
+
+    Args:
+        seconds: Time allowed for the block (None keeps the enclosing deadline)
+
+    Yields:
+        The effective deadline
+    """
+    enclosing = _current.get()
+    if seconds is None or (enclosing is not None and enclosing.remaining <= seconds):
+        yield enclosing
+        return
+
+    token = _current.set(Deadline(seconds))
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def remaining(default: float | None = None) -> float | None:
+    """
+    Get the time a blocking operation may take.
+
+    Args:
+        default: The operation's own timeout
+
+    Returns:
+        The smaller of the default and the time left on the deadline
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return default
+    if default is None:
+        return deadline.remaining
+    return min(default, deadline.remaining)
+
+
+def check(operation: str = "tool call") -> None:
+    """
+    Stop if the current deadline has passed.
+
+    Args:
+        operation: What was about to run, for the error message
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    deadline = _current.get()
+    if deadline is not None and deadline.expired:
+        raise DeadlineExceeded(
+            f"Deadline of {deadline.seconds:g}s exceeded before {operation}",
+            timeout=deadline.seconds,
+        )
+
+
+def sleep(seconds: float, operation: str = "tool call") -> None:
+    """
+    Sleep without overrunning the current deadline.
+
+    Args:
+        seconds: Desired sleep
+        operation: What the sleep is waiting for, for the error message
+
+    Raises:
+        DeadlineExceeded: If the deadline passes during the sleep
+    """
+    time.sleep(remaining(seconds) or 0.0)
+    check(operation)
+
+
+async def asleep(seconds: float, operation: str = "tool call") -> None:
+    """
+    Async counterpart of sleep().
+
+    Args:
+        seconds: Desired sleep
+        operation: What the sleep is waiting for, for the error message
+
+    Raises:
+        DeadlineExceeded: If the deadline passes during the sleep
+    """
+    await asyncio.sleep(remaining(seconds) or 0.0)
+    check(operation)
+
+
+@asynccontextmanager
+async def cancel_at_deadline(operation: str = "tool call") -> AsyncIterator[None]:
+    """
+    Cancel the awaited block when the current deadline passes.
+
+    Unlike the cooperative checks, this stops a coroutine that is blocked
+    on I/O. Work already offloaded to a thread keeps running until its
+    next check, but its result is no longer awaited.
+
+    Args:
+        operation: What the block runs, for the error message
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before the block finishes
+    """
+    deadline = _current.get()
+    timeout = asyncio.timeout(deadline.remaining if deadline is not None else None)
+    try:
+        async with timeout:
+            yield
+    except TimeoutError:
+        if deadline is None or not timeout.expired():
+            raise
+        raise DeadlineExceeded(
+            f"Deadline of {deadline.seconds:g}s exceeded during {operation}",
+            timeout=deadline.seconds,
+        ) from None
@@ -4,19 +4,38 @@ Bootstrap Droplet Tool.
 Implements WBS-2.3.4: Bootstrap droplet tool (SSH exec).
 """
 
+import codecs
+import select
+from collections import deque
 from typing import Any
 import time
 
 from pydantic import BaseModel, Field
 import paramiko
 
+from pf_cicd_agent.tools import deadline, progress
 from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+from pf_cicd_agent.tools.retry import NO_RETRY
 from pf_cicd_agent.tools.digitalocean.client import DOClient, DOClientError
 from pf_cicd_agent.audit.models import AuditEventType
 from pf_cicd_agent.audit.service import AuditService
 from pf_cicd_agent.config.settings import Settings
 
 
+# Allowance on top of the script timeout for the droplet to get an IP and
+# for SSH connection attempts
+SSH_SETUP_SECONDS = 300
+
+# Characters of script output kept for the result; every line is also
+# reported as a progress event while the script runs
+STDOUT_TAIL_CHARS = 10000
+STDERR_TAIL_CHARS = 5000
+
+# Longest partial line held back waiting for a newline
+MAX_LINE_CHARS = 4096
+
+
 class BootstrapDropletInput(BaseModel):
     """Input schema for bootstrap droplet tool."""
 
@@ -47,6 +66,48 @@ class BootstrapDropletOutput(BaseModel):
     duration_seconds: int
 
 
+class _OutputStream:
+    """
+    One stream of script output.
+
+    Splits the output into lines, reports each line as a progress event and
+    keeps only the tail for the result, so memory does not grow with the
+    script's output.
+    """
+
+    def __init__(self, name: str, tail_chars: int) -> None:
+        self.name = name
+        self.tail_chars = tail_chars
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+        self._tail: deque[str] = deque()
+        self._tail_length = 0
+
+    def feed(self, data: bytes) -> None:
+        """Add received bytes, reporting every completed line."""
+        *lines, self._partial = (self._partial + self._decoder.decode(data)).split("\n")
+        for line in lines:
+            self._emit(line, "\n")
+        if len(self._partial) > MAX_LINE_CHARS:
+            self._emit(self._partial, "")
+            self._partial = ""
+
+    def close(self) -> str:
+        """Report any unterminated last line and return the kept tail."""
+        rest = self._partial + self._decoder.decode(b"", final=True)
+        if rest:
+            self._emit(rest, "")
+        return "".join(self._tail)[-self.tail_chars:]
+
+    def _emit(self, line: str, end: str) -> None:
+        """Report a line and add it to the tail."""
+        progress.report("output", stream=self.name, line=line)
+        self._tail.append(line + end)
+        self._tail_length += len(line) + len(end)
+        while self._tail_length - len(self._tail[0]) >= self.tail_chars:
+            self._tail_length -= len(self._tail.popleft())
+
+
 class BootstrapDropletTool(BaseTool):
     """
     Tool for bootstrapping droplets via SSH.
@@ -64,16 +125,23 @@ and configure software. Commonly used for initial server setup."""
     category = "digitalocean"
     audit_event_type = AuditEventType.DROPLET_BOOTSTRAP
 
+    # Setup scripts are not idempotent; never re-run them automatically
+    retry_policy = NO_RETRY
+
+    writes = ("do:droplet:{droplet_id}", "do:droplet:{droplet_name}")
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        do_client: DOClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared DO client."""
         super().__init__(audit_service=audit_service)
-        self._do_client = DOClient(settings=settings)
+        self._do_client = do_client or DOClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -119,6 +187,10 @@ and configure software. Commonly used for initial server setup."""
             ],
         }
 
+    def call_timeout(self, **kwargs: Any) -> float | None:
+        """The script timeout plus time to reach the droplet and connect."""
+        return float(kwargs.get("timeout", 600)) + SSH_SETUP_SECONDS
+
     def _connect_ssh(
         self,
         ip_address: str,
@@ -147,6 +219,7 @@ and configure software. Commonly used for initial server setup."""
         last_error = None
 
         while attempts < (max_retries if retry else 1):
+            deadline.check(f"SSH connection to {ip_address}")
             try:
                 attempts += 1
                 self._logger.info(
@@ -154,6 +227,7 @@ and configure software. Commonly used for initial server setup."""
                     ip=ip_address,
                     attempt=attempts,
                 )
+                progress.report("ssh_connect", host=ip_address, attempt=attempts)
 
                 if key_path:
                     key = paramiko.RSAKey.from_private_key_file(key_path)
@@ -161,14 +235,14 @@ and configure software. Commonly used for initial server setup."""
                         hostname=ip_address,
                         username=username,
                         pkey=key,
-                        timeout=30,
+                        timeout=deadline.remaining(30),
                     )
                 else:
                     # Use SSH agent
                     client.connect(
                         hostname=ip_address,
                         username=username,
-                        timeout=30,
+                        timeout=deadline.remaining(30),
                         allow_agent=True,
                         look_for_keys=True,
                     )
@@ -185,7 +259,8 @@ and configure software. Commonly used for initial server setup."""
                     error=str(e),
                 )
                 if attempts < max_retries and retry:
-                    time.sleep(min(10 * attempts, 60))  # Exponential backoff
+                    # Exponential backoff
+                    deadline.sleep(min(10 * attempts, 60), f"SSH connection to {ip_address}")
 
         raise ToolError(
             message=f"Failed to connect via SSH after {attempts} attempts: {last_error}",
@@ -193,6 +268,42 @@ and configure software. Commonly used for initial server setup."""
             details={"ip": ip_address, "attempts": attempts},
         )
 
+    def _stream_output(
+        self,
+        channel: paramiko.Channel,
+        droplet_name: str,
+    ) -> tuple[int, str, str]:
+        """
+        Read a running command's output as it arrives.
+
+        Args:
+            channel: Channel of the command
+            droplet_name: Droplet name, for the error message
+
+        Returns:
+            Tuple of (exit code, stdout tail, stderr tail)
+
+        Raises:
+            DeadlineExceeded: If the command is still running at the deadline
+        """
+        stdout = _OutputStream("stdout", STDOUT_TAIL_CHARS)
+        stderr = _OutputStream("stderr", STDERR_TAIL_CHARS)
+
+        while True:
+            while channel.recv_ready():
+                stdout.feed(channel.recv(32768))
+            while channel.recv_stderr_ready():
+                stderr.feed(channel.recv_stderr(32768))
+            finished = channel.exit_status_ready() and (channel.eof_received or channel.closed)
+            if finished and not (channel.recv_ready() or channel.recv_stderr_ready()):
+                break
+
+            deadline.check(f"bootstrap script on {droplet_name} to finish")
+            # The channel is readable when either stream has data or at EOF
+            select.select([channel], [], [], deadline.remaining(1.0))
+
+        return channel.recv_exit_status(), stdout.close(), stderr.close()
+
     def execute(self, **kwargs: Any) -> ToolResult[BootstrapDropletOutput]:
         """
         Execute the bootstrap droplet tool.
@@ -212,17 +323,17 @@ and configure software. Commonly used for initial server setup."""
             elif input_data.droplet_name:
                 droplet = self._do_client.get_droplet_by_name(input_data.droplet_name)
                 if not droplet:
-                    return ToolResult.error(
+                    return ToolResult.failure(
                         error=f"Droplet '{input_data.droplet_name}' not found",
                         error_code="DROPLET_NOT_FOUND",
                     )
             else:
-                return ToolResult.error(
+                return ToolResult.failure(
                     error="Either droplet_id or droplet_name is required",
                     error_code="VALIDATION_ERROR",
                 )
         except DOClientError as e:
-            return ToolResult.error(error=e.message, error_code="DO_ERROR")
+            return ToolResult.failure(error=e.message, error_code="DO_ERROR")
 
         # Ensure droplet has IP
         if not droplet.ip_address:
@@ -248,15 +359,17 @@ and configure software. Commonly used for initial server setup."""
 
             stdin, stdout, stderr = ssh_client.exec_command(
                 input_data.bootstrap_script,
-                timeout=input_data.timeout,
+                timeout=deadline.remaining(input_data.timeout),
             )
 
-            # Wait for completion
-            exit_code = stdout.channel.recv_exit_status()
-            stdout_text = stdout.read().decode("utf-8", errors="replace")
-            stderr_text = stderr.read().decode("utf-8", errors="replace")
-
-            ssh_client.close()
+            # Stream output until completion, giving up (and closing the
+            # session) at the deadline
+            try:
+                exit_code, stdout_text, stderr_text = self._stream_output(
+                    stdout.channel, droplet.name
+                )
+            finally:
+                ssh_client.close()
 
             duration = int(time.time() - start_time)
 
@@ -272,8 +385,8 @@ and configure software. Commonly used for initial server setup."""
                 droplet_name=droplet.name,
                 ip_address=droplet.ip_address,
                 exit_code=exit_code,
-                stdout=stdout_text[-10000:] if len(stdout_text) > 10000 else stdout_text,
-                stderr=stderr_text[-5000:] if len(stderr_text) > 5000 else stderr_text,
+                stdout=stdout_text,
+                stderr=stderr_text,
                 duration_seconds=duration,
             )
 
@@ -289,7 +402,7 @@ and configure software. Commonly used for initial server setup."""
                     error=f"Script exited with code {exit_code}",
                 )
 
-        except ToolError:
+        except (ToolError, DeadlineExceeded):
             raise
         except Exception as e:
             raise ToolError(
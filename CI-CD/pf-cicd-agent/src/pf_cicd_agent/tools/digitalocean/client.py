@@ -4,17 +4,35 @@ Digital Ocean API Client.
 Implements WBS-2.3.1: Setup DO API client.
 """
 
-from typing import Any
-
+import asyncio
+import functools
+import json
+import threading
+import time
+from typing import Any, TypeVar
+from urllib.parse import urljoin
+
+import httpx
 import structlog
 import digitalocean
+import requests
 from digitalocean import Droplet, Firewall, Domain, Record
+from digitalocean.baseapi import BaseAPI, JSONReadError
 
 from pf_cicd_agent.config.settings import Settings, get_settings
+from pf_cicd_agent.tools import deadline, progress
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+from pf_cicd_agent.tools.http_clients import aclose_replaced
+from pf_cicd_agent.tools.rate_limit import MeteredAdapter, RateLimiter
+from pf_cicd_agent.tools.retry import is_transient_status
 
 
 logger = structlog.get_logger(__name__)
 
+API_URL = "https://api.digitalocean.com/v2"
+
+_API = TypeVar("_API", bound=BaseAPI)
+
 
 class DOClientError(Exception):
     """Custom exception for Digital Ocean client errors."""
@@ -28,28 +46,234 @@ class DOClientError(Exception):
         self.message = message
         self.details = details or {}
 
+    @property
+    def retryable(self) -> bool:
+        """
+        Whether the underlying failure was transient: a network error, a
+        non-JSON error page, or a 429/5xx status from the async API.
+        """
+        if is_transient_status(self.details.get("status_code")):
+            return True
+        cause = self.__cause__ or self.__context__
+        return isinstance(
+            cause,
+            (requests.ConnectionError, requests.Timeout, JSONReadError, httpx.TransportError),
+        )
+
 
 class DOClient:
     """
     Digital Ocean API client wrapper.
 
     Provides a simplified interface for common DO operations
-    used by the CI/CD agent.
+    used by the CI/CD agent. Operations have a blocking form built on
+    python-digitalocean and an async form (``a``-prefixed) that calls the
+    REST API directly over a pooled httpx client.
     """
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        pool_size: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """
         Initialize the Digital Ocean client.
 
+        One client is shared by all Digital Ocean tools; the HTTP session
+        and Manager are created on first use.
+
         Args:
             settings: Application settings
+            pool_size: Maximum pooled connections (defaults to the tool concurrency limit)
+            rate_limiter: Optional scheduler that paces requests against the quota
         """
         self.settings = settings or get_settings()
         self._token = self.settings.do_api_token.get_secret_value()
+        self._pool_size = pool_size or self.settings.agent_max_concurrent_tools
+        self.rate_limiter = rate_limiter
+        self._session: requests.Session | None = None
+        self._manager: digitalocean.Manager | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the pooled HTTP session shared by the API objects this client creates."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.mount(
+                    API_URL,
+                    MeteredAdapter(
+                        timeout=self.settings.tool_request_timeout_seconds,
+                        rate_limiter=self.rate_limiter,
+                        pool_maxsize=self._pool_size,
+                    ),
+                )
+                self._session = session
+        return self._session
+
+    async def aclient(self) -> httpx.AsyncClient:
+        """
+        Get the httpx client for the async API.
+
+        Pooled connections belong to an event loop, so a client is created
+        for each loop that uses it, and the previous loop's client is closed.
+        """
+        loop = asyncio.get_running_loop()
+        replaced, replaced_loop = None, None
+        with self._lock:
+            if self._async_client is None or self._async_loop is not loop:
+                replaced, replaced_loop = self._async_client, self._async_loop
+                self._async_client = httpx.AsyncClient(
+                    base_url=API_URL,
+                    headers={"Authorization": f"Bearer {self._token}"},
+                    timeout=self.settings.tool_request_timeout_seconds,
+                    limits=httpx.Limits(max_connections=self._pool_size),
+                )
+                self._async_loop = loop
+            client = self._async_client
+        if replaced is not None:
+            await aclose_replaced(replaced, replaced_loop)
+        return client
+
+    def close(self) -> None:
+        """Close the pooled HTTP session's connections."""
+        with self._lock:
+            session, self._session, self._manager = self._session, None, None
+        if session is not None:
+            session.close()
+
+    async def aclose(self) -> None:
+        """Close the async API's connections."""
+        with self._lock:
+            client, self._async_client, self._async_loop = self._async_client, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        error: str = "Digital Ocean request failed",
+    ) -> Any:
+        """
+        Send a REST API request without blocking the event loop.
+
+        Requests are bounded by the tool call's deadline and paced by the
+        rate limiter, like those sent through the shared session.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. /droplets)
+            json: Optional JSON body
+            params: Optional query parameters
+            error: Prefix for the error message
+
+        Returns:
+            Decoded JSON response (None for an empty body)
+
+        Raises:
+            DOClientError: If the request fails or DO returns an error status
+        """
+        operation = f"{method} {path}"
+        deadline.check(operation)
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire()
+
+        client = await self.aclient()
+        try:
+            response = await client.request(
+                method,
+                path,
+                json=json,
+                params=params,
+                timeout=deadline.remaining(self.settings.tool_request_timeout_seconds),
+            )
+        except httpx.TransportError as e:
+            deadline.check(operation)
+            raise DOClientError(f"{error}: {e}") from e
+
+        if self.rate_limiter:
+            self.rate_limiter.update_from_headers(response.headers)
+
+        try:
+            data = response.json() if response.content else None
+        except ValueError:
+            data = None
+
+        if response.is_error:
+            message = data.get("message") if isinstance(data, dict) else None
+            raise DOClientError(
+                f"{error}: {message or response.reason_phrase}",
+                details={"status_code": response.status_code},
+            )
+        return data
+
+    @staticmethod
+    def public_ip(droplet: dict[str, Any]) -> str | None:
+        """
+        Get the public IPv4 address of a droplet.
+
+        Args:
+            droplet: Droplet (REST API representation)
+
+        Returns:
+            IP address, or None until one is assigned
+        """
+        for network in droplet.get("networks", {}).get("v4", []):
+            if network.get("type") == "public":
+                return network.get("ip_address")
+        return None
+
+    def _bind(self, api: _API) -> _API:
+        """
+        Send a python-digitalocean object's requests through the shared session.
+
+        The library gives every object, including those returned by Manager
+        lookups and listings, a session of its own, and sends POST and PATCH
+        with module-level ``requests`` functions, so its requests would
+        bypass the session's MeteredAdapter. The object's request method is
+        replaced to send every request, whatever its verb, over ``session``.
+
+        Args:
+            api: Object to bind
+
+        Returns:
+            The object
+        """
+        api.token = self._token
+        api.end_point = f"{API_URL}/"
+        api._session = self.session
+        api._BaseAPI__perform_request = functools.partial(self._perform_request, api)
+        return api
+
+    def _perform_request(
+        self,
+        api: BaseAPI,
+        url: str,
+        type: str = "GET",
+        params: dict[str, Any] | None = None,
+    ) -> requests.Response:
+        """Send a request of a bound object, as BaseAPI does but over the shared session."""
+        params = params or {}
+        payload = {"params": params} if type == "GET" else {"data": json.dumps(params)}
+        return self.session.request(
+            type,
+            urljoin(api.end_point, url),
+            headers={"Content-type": "application/json", "Authorization": f"Bearer {self._token}"},
+            **payload,
+        )
 
     def _get_manager(self) -> digitalocean.Manager:
-        """Get a DO Manager instance."""
-        return digitalocean.Manager(token=self._token)
+        """Get the shared DO Manager instance."""
+        if self._manager is None:
+            self._manager = self._bind(digitalocean.Manager(token=self._token))
+        return self._manager
 
     def get_droplet(self, droplet_id: int) -> Droplet:
         """
@@ -62,8 +286,11 @@ class DOClient:
             Droplet object
         """
         try:
-            manager = self._get_manager()
-            return manager.get_droplet(droplet_id)
+            droplet = self._bind(Droplet(id=droplet_id))
+            droplet.load()
+            return droplet
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to get droplet: {e}")
 
@@ -82,8 +309,10 @@ class DOClient:
             droplets = manager.get_all_droplets()
             for droplet in droplets:
                 if droplet.name == name:
-                    return droplet
+                    return self._bind(droplet)
             return None
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to find droplet: {e}")
 
@@ -118,7 +347,6 @@ class DOClient:
         """
         try:
             droplet = Droplet(
-                token=self._token,
                 name=name,
                 region=region or self.settings.do_region,
                 image=image or self.settings.do_default_image,
@@ -129,7 +357,7 @@ class DOClient:
                 tags=tags or [],
                 user_data=user_data,
             )
-            droplet.create()
+            self._bind(droplet).create()
 
             logger.info(
                 "droplet_created",
@@ -141,6 +369,8 @@ class DOClient:
 
             return droplet
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to create droplet: {e}")
 
@@ -155,11 +385,14 @@ class DOClient:
         Returns:
             Droplet with IP address
         """
-        import time
-
+        self._bind(droplet)
         start = time.time()
+        last_status = None
         while time.time() - start < timeout:
             droplet.load()
+            if droplet.status != last_status:
+                last_status = droplet.status
+                progress.report("droplet_status", droplet=droplet.name, status=droplet.status)
             if droplet.status == "active" and droplet.ip_address:
                 logger.info(
                     "droplet_active",
@@ -167,7 +400,7 @@ class DOClient:
                     ip=droplet.ip_address,
                 )
                 return droplet
-            time.sleep(5)
+            deadline.sleep(5, f"droplet {droplet.name} to become active")
 
         raise DOClientError(
             f"Timeout waiting for droplet {droplet.name} to be active",
@@ -189,6 +422,8 @@ class DOClient:
             droplet.destroy()
             logger.info("droplet_deleted", id=droplet_id)
             return True
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to delete droplet: {e}")
 
@@ -207,10 +442,12 @@ class DOClient:
             firewalls = manager.get_all_firewalls()
             for fw in firewalls:
                 if fw.id == firewall_id:
-                    return fw
+                    return self._bind(fw)
             raise DOClientError(f"Firewall {firewall_id} not found")
         except DOClientError:
             raise
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to get firewall: {e}")
 
@@ -266,18 +503,19 @@ class DOClient:
                 )
 
             firewall = Firewall(
-                token=self._token,
                 name=name,
                 inbound_rules=inbound,
                 outbound_rules=outbound,
                 droplet_ids=droplet_ids or [],
                 tags=tags or [],
             )
-            firewall.create()
+            self._bind(firewall).create()
 
             logger.info("firewall_created", name=name, id=firewall.id)
             return firewall
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to create firewall: {e}")
 
@@ -297,6 +535,8 @@ class DOClient:
             firewall.add_droplets([droplet_id])
             logger.info("droplet_added_to_firewall", firewall=firewall_id, droplet=droplet_id)
             return True
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to add droplet to firewall: {e}")
 
@@ -311,9 +551,11 @@ class DOClient:
             Domain object
         """
         try:
-            domain = Domain(token=self._token, name=domain_name)
+            domain = self._bind(Domain(name=domain_name))
             domain.load()
             return domain
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to get domain: {e}")
 
@@ -357,6 +599,8 @@ class DOClient:
 
             return record
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to create DNS record: {e}")
 
@@ -376,12 +620,14 @@ class DOClient:
             records = domain.get_records()
             for record in records:
                 if record.id == record_id:
-                    record.destroy()
+                    self._bind(record).destroy()
                     logger.info("dns_record_deleted", domain=domain_name, id=record_id)
                     return True
             raise DOClientError(f"Record {record_id} not found")
         except DOClientError:
             raise
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to delete DNS record: {e}")
 
@@ -397,8 +643,163 @@ class DOClient:
         """
         try:
             manager = self._get_manager()
-            if tag:
-                return manager.get_all_droplets(tag_name=tag)
-            return manager.get_all_droplets()
+            droplets = manager.get_all_droplets(tag_name=tag) if tag else manager.get_all_droplets()
+            return [self._bind(droplet) for droplet in droplets]
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise DOClientError(f"Failed to list droplets: {e}")
+
+    # -------------------------------------------------------------------------
+    # Async API
+    # -------------------------------------------------------------------------
+
+    async def aget_droplet_by_name(self, name: str) -> dict[str, Any] | None:
+        """Async counterpart of get_droplet_by_name()."""
+        page = 1
+        while True:
+            data = await self.arequest(
+                "GET",
+                "/droplets",
+                params={"page": page, "per_page": 200},
+                error="Failed to find droplet",
+            )
+            for droplet in data.get("droplets", []):
+                if droplet["name"] == name:
+                    return droplet
+            if not data.get("links", {}).get("pages", {}).get("next"):
+                return None
+            page += 1
+
+    async def acreate_droplet(
+        self,
+        name: str,
+        size: str = "s-1vcpu-1gb",
+        region: str | None = None,
+        image: str | None = None,
+        ssh_keys: list[str] | None = None,
+        backups: bool = False,
+        monitoring: bool = True,
+        tags: list[str] | None = None,
+        user_data: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of create_droplet().
+
+        Returns:
+            Created droplet (REST API representation)
+        """
+        payload: dict[str, Any] = {
+            "name": name,
+            "region": region or self.settings.do_region,
+            "size": size,
+            "image": image or self.settings.do_default_image,
+            "ssh_keys": ssh_keys or [self.settings.do_ssh_key_fingerprint],
+            "backups": backups,
+            "monitoring": monitoring,
+            "tags": tags or [],
+        }
+        if user_data:
+            payload["user_data"] = user_data
+
+        data = await self.arequest(
+            "POST", "/droplets", json=payload, error="Failed to create droplet"
+        )
+        droplet = data["droplet"]
+
+        logger.info(
+            "droplet_created",
+            name=name,
+            id=droplet["id"],
+            region=payload["region"],
+            size=size,
+        )
+        return droplet
+
+    async def await_droplet_active(
+        self,
+        droplet: dict[str, Any],
+        timeout: int = 300,
+    ) -> dict[str, Any]:
+        """Async counterpart of wait_for_droplet()."""
+        start = time.time()
+        last_status = None
+        while time.time() - start < timeout:
+            data = await self.arequest(
+                "GET", f"/droplets/{droplet['id']}", error="Failed to get droplet"
+            )
+            droplet = data["droplet"]
+            if droplet["status"] != last_status:
+                last_status = droplet["status"]
+                progress.report("droplet_status", droplet=droplet["name"], status=last_status)
+            ip_address = self.public_ip(droplet)
+            if droplet["status"] == "active" and ip_address:
+                logger.info("droplet_active", name=droplet["name"], ip=ip_address)
+                return droplet
+            await deadline.asleep(5, f"droplet {droplet['name']} to become active")
+
+        raise DOClientError(
+            f"Timeout waiting for droplet {droplet['name']} to be active",
+            details={"status": droplet["status"], "timeout": timeout},
+        )
+
+    async def acreate_firewall(
+        self,
+        name: str,
+        inbound_rules: list[dict[str, Any]],
+        outbound_rules: list[dict[str, Any]],
+        droplet_ids: list[int] | None = None,
+        tags: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of create_firewall().
+
+        Returns:
+            Created firewall (REST API representation)
+        """
+        data = await self.arequest(
+            "POST",
+            "/firewalls",
+            json={
+                "name": name,
+                "inbound_rules": inbound_rules,
+                "outbound_rules": outbound_rules,
+                "droplet_ids": droplet_ids or [],
+                "tags": tags or [],
+            },
+            error="Failed to create firewall",
+        )
+        firewall = data["firewall"]
+
+        logger.info("firewall_created", name=name, id=firewall["id"])
+        return firewall
+
+    async def acreate_dns_record(
+        self,
+        domain_name: str,
+        record_type: str,
+        name: str,
+        data: str,
+        ttl: int = 3600,
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of create_dns_record().
+
+        Returns:
+            Created record (REST API representation)
+        """
+        response = await self.arequest(
+            "POST",
+            f"/domains/{domain_name}/records",
+            json={"type": record_type, "name": name, "data": data, "ttl": ttl},
+            error="Failed to create DNS record",
+        )
+
+        logger.info(
+            "dns_record_created",
+            domain=domain_name,
+            type=record_type,
+            name=name,
+            data=data,
+        )
+        return response["domain_record"]
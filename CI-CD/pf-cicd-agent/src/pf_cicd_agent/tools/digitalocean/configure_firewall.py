@@ -9,6 +9,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
+from pf_cicd_agent.tools.retry import NO_RETRY
 from pf_cicd_agent.tools.digitalocean.client import DOClient, DOClientError
 from pf_cicd_agent.audit.models import AuditEventType
 from pf_cicd_agent.audit.service import AuditService
@@ -78,16 +79,23 @@ with port ranges and CIDR address blocks."""
     category = "digitalocean"
     audit_event_type = AuditEventType.FIREWALL_CONFIGURE
 
+    # Creates are not idempotent; a retry could duplicate the resource
+    retry_policy = NO_RETRY
+
+    writes = ("do:firewall:{name}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        do_client: DOClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared DO client."""
         super().__init__(audit_service=audit_service)
-        self._do_client = DOClient(settings=settings)
+        self._do_client = do_client or DOClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -173,23 +181,7 @@ with port ranges and CIDR address blocks."""
         input_data = ConfigureFirewallInput(**kwargs)
 
         try:
-            # Convert rules to format expected by client
-            inbound = [
-                {
-                    "protocol": rule.protocol,
-                    "ports": rule.ports,
-                    "sources": {"addresses": rule.addresses},
-                }
-                for rule in input_data.inbound_rules
-            ]
-            outbound = [
-                {
-                    "protocol": rule.protocol,
-                    "ports": rule.ports,
-                    "destinations": {"addresses": rule.addresses},
-                }
-                for rule in input_data.outbound_rules
-            ]
+            inbound, outbound = self._rules(input_data)
 
             # Create the firewall
             firewall = self._do_client.create_firewall(
@@ -199,24 +191,79 @@ with port ranges and CIDR address blocks."""
                 droplet_ids=input_data.droplet_ids,
                 tags=input_data.tags,
             )
+            return self._success(input_data, firewall.id, firewall.name)
 
-            output = ConfigureFirewallOutput(
-                id=firewall.id,
-                name=firewall.name,
-                inbound_rules_count=len(input_data.inbound_rules),
-                outbound_rules_count=len(input_data.outbound_rules),
-                droplet_ids=input_data.droplet_ids,
-                status="active",
+        except DOClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="DO_ERROR",
+                details=e.details,
+                retryable=e.retryable,
             )
 
-            return ToolResult.success(
-                data=output.model_dump(),
-                message=f"Firewall '{firewall.name}' configured successfully",
+    async def aexecute(self, **kwargs: Any) -> ToolResult[ConfigureFirewallOutput]:
+        """Async counterpart of execute() using the async Digital Ocean API."""
+        input_data = ConfigureFirewallInput(**kwargs)
+
+        try:
+            inbound, outbound = self._rules(input_data)
+            firewall = await self._do_client.acreate_firewall(
+                name=input_data.name,
+                inbound_rules=inbound,
+                outbound_rules=outbound,
+                droplet_ids=input_data.droplet_ids,
+                tags=input_data.tags,
             )
+            return self._success(input_data, firewall["id"], firewall["name"])
 
         except DOClientError as e:
             raise ToolError(
                 message=e.message,
                 code="DO_ERROR",
                 details=e.details,
+                retryable=e.retryable,
             )
+
+    @staticmethod
+    def _rules(
+        input_data: ConfigureFirewallInput,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Convert rules to the format expected by the client."""
+        inbound = [
+            {
+                "protocol": rule.protocol,
+                "ports": rule.ports,
+                "sources": {"addresses": rule.addresses},
+            }
+            for rule in input_data.inbound_rules
+        ]
+        outbound = [
+            {
+                "protocol": rule.protocol,
+                "ports": rule.ports,
+                "destinations": {"addresses": rule.addresses},
+            }
+            for rule in input_data.outbound_rules
+        ]
+        return inbound, outbound
+
+    def _success(
+        self,
+        input_data: ConfigureFirewallInput,
+        firewall_id: str,
+        firewall_name: str,
+    ) -> ToolResult[ConfigureFirewallOutput]:
+        """Build the result of a successful call."""
+        output = ConfigureFirewallOutput(
+            id=firewall_id,
+            name=firewall_name,
+            inbound_rules_count=len(input_data.inbound_rules),
+            outbound_rules_count=len(input_data.outbound_rules),
+            droplet_ids=input_data.droplet_ids,
+            status="active",
+        )
+
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=f"Firewall '{firewall_name}' configured successfully",
+        )
@@ -9,6 +9,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
+from pf_cicd_agent.tools.retry import NO_RETRY
 from pf_cicd_agent.tools.digitalocean.client import DOClient, DOClientError
 from pf_cicd_agent.audit.models import AuditEventType
 from pf_cicd_agent.audit.service import AuditService
@@ -57,16 +58,24 @@ The domain must already exist and be managed by Digital Ocean."""
     category = "digitalocean"
     audit_event_type = AuditEventType.DNS_CREATE
 
+    # Creates are not idempotent; a retry could duplicate the resource
+    retry_policy = NO_RETRY
+
+    reads = ("do:domain:{domain}",)
+    writes = ("do:domain:{domain}:record:{name}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        do_client: DOClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared DO client."""
         super().__init__(audit_service=audit_service)
-        self._do_client = DOClient(settings=settings)
+        self._do_client = do_client or DOClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -137,7 +146,7 @@ The domain must already exist and be managed by Digital Ocean."""
         # Validate input
         errors = self.validate_input(**kwargs)
         if errors:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error="; ".join(errors),
                 error_code="VALIDATION_ERROR",
             )
@@ -154,30 +163,68 @@ The domain must already exist and be managed by Digital Ocean."""
                 ttl=input_data.ttl,
             )
 
-            # Build FQDN
-            if input_data.name == "@":
-                fqdn = input_data.domain
-            else:
-                fqdn = f"{input_data.name}.{input_data.domain}"
+            return self._success(input_data, record.id if hasattr(record, "id") else 0)
+
+        except DOClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="DO_ERROR",
+                details=e.details,
+                retryable=e.retryable,
+            )
 
-            output = CreateDNSRecordOutput(
-                id=record.id if hasattr(record, "id") else 0,
-                domain=input_data.domain,
+    async def aexecute(self, **kwargs: Any) -> ToolResult[CreateDNSRecordOutput]:
+        """Async counterpart of execute() using the async Digital Ocean API."""
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
+            )
+
+        input_data = CreateDNSRecordInput(**kwargs)
+
+        try:
+            record = await self._do_client.acreate_dns_record(
+                domain_name=input_data.domain,
                 record_type=input_data.record_type,
                 name=input_data.name,
                 data=input_data.data,
                 ttl=input_data.ttl,
-                fqdn=fqdn,
-            )
-
-            return ToolResult.success(
-                data=output.model_dump(),
-                message=f"DNS record created: {input_data.record_type} {fqdn} -> {input_data.data}",
             )
+            return self._success(input_data, record["id"])
 
         except DOClientError as e:
             raise ToolError(
                 message=e.message,
                 code="DO_ERROR",
                 details=e.details,
+                retryable=e.retryable,
             )
+
+    def _success(
+        self,
+        input_data: CreateDNSRecordInput,
+        record_id: int,
+    ) -> ToolResult[CreateDNSRecordOutput]:
+        """Build the result of a successful call."""
+        # Build FQDN
+        if input_data.name == "@":
+            fqdn = input_data.domain
+        else:
+            fqdn = f"{input_data.name}.{input_data.domain}"
+
+        output = CreateDNSRecordOutput(
+            id=record_id,
+            domain=input_data.domain,
+            record_type=input_data.record_type,
+            name=input_data.name,
+            data=input_data.data,
+            ttl=input_data.ttl,
+            fqdn=fqdn,
+        )
+
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=f"DNS record created: {input_data.record_type} {fqdn} -> {input_data.data}",
+        )
@@ -9,6 +9,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
+from pf_cicd_agent.tools.retry import NO_RETRY
 from pf_cicd_agent.tools.digitalocean.client import DOClient, DOClientError
 from pf_cicd_agent.audit.models import AuditEventType
 from pf_cicd_agent.audit.service import AuditService
@@ -58,16 +59,23 @@ Supports various sizes, regions, and can include cloud-init scripts."""
     category = "digitalocean"
     audit_event_type = AuditEventType.DROPLET_CREATE
 
+    # Creates are not idempotent; a retry could duplicate the resource
+    retry_policy = NO_RETRY
+
+    writes = ("do:droplet:{name}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        do_client: DOClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared DO client."""
         super().__init__(audit_service=audit_service)
-        self._do_client = DOClient(settings=settings)
+        self._do_client = do_client or DOClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -149,7 +157,7 @@ Supports various sizes, regions, and can include cloud-init scripts."""
         # Validate input
         errors = self.validate_input(**kwargs)
         if errors:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error="; ".join(errors),
                 error_code="VALIDATION_ERROR",
             )
@@ -159,7 +167,7 @@ Supports various sizes, regions, and can include cloud-init scripts."""
         # Check if droplet with same name exists
         existing = self._do_client.get_droplet_by_name(input_data.name)
         if existing:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Droplet with name '{input_data.name}' already exists",
                 error_code="DROPLET_EXISTS",
             )
@@ -202,4 +210,63 @@ Supports various sizes, regions, and can include cloud-init scripts."""
                 message=e.message,
                 code="DO_ERROR",
                 details=e.details,
+                retryable=e.retryable,
+            )
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[CreateDropletOutput]:
+        """Async counterpart of execute() using the async Digital Ocean API."""
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
+            )
+
+        input_data = CreateDropletInput(**kwargs)
+
+        try:
+            existing = await self._do_client.aget_droplet_by_name(input_data.name)
+            if existing:
+                return ToolResult.failure(
+                    error=f"Droplet with name '{input_data.name}' already exists",
+                    error_code="DROPLET_EXISTS",
+                )
+
+            droplet = await self._do_client.acreate_droplet(
+                name=input_data.name,
+                size=input_data.size,
+                region=input_data.region,
+                image=input_data.image,
+                backups=input_data.backups,
+                monitoring=input_data.monitoring,
+                tags=input_data.tags,
+                user_data=input_data.user_data,
+            )
+
+            if input_data.wait_for_active:
+                droplet = await self._do_client.await_droplet_active(droplet)
+
+            ip_address = self._do_client.public_ip(droplet)
+            output = CreateDropletOutput(
+                id=droplet["id"],
+                name=droplet["name"],
+                ip_address=ip_address,
+                status=droplet["status"],
+                region=droplet["region"]["slug"],
+                size=droplet["size_slug"],
+                image=droplet["image"]["slug"],
+                tags=droplet["tags"],
+            )
+
+            return ToolResult.success(
+                data=output.model_dump(),
+                message=f"Droplet '{output.name}' created successfully (IP: {ip_address})",
+            )
+
+        except DOClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="DO_ERROR",
+                details=e.details,
+                retryable=e.retryable,
             )
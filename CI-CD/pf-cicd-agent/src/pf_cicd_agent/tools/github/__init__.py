@@ -5,7 +5,9 @@ from pf_cicd_agent.tools.github.create_repo import CreateRepoTool
 from pf_cicd_agent.tools.github.branch_protection import BranchProtectionTool
 from pf_cicd_agent.tools.github.create_environment import CreateEnvironmentTool
 from pf_cicd_agent.tools.github.set_secret import SetSecretTool
+from pf_cicd_agent.tools.github.set_secrets import SetSecretsTool
 from pf_cicd_agent.tools.github.create_workflow import CreateWorkflowTool
+from pf_cicd_agent.tools.github.check_repos import CheckReposTool
 
 __all__ = [
     "GitHubClient",
@@ -13,5 +15,7 @@ __all__ = [
     "BranchProtectionTool",
     "CreateEnvironmentTool",
     "SetSecretTool",
+    "SetSecretsTool",
     "CreateWorkflowTool",
+    "CheckReposTool",
 ]
@@ -64,16 +64,22 @@ to protect important branches like main and develop."""
     category = "github"
     audit_event_type = AuditEventType.BRANCH_PROTECTION_SET
 
+    # Shares the branch key with create_workflow: protection can block later commits
+    reads = ("github:repo:{repo_name}",)
+    writes = ("github:repo:{repo_name}:branch:{branch}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared GitHub client."""
         super().__init__(audit_service=audit_service)
-        self._github_client = GitHubClient(settings=settings)
+        self._github_client = github_client or GitHubClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -133,13 +139,13 @@ to protect important branches like main and develop."""
 
         # Check repo exists
         if not self._github_client.repo_exists(input_data.repo_name):
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Repository '{input_data.repo_name}' not found",
                 error_code="REPO_NOT_FOUND",
             )
 
         try:
-            result = self._github_client.set_branch_protection(
+            self._github_client.set_branch_protection(
                 repo_name=input_data.repo_name,
                 branch=input_data.branch,
                 required_approving_review_count=input_data.required_reviews,
@@ -148,23 +154,59 @@ to protect important branches like main and develop."""
                 required_status_checks=input_data.required_status_checks,
                 enforce_admins=input_data.enforce_admins,
             )
+            return self._success(input_data)
+
+        except GitHubClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="GITHUB_ERROR",
+                details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
+            )
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[BranchProtectionOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        input_data = BranchProtectionInput(**kwargs)
+
+        if not await self._github_client.arepo_exists(input_data.repo_name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.repo_name}' not found",
+                error_code="REPO_NOT_FOUND",
+            )
 
-            output = BranchProtectionOutput(
+        try:
+            await self._github_client.aset_branch_protection(
                 repo_name=input_data.repo_name,
                 branch=input_data.branch,
-                required_reviews=input_data.required_reviews,
-                status_checks=input_data.required_status_checks,
+                required_approving_review_count=input_data.required_reviews,
+                dismiss_stale_reviews=input_data.dismiss_stale_reviews,
+                require_code_owner_reviews=input_data.require_code_owner_reviews,
+                required_status_checks=input_data.required_status_checks,
                 enforce_admins=input_data.enforce_admins,
             )
-
-            return ToolResult.success(
-                data=output.model_dump(),
-                message=f"Branch protection configured for {input_data.repo_name}:{input_data.branch}",
-            )
+            return self._success(input_data)
 
         except GitHubClientError as e:
             raise ToolError(
                 message=e.message,
                 code="GITHUB_ERROR",
                 details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
             )
+
+    def _success(self, input_data: BranchProtectionInput) -> ToolResult[BranchProtectionOutput]:
+        """Build the result of a successful call."""
+        output = BranchProtectionOutput(
+            repo_name=input_data.repo_name,
+            branch=input_data.branch,
+            required_reviews=input_data.required_reviews,
+            status_checks=input_data.required_status_checks,
+            enforce_admins=input_data.enforce_admins,
+        )
+
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=f"Branch protection configured for {input_data.repo_name}:{input_data.branch}",
+        )
@@ -0,0 +1,325 @@
+"""
+Check Repos Tool.
+
+Reports the state of many repositories (existence, default branch, branch
+protection, environments) from one bulk GraphQL read and flags drift from
+the expected configuration.
+"""
+
+from fnmatch import fnmatchcase
+from typing import Any, Iterable
+
+from pydantic import BaseModel, Field
+
+from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
+from pf_cicd_agent.tools.github.client import GitHubClient, GitHubClientError
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.config.settings import Settings
+
+
+class ExpectedProtection(BaseModel):
+    """Expected branch protection; unset fields are not checked."""
+
+    required_reviews: int | None = Field(default=None, ge=0, le=6)
+    dismiss_stale_reviews: bool | None = None
+    require_code_owner_reviews: bool | None = None
+    required_status_checks: list[str] | None = None
+    enforce_admins: bool | None = None
+
+
+class CheckReposInput(BaseModel):
+    """Input schema for check repos tool."""
+
+    repo_names: list[str] | None = Field(
+        default=None, description="Repositories to check (all of the organization if omitted)"
+    )
+    include_archived: bool = Field(
+        default=False, description="Include archived repositories in organization-wide checks"
+    )
+    default_branch: str | None = Field(default=None, description="Expected default branch")
+    branch_protection: dict[str, ExpectedProtection] = Field(
+        default_factory=dict, description="Expected protection by branch"
+    )
+    environments: list[str] = Field(
+        default_factory=list, description="Environments every repository should have"
+    )
+
+
+class RepoReport(BaseModel):
+    """State and drift of one repository."""
+
+    repo_name: str
+    exists: bool
+    archived: bool = False
+    default_branch: str | None = None
+    protected_branches: list[str] = Field(default_factory=list)
+    environments: list[str] = Field(default_factory=list)
+    drift: list[str] = Field(default_factory=list)
+
+
+class CheckReposOutput(BaseModel):
+    """Output schema for check repos tool."""
+
+    repos: list[RepoReport]
+    checked: int
+    drifted: int
+    missing: int
+
+
+def matching_rule(branch: str, patterns: Iterable[str]) -> str | None:
+    """
+    Find the protection rule pattern that applies to a branch.
+
+    A rule naming the branch exactly wins; otherwise the most specific
+    matching pattern does: the one with the most literal characters, then
+    the fewest wildcards (``release/v1.*`` over ``release/*`` over ``*``).
+
+    Args:
+        branch: Branch name
+        patterns: Rule patterns of the repository
+
+    Returns:
+        Pattern of the applicable rule, or None if no rule matches
+    """
+    patterns = list(patterns)
+    if branch in patterns:
+        return branch
+    matches = [pattern for pattern in patterns if fnmatchcase(branch, pattern)]
+
+    def specificity(pattern: str) -> tuple[int, int]:
+        wildcards = sum(pattern.count(c) for c in "*?[")
+        literals = sum(c not in "*?[]" for c in pattern)
+        return literals, -wildcards
+
+    return max(matches, key=specificity, default=None)
+
+
+def find_drift(state: dict[str, Any], expected: CheckReposInput) -> list[str]:
+    """
+    Compare a repository's state with the expected configuration.
+
+    Args:
+        state: Repository state from GitHubClient.repos_state()
+        expected: Expected configuration
+
+    Returns:
+        Human-readable differences (empty if none)
+    """
+    drift = []
+
+    if expected.default_branch and state["default_branch"] != expected.default_branch:
+        drift.append(
+            f"default branch is '{state['default_branch']}', expected '{expected.default_branch}'"
+        )
+
+    rules = state["branch_protection"]
+    for branch, protection in expected.branch_protection.items():
+        pattern = matching_rule(branch, rules)
+        if pattern is None:
+            drift.append(f"branch '{branch}' is not protected")
+            continue
+
+        rule = rules[pattern]
+        if (
+            protection.required_reviews is not None
+            and rule["required_reviews"] < protection.required_reviews
+        ):
+            drift.append(
+                f"branch '{branch}' requires {rule['required_reviews']} reviews, "
+                f"expected {protection.required_reviews}"
+            )
+        if protection.required_status_checks is not None:
+            missing = sorted(
+                set(protection.required_status_checks) - set(rule["required_status_checks"])
+            )
+            if missing:
+                drift.append(f"branch '{branch}' does not require checks {', '.join(missing)}")
+        for field in ("dismiss_stale_reviews", "require_code_owner_reviews", "enforce_admins"):
+            wanted = getattr(protection, field)
+            if wanted is not None and rule[field] != wanted:
+                drift.append(f"branch '{branch}' has {field}={rule[field]}, expected {wanted}")
+
+    for environment in expected.environments:
+        if environment not in state["environments"]:
+            drift.append(f"environment '{environment}' is missing")
+
+    return drift
+
+
+class CheckReposTool(BaseTool):
+    """
+    Tool for reporting and checking the state of many repositories.
+
+    Reads all repositories with a few GraphQL queries instead of several
+    REST calls per repository, so it suits fleet-wide reports and drift
+    checks before or after provisioning.
+    """
+
+    name = "check_repos"
+    description = """Report the state of many GitHub repositories and check them for drift.
+
+Returns each repository's default branch, protected branches and
+environments, read in bulk. Give the expected default branch, branch
+protection and environments to list where repositories differ from them.
+Checks all repositories of the organization when repo_names is omitted."""
+    version = "1.0.0"
+    category = "github"
+    cacheable = True
+
+    def __init__(
+        self,
+        audit_service: AuditService | None = None,
+        settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
+    ) -> None:
+        """Initialize the tool, optionally with a shared GitHub client."""
+        super().__init__(audit_service=audit_service)
+        self._github_client = github_client or GitHubClient(settings=settings)
+
+    def cache_tags(self, **kwargs: Any) -> set[str]:
+        """
+        Tag calls with the repositories they read.
+
+        An organization-wide report cannot be tagged with the repositories
+        it will find, so it is tagged ``github:org``, which every GitHub
+        repository change invalidates as well.
+        """
+        return {f"github:repo:{name}" for name in kwargs.get("repo_names") or []} or {
+            "github:org"
+        }
+
+    def resource_access(self, **kwargs: Any) -> tuple[set[str], set[str]]:
+        """Read the named repositories (an organization-wide read takes no locks)."""
+        return {f"github:repo:{name}" for name in kwargs.get("repo_names") or []}, set()
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        """Get JSON schema for tool input."""
+        return {
+            "type": "object",
+            "properties": {
+                "repo_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Repositories to check (all of the organization if omitted)",
+                },
+                "include_archived": {
+                    "type": "boolean",
+                    "description": "Include archived repositories in organization-wide checks",
+                    "default": False,
+                },
+                "default_branch": {
+                    "type": "string",
+                    "description": "Expected default branch (e.g., main)",
+                },
+                "branch_protection": {
+                    "type": "object",
+                    "description": (
+                        "Expected protection by branch name; only the given fields are checked"
+                    ),
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "required_reviews": {"type": "integer", "minimum": 0, "maximum": 6},
+                            "dismiss_stale_reviews": {"type": "boolean"},
+                            "require_code_owner_reviews": {"type": "boolean"},
+                            "required_status_checks": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            },
+                            "enforce_admins": {"type": "boolean"},
+                        },
+                    },
+                },
+                "environments": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Environments every repository should have",
+                },
+            },
+        }
+
+    def execute(self, **kwargs: Any) -> ToolResult[CheckReposOutput]:
+        """
+        Execute the check repos tool.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult with the state and drift of each repository
+        """
+        input_data = CheckReposInput(**kwargs)
+
+        try:
+            states = self._github_client.repos_state(input_data.repo_names)
+        except GitHubClientError as e:
+            raise self._tool_error(e)
+
+        return self._report(input_data, states)
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[CheckReposOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        input_data = CheckReposInput(**kwargs)
+
+        try:
+            states = await self._github_client.arepos_state(input_data.repo_names)
+        except GitHubClientError as e:
+            raise self._tool_error(e)
+
+        return self._report(input_data, states)
+
+    @staticmethod
+    def _tool_error(e: GitHubClientError) -> ToolError:
+        """Convert a client error."""
+        return ToolError(
+            message=e.message,
+            code="GITHUB_ERROR",
+            details={"status_code": e.status_code},
+            retryable=e.retryable,
+            retry_after=e.retry_after,
+        )
+
+    def _report(
+        self,
+        input_data: CheckReposInput,
+        states: dict[str, dict[str, Any] | None],
+    ) -> ToolResult[CheckReposOutput]:
+        """Build the report from the repository states."""
+        reports = []
+        for name, state in states.items():
+            if state is None:
+                reports.append(
+                    RepoReport(repo_name=name, exists=False, drift=["repository does not exist"])
+                )
+                continue
+            # Archived repositories are left out of organization-wide reports
+            organization_wide = input_data.repo_names is None
+            if state["archived"] and organization_wide and not input_data.include_archived:
+                continue
+            reports.append(
+                RepoReport(
+                    repo_name=name,
+                    exists=True,
+                    archived=state["archived"],
+                    default_branch=state["default_branch"],
+                    protected_branches=sorted(state["branch_protection"]),
+                    environments=state["environments"],
+                    drift=find_drift(state, input_data),
+                )
+            )
+
+        output = CheckReposOutput(
+            repos=reports,
+            checked=len(reports),
+            drifted=sum(1 for report in reports if report.drift),
+            missing=sum(1 for report in reports if not report.exists),
+        )
+
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=(
+                f"Checked {output.checked} repositories: {output.drifted} with drift"
+                + (f", {output.missing} missing" if output.missing else "")
+            ),
+        )
@@ -4,14 +4,30 @@ GitHub API Client.
 Implements WBS-2.2.1: Setup GitHub API client.
 """
 
-from typing import Any
-
+import asyncio
+import base64
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Mapping
+from urllib.parse import urlencode
+
+import httpx
+import requests
 import structlog
-from github import Github, GithubException
+from github import Github, GithubException, InputGitTreeElement
 from github.Repository import Repository
 from github.Organization import Organization
 
 from pf_cicd_agent.config.settings import Settings, get_settings
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.github import connection, http_cache
+from pf_cicd_agent.tools.github.http_cache import ConditionalCache
+from pf_cicd_agent.tools.http_clients import aclose_replaced
+from pf_cicd_agent.tools.rate_limit import RateLimiter
+from pf_cicd_agent.tools.retry import is_transient_status
 
 
 logger = structlog.get_logger(__name__)
@@ -25,11 +41,320 @@ class GitHubClientError(Exception):
         message: str,
         status_code: int | None = None,
         response: Any = None,
+        retry_after: float | None = None,
     ) -> None:
         super().__init__(message)
         self.message = message
         self.status_code = status_code
         self.response = response
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        """
+        Whether the request may succeed if retried: a 429/5xx status, a
+        rate-limit wait, or a network error.
+        """
+        if is_transient_status(self.status_code) or self.retry_after is not None:
+            return True
+        cause = self.__cause__ or self.__context__
+        return isinstance(cause, (requests.ConnectionError, requests.Timeout, httpx.TransportError))
+
+
+API_URL = "https://api.github.com"
+
+# Attempts at moving a branch to a new commit when other pushes race it
+COMMIT_ATTEMPTS = 3
+
+# Repositories looked up by name per GraphQL query (org listings page by 100)
+GRAPHQL_BATCH_SIZE = 50
+
+# State read for each repository by repos_state(); connections with more
+# entries than the first page are read to the end with the page queries below
+_RULE_STATE_FRAGMENT = """
+fragment RuleState on BranchProtectionRule {
+  pattern
+  requiresApprovingReviews
+  requiredApprovingReviewCount
+  dismissesStaleReviews
+  requiresCodeOwnerReviews
+  requiresStatusChecks
+  requiredStatusCheckContexts
+  isAdminEnforced
+}
+"""
+
+_REPO_STATE_FRAGMENT = """
+fragment RepoState on Repository {
+  name
+  isArchived
+  defaultBranchRef { name }
+  branchProtectionRules(first: 50) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ...RuleState }
+  }
+  environments(first: 50) {
+    pageInfo { hasNextPage endCursor }
+    nodes { name }
+  }
+}
+""" + _RULE_STATE_FRAGMENT
+
+# Follow-up page queries by nested repository connection
+_NESTED_PAGE_QUERIES = {
+    "branchProtectionRules": """
+query($org: String!, $name: String!, $cursor: String) {
+  repository(owner: $org, name: $name) {
+    branchProtectionRules(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...RuleState }
+    }
+  }
+}
+""" + _RULE_STATE_FRAGMENT,
+    "environments": """
+query($org: String!, $name: String!, $cursor: String) {
+  repository(owner: $org, name: $name) {
+    environments(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name }
+    }
+  }
+}
+""",
+}
+
+_ORG_REPOS_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor, orderBy: {field: NAME, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...RepoState }
+    }
+  }
+}
+""" + _REPO_STATE_FRAGMENT
+
+
+def _repos_query(count: int) -> str:
+    """GraphQL query for ``count`` repositories by name, aliased r0, r1, ..."""
+    params = ", ".join(f"$n{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $org, name: $n{i}) {{ ...RepoState }}" for i in range(count)
+    )
+    return f"query($org: String!, {params}) {{\n{fields}\n}}\n" + _REPO_STATE_FRAGMENT
+
+
+def _repo_state(node: dict[str, Any]) -> dict[str, Any]:
+    """
+    Flatten a RepoState GraphQL node.
+
+    Only the first page of the nested connections is included; see
+    _next_pages() and _add_page().
+
+    Args:
+        node: Repository node
+
+    Returns:
+        Repository state: name, archived, default branch, branch protection
+        rules by pattern (in the fields of configure_branch_protection) and
+        environment names
+    """
+    default_branch = node.get("defaultBranchRef")
+    state = {
+        "name": node["name"],
+        "archived": node["isArchived"],
+        "default_branch": default_branch["name"] if default_branch else None,
+        "branch_protection": {},
+        "environments": [],
+    }
+    for conn in _NESTED_PAGE_QUERIES:
+        _add_page(state, conn, node[conn])
+    return state
+
+
+def _add_page(state: dict[str, Any], conn: str, page: dict[str, Any]) -> None:
+    """Add a page of a nested connection (rules or environments) to a repository state."""
+    if conn == "environments":
+        state["environments"].extend(env["name"] for env in page["nodes"])
+        return
+    for rule in page["nodes"]:
+        state["branch_protection"][rule["pattern"]] = {
+            "required_reviews": (
+                (rule["requiredApprovingReviewCount"] or 0)
+                if rule["requiresApprovingReviews"]
+                else 0
+            ),
+            "dismiss_stale_reviews": rule["dismissesStaleReviews"],
+            "require_code_owner_reviews": rule["requiresCodeOwnerReviews"],
+            "required_status_checks": (
+                (rule["requiredStatusCheckContexts"] or [])
+                if rule["requiresStatusChecks"]
+                else []
+            ),
+            "enforce_admins": rule["isAdminEnforced"],
+        }
+
+
+def _next_pages(node: dict[str, Any]) -> dict[str, str]:
+    """End cursors of the nested connections of a repository node that have more pages."""
+    return {
+        conn: node[conn]["pageInfo"]["endCursor"]
+        for conn in _NESTED_PAGE_QUERIES
+        if node[conn]["pageInfo"]["hasNextPage"]
+    }
+
+
+def _graphql_data(response: dict[str, Any], error: str) -> dict[str, Any]:
+    """
+    Get the data of a GraphQL response.
+
+    A repository that does not exist is reported as a NOT_FOUND error next
+    to the data of the others and comes back as None; any other error fails
+    the query.
+
+    Raises:
+        GitHubClientError: If the response has errors other than NOT_FOUND
+    """
+    errors = [e for e in response.get("errors") or [] if e.get("type") != "NOT_FOUND"]
+    if errors:
+        rate_limited = any(e.get("type") == "RATE_LIMITED" for e in errors)
+        raise GitHubClientError(
+            f"{error}: {'; '.join(e.get('message', str(e)) for e in errors)}",
+            status_code=429 if rate_limited else None,
+        )
+    return response.get("data") or {}
+
+
+def _is_ref_race(status_code: int | None, message: str) -> bool:
+    """Whether a failed ref update lost a race with another push to the branch."""
+    return status_code == 422 and "fast forward" in message.lower()
+
+
+def _network_error(message: str, error: Exception) -> GitHubClientError:
+    """Wrap a network error, kept as the cause so the error is retryable."""
+    wrapped = GitHubClientError(f"{message}: {error}")
+    wrapped.__cause__ = error
+    return wrapped
+
+
+def _retry_after(error: GithubException) -> float | None:
+    """
+    Get the delay GitHub asked for before retrying, if any.
+
+    Args:
+        error: Exception raised by PyGithub
+
+    Returns:
+        Seconds to wait, or None
+    """
+    return _retry_after_from_headers(error.headers or {})
+
+
+def _retry_after_from_headers(response_headers: Mapping[str, str]) -> float | None:
+    """
+    Get the delay GitHub asked for in an error response, if any.
+
+    Uses the Retry-After header (secondary rate limits) or, when the primary
+    rate limit is exhausted, the time until X-RateLimit-Reset.
+
+    Args:
+        response_headers: Response headers
+
+    Returns:
+        Seconds to wait, or None
+    """
+    headers = {key.lower(): value for key, value in response_headers.items()}
+
+    if "retry-after" in headers:
+        try:
+            return float(headers["retry-after"])
+        except ValueError:
+            return None
+
+    if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+        try:
+            return max(0.0, float(headers["x-ratelimit-reset"]) - time.time())
+        except ValueError:
+            return None
+
+    return None
+
+
+def _sealed_box(public_key: str) -> Any:
+    """
+    Build the sealed box that encrypts values for a secrets public key.
+
+    Args:
+        public_key: Base64 repository or environment public key
+
+    Returns:
+        nacl SealedBox
+    """
+    from nacl import public
+
+    return public.SealedBox(public.PublicKey(base64.b64decode(public_key)))
+
+
+def _seal(box: Any, value: str) -> str:
+    """Encrypt a secret value for the GitHub secrets API (base64 ciphertext)."""
+    return base64.b64encode(box.encrypt(value.encode("utf-8"))).decode("utf-8")
+
+
+class _ObjectCache:
+    """
+    Cache of PyGithub objects, bounded by age and count.
+
+    The least recently used object is evicted when the cache is full.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an object is reused (0 disables the cache)
+            max_entries: Maximum cached objects
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        """Get a live object, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store an object, evicting the least recently used when full."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Drop an object."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
 
 
 class GitHubClient:
@@ -37,54 +362,387 @@ class GitHubClient:
     GitHub API client wrapper.
 
     Provides a simplified interface for common GitHub operations
-    used by the CI/CD agent.
+    used by the CI/CD agent. Operations have a blocking form built on
+    PyGithub and an async form (``a``-prefixed) that calls the REST API
+    directly over a pooled httpx client.
     """
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        pool_size: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """
         Initialize the GitHub client.
 
+        One client is shared by all GitHub tools; the PyGithub connection
+        pool is created on first use.
+
         Args:
             settings: Application settings
+            pool_size: Maximum pooled connections (defaults to the tool concurrency limit)
+            rate_limiter: Optional scheduler that paces requests against the quota
         """
         self.settings = settings or get_settings()
+        self._pool_size = pool_size or self.settings.agent_max_concurrent_tools
+        self.rate_limiter = rate_limiter
         self._client: Github | None = None
+        self._metered = False
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._objects = _ObjectCache(
+            ttl=self.settings.github_object_cache_ttl_seconds,
+            max_entries=self.settings.github_object_cache_max_entries,
+        )
+        self._sealed_boxes: dict[str, Any] = {}
+        self.http_cache: ConditionalCache | None = None
+        if self.settings.github_http_cache_enabled:
+            self.http_cache = ConditionalCache(
+                max_entries=self.settings.github_http_cache_max_entries,
+                path=self.settings.github_http_cache_path,
+            )
 
     @property
     def client(self) -> Github:
-        """Get the PyGithub client instance."""
-        if self._client is None:
-            self._client = Github(self.settings.github_token.get_secret_value())
-        return self._client
+        """
+        Get the PyGithub client instance.
+
+        Its requests go through a GitHubConnection, so every HTTP request,
+        including those of objects returned earlier and of paginated
+        lists, stops once the tool call has run past its deadline and waits
+        for its turn with the rate limiter. PyGithub's own retries are
+        disabled: they can sleep until a rate limit resets, and transient
+        errors are retried by BaseTool within the deadline.
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = Github(
+                    self.settings.github_token.get_secret_value(),
+                    timeout=int(self.settings.tool_request_timeout_seconds),
+                    retry=None,
+                    pool_size=self._pool_size,
+                )
+                self._metered = connection.install(
+                    self._client.requester, self.http_cache, self.rate_limiter
+                )
+            client = self._client
+
+        if not self._metered:
+            # Without the connection hook, meter the operation as a whole
+            deadline.check("GitHub API request")
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+        return client
+
+    async def aclient(self) -> httpx.AsyncClient:
+        """
+        Get the httpx client for the async API.
+
+        Pooled connections belong to an event loop, so a client is created
+        for each loop that uses it, and the previous loop's client is closed.
+        """
+        loop = asyncio.get_running_loop()
+        replaced, replaced_loop = None, None
+        with self._lock:
+            if self._async_client is None or self._async_loop is not loop:
+                replaced, replaced_loop = self._async_client, self._async_loop
+                self._async_client = httpx.AsyncClient(
+                    base_url=API_URL,
+                    headers={
+                        "Authorization": f"Bearer {self.settings.github_token.get_secret_value()}",
+                        "Accept": "application/vnd.github+json",
+                        "X-GitHub-Api-Version": "2022-11-28",
+                    },
+                    timeout=self.settings.tool_request_timeout_seconds,
+                    limits=httpx.Limits(max_connections=self._pool_size),
+                )
+                self._async_loop = loop
+            client = self._async_client
+        if replaced is not None:
+            await aclose_replaced(replaced, replaced_loop)
+        return client
+
+    def close(self) -> None:
+        """Close the PyGithub connections and the conditional request cache's store."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+
+    async def aclose(self) -> None:
+        """Close the async API's connections."""
+        with self._lock:
+            client, self._async_client, self._async_loop = self._async_client, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        error: str = "GitHub request failed",
+    ) -> Any:
+        """
+        Send a REST API request without blocking the event loop.
+
+        Requests are bounded by the tool call's deadline and paced by the
+        rate limiter, and GETs are revalidated against the conditional
+        request cache, like those sent through PyGithub.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. /repos/{owner}/{repo})
+            json: Optional JSON body
+            params: Optional query parameters
+            error: Prefix for the error message
+
+        Returns:
+            Decoded JSON response (None for an empty body)
+
+        Raises:
+            GitHubClientError: If the request fails or GitHub returns an error status
+        """
+        operation = f"GitHub {method} {path}"
+        deadline.check(operation)
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire()
+
+        client = await self.aclient()
+        cache_key, cached = None, None
+        if method == "GET" and self.http_cache is not None:
+            cache_key = http_cache.cache_key(
+                f"{path}?{urlencode(params)}" if params else path,
+                client.headers.get("Authorization"),
+                client.headers.get("Accept"),
+            )
+            cached = self.http_cache.get(cache_key)
+
+        try:
+            response = await client.request(
+                method,
+                path,
+                json=json,
+                params=params,
+                headers=http_cache.conditional_headers(cached),
+                timeout=deadline.remaining(self.settings.tool_request_timeout_seconds),
+            )
+        except httpx.TransportError as e:
+            deadline.check(operation)
+            raise GitHubClientError(f"{error}: {e}") from e
+
+        if self.rate_limiter:
+            self.rate_limiter.update_from_headers(response.headers)
+
+        if cache_key is not None and self.http_cache is not None:
+            if response.status_code == 304 and cached is not None:
+                self.http_cache.record(revalidated=True)
+                response = httpx.Response(
+                    200,
+                    headers=http_cache.revalidated_headers(cached, response.headers),
+                    content=cached.body,
+                )
+            elif response.status_code == 200:
+                self.http_cache.record(revalidated=False)
+                http_cache.store_response(
+                    self.http_cache, cache_key, response.headers, response.content
+                )
+
+        try:
+            data = response.json() if response.content else None
+        except ValueError:
+            data = None
+
+        if response.is_error:
+            message = data.get("message") if isinstance(data, dict) else None
+            raise GitHubClientError(
+                f"{error}: {message or response.reason_phrase}",
+                status_code=response.status_code,
+                response=data,
+                retry_after=_retry_after_from_headers(response.headers),
+            )
+        return data
+
+    def refresh_rate_limit(self) -> dict[str, Any]:
+        """
+        Fetch the current core API quota.
+
+        The rate limit endpoint does not count against the quota.
+
+        Returns:
+            Dictionary with limit, remaining and reset time (epoch seconds)
+        """
+        try:
+            core = self.client.get_rate_limit().resources.core
+        except GithubException as e:
+            raise GitHubClientError(
+                f"Error fetching rate limit: {e.data.get('message', str(e))}",
+                status_code=e.status,
+                retry_after=_retry_after(e),
+            )
+
+        reset_at = core.reset.timestamp()
+        if self.rate_limiter:
+            self.rate_limiter.update(core.limit, core.remaining, reset_at)
+        return {"limit": core.limit, "remaining": core.remaining, "reset_at": reset_at}
 
     @property
     def org(self) -> Organization:
-        """Get the configured organization."""
-        return self.client.get_organization(self.settings.github_org)
+        """Get the configured organization (cached)."""
+        key = f"org:{self.settings.github_org.lower()}"
+        org = self._objects.get(key)
+        if org is None:
+            org = self.client.get_organization(self.settings.github_org)
+            self._objects.put(key, org)
+        return org
 
     def get_repo(self, repo_name: str) -> Repository:
         """
         Get a repository by name.
 
+        Repository objects are cached, so the operations of a provisioning
+        run share one lookup per repository.
+
         Args:
             repo_name: Repository name (without org prefix)
 
         Returns:
             Repository object
         """
-        full_name = f"{self.settings.github_org}/{repo_name}"
-        return self.client.get_repo(full_name)
+        repo = self._objects.get(self._repo_key(repo_name))
+        if repo is None:
+            full_name = f"{self.settings.github_org}/{repo_name}"
+            repo = self.client.get_repo(full_name)
+            self._objects.put(self._repo_key(repo_name), repo)
+        return repo
+
+    def object_cache_stats(self) -> dict[str, int]:
+        """Organization and repository cache statistics."""
+        return self._objects.stats()
+
+    def _repo_key(self, repo_name: str) -> str:
+        """Cache key of a repository (names are case-insensitive)."""
+        return f"repo:{self.settings.github_org.lower()}/{repo_name.lower()}"
+
+    def _exists_key(self, repo_name: str) -> str:
+        """Cache key of whether a repository exists, as last read by repos_state()."""
+        return f"exists:{self.settings.github_org.lower()}/{repo_name.lower()}"
+
+    def _forget_repo(self, repo_name: str) -> None:
+        """Drop everything cached about a repository."""
+        self._objects.invalidate(self._repo_key(repo_name))
+        self._objects.invalidate(self._exists_key(repo_name))
+
+    def _forget_missing(self, repo_name: str, error: GithubException) -> None:
+        """Drop a cached repository the API no longer finds (deleted or renamed)."""
+        if error.status == 404:
+            self._forget_repo(repo_name)
+
+    def repos_state(self, repo_names: list[str] | None = None) -> dict[str, dict[str, Any] | None]:
+        """
+        Read the state of many repositories with a few GraphQL queries.
+
+        Existence, default branch, branch protection rules and environments
+        of up to GRAPHQL_BATCH_SIZE named repositories come back in one
+        query, and all repositories of the organization in one query per
+        100. A repository with more than 50 protection rules or
+        environments takes a query per further page of them. Existence is
+        remembered for repo_exists().
+
+        Args:
+            repo_names: Repositories to read (all of the organization if None)
+
+        Returns:
+            State by repository name (None for a repository that does not exist)
+        """
+        org = self.settings.github_org
+        states: dict[str, dict[str, Any] | None] = {}
+        try:
+            if repo_names is None:
+                cursor = None
+                while True:
+                    data = self._graphql(_ORG_REPOS_QUERY, {"org": org, "cursor": cursor})
+                    repos = (data.get("organization") or {}).get("repositories")
+                    if repos is None:
+                        raise GitHubClientError(f"Organization '{org}' not found", status_code=404)
+                    states.update({n["name"]: self._full_repo_state(n) for n in repos["nodes"]})
+                    if not repos["pageInfo"]["hasNextPage"]:
+                        break
+                    cursor = repos["pageInfo"]["endCursor"]
+            else:
+                names = list(dict.fromkeys(repo_names))
+                for start in range(0, len(names), GRAPHQL_BATCH_SIZE):
+                    batch = names[start : start + GRAPHQL_BATCH_SIZE]
+                    variables = {"org": org, **{f"n{i}": n for i, n in enumerate(batch)}}
+                    data = self._graphql(_repos_query(len(batch)), variables)
+                    for i, name in enumerate(batch):
+                        node = data.get(f"r{i}")
+                        states[name] = self._full_repo_state(node) if node else None
+        except GithubException as e:
+            raise GitHubClientError(
+                f"Failed to read repositories: {e.data.get('message', str(e))}",
+                status_code=e.status,
+                retry_after=_retry_after(e),
+            )
+
+        self._remember_existence(states)
+        logger.info(
+            "repos_state_read",
+            repos=len(states),
+            missing=sum(1 for state in states.values() if state is None),
+        )
+        return states
+
+    def _full_repo_state(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Flatten a RepoState node, reading the rest of any nested connection it truncates."""
+        state = _repo_state(node)
+        for conn, cursor in _next_pages(node).items():
+            while cursor is not None:
+                data = self._graphql(
+                    _NESTED_PAGE_QUERIES[conn],
+                    {"org": self.settings.github_org, "name": node["name"], "cursor": cursor},
+                )
+                page = (data.get("repository") or {}).get(conn)
+                if page is None:
+                    break  # deleted since the first read
+                _add_page(state, conn, page)
+                cursor = page["pageInfo"]["endCursor"] if page["pageInfo"]["hasNextPage"] else None
+        return state
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a GraphQL query through PyGithub; missing repositories come back as None."""
+        requester = self.client.requester
+        _, response = requester.requestJsonAndCheck(
+            "POST", requester.graphql_url, input={"query": query, "variables": variables}
+        )
+        return _graphql_data(response, "GitHub GraphQL query failed")
+
+    def _remember_existence(self, states: Mapping[str, dict[str, Any] | None]) -> None:
+        """Record which repositories a bulk read found."""
+        for name, state in states.items():
+            self._objects.put(self._exists_key(name), state is not None)
 
     def repo_exists(self, repo_name: str) -> bool:
         """
         Check if a repository exists.
 
+        Answered without a request when a recent repos_state() read or a
+        cached repository object already tells.
+
         Args:
             repo_name: Repository name
 
         Returns:
             True if repo exists
         """
+        known = self._objects.get(self._exists_key(repo_name))
+        if known is not None:
+            return known
         try:
             self.get_repo(repo_name)
             return True
@@ -94,6 +752,7 @@ class GitHubClient:
             raise GitHubClientError(
                 f"Error checking repository: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
     def create_repo(
@@ -145,6 +804,8 @@ class GitHubClient:
                     has_projects=has_projects,
                 )
 
+            self._objects.put(self._repo_key(name), repo)
+            self._objects.invalidate(self._exists_key(name))
             logger.info("repo_created", repo=name, org=self.settings.github_org)
             return repo
 
@@ -152,6 +813,7 @@ class GitHubClient:
             raise GitHubClientError(
                 f"Failed to create repository: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
     def delete_repo(self, repo_name: str) -> bool:
@@ -167,12 +829,15 @@ class GitHubClient:
         try:
             repo = self.get_repo(repo_name)
             repo.delete()
+            self._forget_repo(repo_name)
             logger.info("repo_deleted", repo=repo_name)
             return True
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to delete repository: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
     def set_branch_protection(
@@ -228,9 +893,11 @@ class GitHubClient:
             }
 
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to set branch protection: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
     def create_environment(
@@ -284,9 +951,11 @@ class GitHubClient:
             }
 
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to create environment: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
     def set_environment_secret(
@@ -309,53 +978,23 @@ class GitHubClient:
             True if set successfully
         """
         try:
-            repo = self.get_repo(repo_name)
-
-            # Get repo public key for encryption
-            public_key = repo.get_public_key()
-
-            # Encrypt the secret using the public key
-            from nacl import public, encoding
-
-            public_key_bytes = public.PublicKey(
-                public_key.key.encode("utf-8"),
-                encoding.Base64Encoder(),
-            )
-            sealed_box = public.SealedBox(public_key_bytes)
-            encrypted = sealed_box.encrypt(secret_value.encode("utf-8"))
-            encrypted_value = encoding.Base64Encoder().encode(encrypted).decode("utf-8")
-
-            # Create the secret
-            url = f"/repos/{self.settings.github_org}/{repo_name}/environments/{environment_name}/secrets/{secret_name}"
-            repo._requester.requestJsonAndCheck(
-                "PUT",
-                url,
-                input={
-                    "encrypted_value": encrypted_value,
-                    "key_id": public_key.key_id,
-                },
-            )
-
-            logger.info(
-                "environment_secret_set",
-                repo=repo_name,
-                environment=environment_name,
-                secret=secret_name,
-            )
-
-            return True
-
-        except ImportError:
-            # Fall back to repo-level secrets if nacl not available
-            logger.warning("nacl not available, using repo-level secrets")
-            return self.set_repo_secret(repo_name, secret_name, secret_value)
-
+            self._put_secret(repo_name, environment_name, secret_name, secret_value)
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to set environment secret: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
+        logger.info(
+            "environment_secret_set",
+            repo=repo_name,
+            environment=environment_name,
+            secret=secret_name,
+        )
+        return True
+
     def set_repo_secret(
         self,
         repo_name: str,
@@ -374,17 +1013,163 @@ class GitHubClient:
             True if set successfully
         """
         try:
-            repo = self.get_repo(repo_name)
-            repo.create_secret(secret_name, secret_value)
-
-            logger.info("repo_secret_set", repo=repo_name, secret=secret_name)
-            return True
-
+            self._put_secret(repo_name, None, secret_name, secret_value)
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to set repo secret: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
+            )
+
+        logger.info("repo_secret_set", repo=repo_name, secret=secret_name)
+        return True
+
+    def set_secrets(
+        self,
+        repo_name: str,
+        secrets: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Set many repository and environment secrets of a repository.
+
+        The public key of each scope is fetched once and every value is
+        sealed locally; the PUTs run concurrently, bounded by the connection
+        pool. A failure affects only its own secret (or, for a key fetch,
+        the secrets of that scope).
+
+        Args:
+            repo_name: Repository name
+            secrets: Secrets as ``{"name", "value", "environment_name"}``
+                (no environment name for repository secrets)
+
+        Returns:
+            Outcome per secret, in input order: ``{"name",
+            "environment_name", "error"}`` with the GitHubClientError of a
+            failed secret, or None
+        """
+        if not secrets:
+            return []
+        scopes = list(dict.fromkeys(secret.get("environment_name") for secret in secrets))
+
+        def fetch_key(environment_name: str | None) -> GitHubClientError | None:
+            try:
+                self._secret_key(self._secrets_path(repo_name, environment_name))
+                return None
+            except GithubException as e:
+                self._forget_missing(repo_name, e)
+                return GitHubClientError(
+                    f"Failed to fetch secrets public key: {e.data.get('message', str(e))}",
+                    status_code=e.status,
+                    retry_after=_retry_after(e),
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                return _network_error("Failed to fetch secrets public key", e)
+
+        def put(secret: dict[str, Any]) -> GitHubClientError | None:
+            try:
+                self._put_secret(
+                    repo_name, secret.get("environment_name"), secret["name"], secret["value"]
+                )
+                return None
+            except GithubException as e:
+                return GitHubClientError(
+                    f"Failed to set secret: {e.data.get('message', str(e))}",
+                    status_code=e.status,
+                    retry_after=_retry_after(e),
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                return _network_error("Failed to set secret", e)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._pool_size, len(secrets)),
+            thread_name_prefix="github-secrets",
+        ) as executor:
+            # Each task runs in a copy of this thread's context, taken here, so
+            # it keeps the call's deadline
+            key_futures = [
+                executor.submit(contextvars.copy_context().run, fetch_key, environment_name)
+                for environment_name in scopes
+            ]
+            key_errors = {
+                environment_name: future.result()
+                for environment_name, future in zip(scopes, key_futures, strict=True)
+            }
+            pending = [
+                None
+                if key_errors[secret.get("environment_name")]
+                else executor.submit(contextvars.copy_context().run, put, secret)
+                for secret in secrets
+            ]
+            outcomes = [
+                {
+                    "name": secret["name"],
+                    "environment_name": secret.get("environment_name"),
+                    "error": future.result()
+                    if future
+                    else key_errors[secret.get("environment_name")],
+                }
+                for secret, future in zip(secrets, pending, strict=True)
+            ]
+
+        logger.info(
+            "secrets_set",
+            repo=repo_name,
+            total=len(outcomes),
+            failed=sum(1 for outcome in outcomes if outcome["error"]),
+        )
+        return outcomes
+
+    def _secrets_path(self, repo_name: str, environment_name: str | None) -> str:
+        """API path of the secrets of a repository or one of its environments."""
+        repo_path = f"/repos/{self.settings.github_org}/{repo_name}"
+        if environment_name:
+            return f"{repo_path}/environments/{environment_name}/secrets"
+        return f"{repo_path}/actions/secrets"
+
+    def _secret_key(self, secrets_path: str) -> tuple[str, Any]:
+        """
+        Get the key id and sealed box of a secrets scope (cached).
+
+        Args:
+            secrets_path: Path from _secrets_path()
+
+        Returns:
+            Tuple of (key_id, sealed box)
+        """
+        key = self._objects.get(f"secrets-key:{secrets_path}")
+        if key is None:
+            _, data = self.client.requester.requestJsonAndCheck(
+                "GET", f"{secrets_path}/public-key"
             )
+            key = self._remember_secret_key(secrets_path, data)
+        return key
+
+    def _remember_secret_key(self, secrets_path: str, data: dict[str, Any]) -> tuple[str, Any]:
+        """Cache a fetched public key, building its sealed box once per key_id."""
+        with self._lock:
+            box = self._sealed_boxes.get(data["key_id"])
+            if box is None:
+                box = self._sealed_boxes[data["key_id"]] = _sealed_box(data["key"])
+        key = (data["key_id"], box)
+        self._objects.put(f"secrets-key:{secrets_path}", key)
+        return key
+
+    def _put_secret(
+        self,
+        repo_name: str,
+        environment_name: str | None,
+        secret_name: str,
+        secret_value: str,
+    ) -> None:
+        """Seal a value with its scope's public key and store it."""
+        secrets_path = self._secrets_path(repo_name, environment_name)
+        key_id, box = self._secret_key(secrets_path)
+        self.client.requester.requestJsonAndCheck(
+            "PUT",
+            f"{secrets_path}/{secret_name}",
+            input={"encrypted_value": _seal(box, secret_value), "key_id": key_id},
+        )
 
     def create_file(
         self,
@@ -437,11 +1222,97 @@ class GitHubClient:
             }
 
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to create file: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
+            )
+
+    def commit_files(
+        self,
+        repo_name: str,
+        files: Mapping[str, str],
+        message: str,
+        branch: str = "main",
+    ) -> dict[str, Any]:
+        """
+        Create or update several files of a branch in a single commit.
+
+        Uses the Git Data API: the blobs are created concurrently, then one
+        tree and one commit on top of the branch head, and the branch is
+        fast-forwarded to it. If another push moves the branch in the
+        meantime, the tree and commit are rebuilt on the new head (the blobs
+        are reused), up to COMMIT_ATTEMPTS times.
+
+        Args:
+            repo_name: Repository name
+            files: File contents by path
+            message: Commit message
+            branch: Target branch
+
+        Returns:
+            Commit information; ``changed`` is False when the files already
+            had this content and no commit was made
+        """
+        try:
+            repo = self.get_repo(repo_name)
+
+            with ThreadPoolExecutor(
+                max_workers=min(self._pool_size, len(files)),
+                thread_name_prefix="github-blobs",
+            ) as executor:
+                # Each task runs in a copy of this thread's context, taken here, so
+                # it keeps the call's deadline; every blob request is metered
+                pending = [
+                    executor.submit(
+                        contextvars.copy_context().run, repo.create_git_blob, content, "utf-8"
+                    )
+                    for content in files.values()
+                ]
+                blobs = [future.result() for future in pending]
+            elements = [
+                InputGitTreeElement(path=path, mode="100644", type="blob", sha=blob.sha)
+                for path, blob in zip(files, blobs, strict=True)
+            ]
+
+            for attempt in range(1, COMMIT_ATTEMPTS + 1):
+                ref = repo.get_git_ref(f"heads/{branch}")
+                head = repo.get_git_commit(ref.object.sha)
+                tree = repo.create_git_tree(elements, base_tree=head.tree)
+                if tree.sha == head.tree.sha:
+                    logger.info("files_unchanged", repo=repo_name, branch=branch, files=len(files))
+                    return self._commit_info(files, head.sha, branch, changed=False)
+
+                commit = repo.create_git_commit(message, tree, [head])
+                try:
+                    ref.edit(commit.sha, force=False)
+                    break
+                except GithubException as e:
+                    if attempt == COMMIT_ATTEMPTS or not _is_ref_race(
+                        e.status, e.data.get("message", str(e))
+                    ):
+                        raise
+                    logger.info("branch_moved", repo=repo_name, branch=branch, attempt=attempt)
+
+            logger.info("files_committed", repo=repo_name, branch=branch, files=len(files))
+            return self._commit_info(files, commit.sha, branch, changed=True)
+
+        except GithubException as e:
+            self._forget_missing(repo_name, e)
+            raise GitHubClientError(
+                f"Failed to commit files: {e.data.get('message', str(e))}",
+                status_code=e.status,
+                retry_after=_retry_after(e),
             )
 
+    @staticmethod
+    def _commit_info(
+        files: Mapping[str, str], sha: str, branch: str, changed: bool
+    ) -> dict[str, Any]:
+        """Result of commit_files()."""
+        return {"paths": list(files), "sha": sha, "branch": branch, "changed": changed}
+
     def trigger_workflow(
         self,
         repo_name: str,
@@ -475,7 +1346,463 @@ class GitHubClient:
             return True
 
         except GithubException as e:
+            self._forget_missing(repo_name, e)
             raise GitHubClientError(
                 f"Failed to trigger workflow: {e.data.get('message', str(e))}",
                 status_code=e.status,
+                retry_after=_retry_after(e),
+            )
+
+    # -------------------------------------------------------------------------
+    # Async API
+    # -------------------------------------------------------------------------
+
+    async def arepo_exists(self, repo_name: str) -> bool:
+        """Async counterpart of repo_exists()."""
+        known = self._objects.get(self._exists_key(repo_name))
+        if known is not None:
+            return known
+        # A repository cached by the blocking API is known to exist
+        if self._objects.get(self._repo_key(repo_name)) is not None:
+            return True
+        try:
+            await self.arequest(
+                "GET",
+                f"/repos/{self.settings.github_org}/{repo_name}",
+                error="Error checking repository",
+            )
+            return True
+        except GitHubClientError as e:
+            if e.status_code == 404:
+                return False
+            raise
+
+    async def arepos_state(
+        self, repo_names: list[str] | None = None
+    ) -> dict[str, dict[str, Any] | None]:
+        """Async counterpart of repos_state()."""
+        org = self.settings.github_org
+        states: dict[str, dict[str, Any] | None] = {}
+        if repo_names is None:
+            cursor = None
+            while True:
+                data = await self._agraphql(_ORG_REPOS_QUERY, {"org": org, "cursor": cursor})
+                repos = (data.get("organization") or {}).get("repositories")
+                if repos is None:
+                    raise GitHubClientError(f"Organization '{org}' not found", status_code=404)
+                states.update({n["name"]: await self._afull_repo_state(n) for n in repos["nodes"]})
+                if not repos["pageInfo"]["hasNextPage"]:
+                    break
+                cursor = repos["pageInfo"]["endCursor"]
+        else:
+            names = list(dict.fromkeys(repo_names))
+            batches = [
+                names[start : start + GRAPHQL_BATCH_SIZE]
+                for start in range(0, len(names), GRAPHQL_BATCH_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._agraphql(
+                        _repos_query(len(batch)),
+                        {"org": org, **{f"n{i}": n for i, n in enumerate(batch)}},
+                    )
+                    for batch in batches
+                )
+            )
+            for batch, data in zip(batches, results, strict=True):
+                for i, name in enumerate(batch):
+                    node = data.get(f"r{i}")
+                    states[name] = await self._afull_repo_state(node) if node else None
+
+        self._remember_existence(states)
+        logger.info(
+            "repos_state_read",
+            repos=len(states),
+            missing=sum(1 for state in states.values() if state is None),
+        )
+        return states
+
+    async def _afull_repo_state(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Async counterpart of _full_repo_state()."""
+        state = _repo_state(node)
+        for conn, cursor in _next_pages(node).items():
+            while cursor is not None:
+                data = await self._agraphql(
+                    _NESTED_PAGE_QUERIES[conn],
+                    {"org": self.settings.github_org, "name": node["name"], "cursor": cursor},
+                )
+                page = (data.get("repository") or {}).get(conn)
+                if page is None:
+                    break  # deleted since the first read
+                _add_page(state, conn, page)
+                cursor = page["pageInfo"]["endCursor"] if page["pageInfo"]["hasNextPage"] else None
+        return state
+
+    async def _agraphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Async counterpart of _graphql()."""
+        response = await self.arequest(
+            "POST",
+            "/graphql",
+            json={"query": query, "variables": variables},
+            error="GitHub GraphQL query failed",
+        )
+        return _graphql_data(response, "GitHub GraphQL query failed")
+
+    async def acreate_repo(
+        self,
+        name: str,
+        description: str = "",
+        private: bool = True,
+        auto_init: bool = True,
+        has_issues: bool = True,
+        has_wiki: bool = False,
+        has_projects: bool = True,
+        template_repo: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of create_repo().
+
+        Returns:
+            Created repository (REST API representation)
+        """
+        org = self.settings.github_org
+        if template_repo:
+            repo = await self.arequest(
+                "POST",
+                f"/repos/{org}/{template_repo}/generate",
+                json={
+                    "owner": org,
+                    "name": name,
+                    "description": description,
+                    "private": private,
+                },
+                error="Failed to create repository",
+            )
+        else:
+            repo = await self.arequest(
+                "POST",
+                f"/orgs/{org}/repos",
+                json={
+                    "name": name,
+                    "description": description,
+                    "private": private,
+                    "auto_init": auto_init,
+                    "has_issues": has_issues,
+                    "has_wiki": has_wiki,
+                    "has_projects": has_projects,
+                },
+                error="Failed to create repository",
+            )
+
+        self._forget_repo(name)
+        logger.info("repo_created", repo=name, org=org)
+        return repo
+
+    async def aset_branch_protection(
+        self,
+        repo_name: str,
+        branch: str,
+        required_approving_review_count: int = 1,
+        dismiss_stale_reviews: bool = True,
+        require_code_owner_reviews: bool = False,
+        required_status_checks: list[str] | None = None,
+        enforce_admins: bool = True,
+    ) -> dict[str, Any]:
+        """Async counterpart of set_branch_protection()."""
+        await self.arequest(
+            "PUT",
+            f"/repos/{self.settings.github_org}/{repo_name}/branches/{branch}/protection",
+            json={
+                "required_status_checks": {
+                    "strict": True,
+                    "contexts": required_status_checks or [],
+                },
+                "enforce_admins": enforce_admins,
+                "required_pull_request_reviews": {
+                    "dismiss_stale_reviews": dismiss_stale_reviews,
+                    "require_code_owner_reviews": require_code_owner_reviews,
+                    "required_approving_review_count": required_approving_review_count,
+                },
+                "restrictions": None,
+                "required_linear_history": False,
+            },
+            error="Failed to set branch protection",
+        )
+
+        logger.info(
+            "branch_protection_set",
+            repo=repo_name,
+            branch=branch,
+            reviews=required_approving_review_count,
+        )
+
+        return {
+            "branch": branch,
+            "required_reviews": required_approving_review_count,
+            "status_checks": required_status_checks,
+        }
+
+    async def acreate_environment(
+        self,
+        repo_name: str,
+        environment_name: str,
+        wait_timer: int = 0,
+        reviewers: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Async counterpart of create_environment(); reviewer IDs are looked up concurrently."""
+        payload: dict[str, Any] = {}
+        if wait_timer > 0:
+            payload["wait_timer"] = wait_timer
+
+        if reviewers:
+            users = await asyncio.gather(
+                *(
+                    self.arequest("GET", f"/users/{r}", error="Failed to create environment")
+                    for r in reviewers
+                )
+            )
+            payload["reviewers"] = [{"type": "User", "id": user["id"]} for user in users]
+            payload["prevent_self_review"] = True
+
+        await self.arequest(
+            "PUT",
+            f"/repos/{self.settings.github_org}/{repo_name}/environments/{environment_name}",
+            json=payload,
+            error="Failed to create environment",
+        )
+
+        logger.info(
+            "environment_created",
+            repo=repo_name,
+            environment=environment_name,
+        )
+
+        return {
+            "name": environment_name,
+            "wait_timer": wait_timer,
+            "reviewers": reviewers,
+        }
+
+    async def aset_environment_secret(
+        self,
+        repo_name: str,
+        environment_name: str,
+        secret_name: str,
+        secret_value: str,
+    ) -> bool:
+        """Async counterpart of set_environment_secret()."""
+        await self._aput_secret(
+            repo_name,
+            environment_name,
+            secret_name,
+            secret_value,
+            error="Failed to set environment secret",
+        )
+
+        logger.info(
+            "environment_secret_set",
+            repo=repo_name,
+            environment=environment_name,
+            secret=secret_name,
+        )
+        return True
+
+    async def aset_repo_secret(
+        self,
+        repo_name: str,
+        secret_name: str,
+        secret_value: str,
+    ) -> bool:
+        """Async counterpart of set_repo_secret()."""
+        await self._aput_secret(
+            repo_name, None, secret_name, secret_value, error="Failed to set repo secret"
+        )
+
+        logger.info("repo_secret_set", repo=repo_name, secret=secret_name)
+        return True
+
+    async def aset_secrets(
+        self,
+        repo_name: str,
+        secrets: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of set_secrets()."""
+        scopes = list(dict.fromkeys(secret.get("environment_name") for secret in secrets))
+        slots = asyncio.Semaphore(self._pool_size)
+
+        async def fetch_key(environment_name: str | None) -> GitHubClientError | None:
+            async with slots:
+                try:
+                    await self._asecret_key(
+                        self._secrets_path(repo_name, environment_name),
+                        error="Failed to fetch secrets public key",
+                    )
+                    return None
+                except GitHubClientError as e:
+                    return e
+
+        async def put(secret: dict[str, Any]) -> GitHubClientError | None:
+            async with slots:
+                try:
+                    await self._aput_secret(
+                        repo_name,
+                        secret.get("environment_name"),
+                        secret["name"],
+                        secret["value"],
+                        error="Failed to set secret",
+                    )
+                    return None
+                except GitHubClientError as e:
+                    return e
+
+        key_errors = dict(zip(scopes, await asyncio.gather(*map(fetch_key, scopes)), strict=True))
+        errors = await asyncio.gather(
+            *(
+                put(secret)
+                if not key_errors[secret.get("environment_name")]
+                else asyncio.sleep(0, key_errors[secret.get("environment_name")])
+                for secret in secrets
             )
+        )
+        outcomes = [
+            {
+                "name": secret["name"],
+                "environment_name": secret.get("environment_name"),
+                "error": error,
+            }
+            for secret, error in zip(secrets, errors, strict=True)
+        ]
+
+        logger.info(
+            "secrets_set",
+            repo=repo_name,
+            total=len(outcomes),
+            failed=sum(1 for outcome in outcomes if outcome["error"]),
+        )
+        return outcomes
+
+    async def _asecret_key(self, secrets_path: str, error: str) -> tuple[str, Any]:
+        """Async counterpart of _secret_key()."""
+        key = self._objects.get(f"secrets-key:{secrets_path}")
+        if key is None:
+            data = await self.arequest("GET", f"{secrets_path}/public-key", error=error)
+            key = self._remember_secret_key(secrets_path, data)
+        return key
+
+    async def _aput_secret(
+        self,
+        repo_name: str,
+        environment_name: str | None,
+        secret_name: str,
+        secret_value: str,
+        error: str,
+    ) -> None:
+        """Async counterpart of _put_secret()."""
+        secrets_path = self._secrets_path(repo_name, environment_name)
+        key_id, box = await self._asecret_key(secrets_path, error=error)
+        await self.arequest(
+            "PUT",
+            f"{secrets_path}/{secret_name}",
+            json={"encrypted_value": _seal(box, secret_value), "key_id": key_id},
+            error=error,
+        )
+
+    async def acreate_file(
+        self,
+        repo_name: str,
+        path: str,
+        content: str,
+        message: str,
+        branch: str = "main",
+    ) -> dict[str, Any]:
+        """Async counterpart of create_file()."""
+        url = f"/repos/{self.settings.github_org}/{repo_name}/contents/{path}"
+        payload: dict[str, Any] = {
+            "message": message,
+            "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+            "branch": branch,
+        }
+
+        # Updating an existing file requires its blob SHA
+        try:
+            existing = await self.arequest(
+                "GET", url, params={"ref": branch}, error="Failed to create file"
+            )
+            payload["sha"] = existing["sha"]
+        except GitHubClientError as e:
+            if e.status_code != 404:
+                raise
+
+        result = await self.arequest("PUT", url, json=payload, error="Failed to create file")
+
+        logger.info("file_created", repo=repo_name, path=path)
+
+        return {
+            "path": path,
+            "sha": result["commit"]["sha"],
+            "branch": branch,
+        }
+
+    async def acommit_files(
+        self,
+        repo_name: str,
+        files: Mapping[str, str],
+        message: str,
+        branch: str = "main",
+    ) -> dict[str, Any]:
+        """Async counterpart of commit_files()."""
+        error = "Failed to commit files"
+        git = f"/repos/{self.settings.github_org}/{repo_name}/git"
+        slots = asyncio.Semaphore(self._pool_size)
+
+        async def create_blob(content: str) -> str:
+            async with slots:
+                blob = await self.arequest(
+                    "POST",
+                    f"{git}/blobs",
+                    json={"content": content, "encoding": "utf-8"},
+                    error=error,
+                )
+                return blob["sha"]
+
+        blob_shas = await asyncio.gather(*map(create_blob, files.values()))
+        elements = [
+            {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+            for path, sha in zip(files, blob_shas, strict=True)
+        ]
+
+        for attempt in range(1, COMMIT_ATTEMPTS + 1):
+            ref = await self.arequest("GET", f"{git}/ref/heads/{branch}", error=error)
+            head_sha = ref["object"]["sha"]
+            head = await self.arequest("GET", f"{git}/commits/{head_sha}", error=error)
+            tree = await self.arequest(
+                "POST",
+                f"{git}/trees",
+                json={"base_tree": head["tree"]["sha"], "tree": elements},
+                error=error,
+            )
+            if tree["sha"] == head["tree"]["sha"]:
+                logger.info("files_unchanged", repo=repo_name, branch=branch, files=len(files))
+                return self._commit_info(files, head_sha, branch, changed=False)
+
+            commit = await self.arequest(
+                "POST",
+                f"{git}/commits",
+                json={"message": message, "tree": tree["sha"], "parents": [head_sha]},
+                error=error,
+            )
+            try:
+                await self.arequest(
+                    "PATCH",
+                    f"{git}/refs/heads/{branch}",
+                    json={"sha": commit["sha"], "force": False},
+                    error=error,
+                )
+                break
+            except GitHubClientError as e:
+                if attempt == COMMIT_ATTEMPTS or not _is_ref_race(e.status_code, e.message):
+                    raise
+                logger.info("branch_moved", repo=repo_name, branch=branch, attempt=attempt)
+
+        logger.info("files_committed", repo=repo_name, branch=branch, files=len(files))
+        return self._commit_info(files, commit["sha"], branch, changed=True)
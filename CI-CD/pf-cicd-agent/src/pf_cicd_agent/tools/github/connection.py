@@ -0,0 +1,157 @@
+"""
+GitHub API Connection.
+
+PyGithub connection that meters every HTTP request it sends: each one is
+checked against the tool call's deadline, paced by the GitHub rate limiter
+and bounded by the time the call has left. GET requests can also be
+revalidated against the conditional request cache.
+"""
+
+import functools
+import threading
+from typing import Any
+
+import structlog
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+    RequestsResponse,
+)
+
+from pf_cicd_agent.tools.github.http_cache import (
+    ConditionalCache,
+    cache_key,
+    conditional_headers,
+    revalidated_headers,
+    store_response,
+)
+from pf_cicd_agent.tools.rate_limit import MeteredAdapter, RateLimiter
+
+
+logger = structlog.get_logger(__name__)
+
+
+class _Response:
+    """A cached response presented like PyGithub's RequestsResponse."""
+
+    def __init__(self, headers: dict[str, str], body: bytes) -> None:
+        self.status = 200
+        self.headers = headers
+        self._body = body
+
+    def getheaders(self) -> Any:
+        return self.headers.items()
+
+    def read(self) -> str:
+        return self._body.decode("utf-8")
+
+
+class GitHubConnection(HTTPSRequestsConnectionClass):
+    """
+    PyGithub connection sending requests through a MeteredAdapter.
+
+    PyGithub shares one connection between threads and passes each request
+    in two calls (``request`` then ``getresponse``), so the pending request
+    is kept per thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        *args: Any,
+        protocol: str = "https",
+        cache: ConditionalCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(host, port or (80 if protocol == "http" else 443), *args, **kwargs)
+        self.protocol = protocol
+        self.cache = cache
+        self._pending = threading.local()
+
+        self.adapter.close()
+        self.adapter = MeteredAdapter(
+            timeout=self.timeout,
+            rate_limiter=rate_limiter,
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self.session.mount(f"{protocol}://", self.adapter)
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        input: Any,
+        headers: dict[str, str],
+        stream: bool = False,
+    ) -> None:
+        self._pending.request = (verb, url, input, headers, stream)
+
+    def getresponse(self) -> Any:
+        verb, url, input, headers, stream = self._pending.request
+        if self.cache is None or verb != "GET" or stream:
+            return self._send(verb, url, input, headers)
+
+        key = cache_key(url, headers.get("Authorization"), headers.get("Accept"))
+        entry = self.cache.get(key)
+        response = self._send(verb, url, input, {**headers, **conditional_headers(entry)})
+
+        if response.status == 304 and entry is not None:
+            self.cache.record(revalidated=True)
+            return _Response(revalidated_headers(entry, response.headers), entry.body)
+        if response.status == 200:
+            self.cache.record(revalidated=False)
+            store_response(self.cache, key, response.headers, response.response.content)
+        return response
+
+    def _send(self, verb: str, url: str, input: Any, headers: dict[str, str]) -> RequestsResponse:
+        """Send a request over the session, as the base class does."""
+        return RequestsResponse(
+            self.session.request(
+                verb,
+                f"{self.protocol}://{self.host}:{self.port}{url}",
+                headers=headers,
+                data=input,
+                timeout=self.timeout,
+                verify=self.verify,
+                allow_redirects=False,
+            )
+        )
+
+
+def install(
+    requester: Requester,
+    cache: ConditionalCache | None = None,
+    rate_limiter: RateLimiter | None = None,
+) -> bool:
+    """
+    Route a PyGithub requester's API requests through a GitHubConnection.
+
+    PyGithub only offers a process-wide hook for this
+    (``Requester.injectConnectionClasses``), so the connection class of
+    this one requester is replaced before its connection is first opened.
+
+    Args:
+        requester: Requester of a newly created Github client
+        cache: Optional conditional request cache
+        rate_limiter: Optional scheduler that paces requests against the quota
+
+    Returns:
+        Whether the connection was installed
+    """
+    protocols: dict[Any, str] = {
+        HTTPSRequestsConnectionClass: "https",
+        HTTPRequestsConnectionClass: "http",
+    }
+    protocol = protocols.get(getattr(requester, "_Requester__connectionClass", None))
+    if protocol is None:
+        logger.warning("github_connection_unsupported", reason="unexpected PyGithub requester")
+        return False
+    requester._Requester__connectionClass = functools.partial(  # type: ignore[attr-defined]
+        GitHubConnection, protocol=protocol, cache=cache, rate_limiter=rate_limiter
+    )
+    return True
@@ -55,17 +55,22 @@ and can include protection rules like required reviewers and wait timers."""
     category = "github"
     audit_event_type = AuditEventType.ENVIRONMENT_CREATE
 
+    reads = ("github:repo:{repo_name}",)
+    writes = ("github:repo:{repo_name}:environment:{environment_name}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared GitHub client."""
         super().__init__(audit_service=audit_service)
-        self._github_client = GitHubClient(settings=settings)
+        self._github_client = github_client or GitHubClient(settings=settings)
         self._settings = settings
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -109,39 +114,72 @@ and can include protection rules like required reviewers and wait timers."""
 
         # Check repo exists
         if not self._github_client.repo_exists(input_data.repo_name):
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Repository '{input_data.repo_name}' not found",
                 error_code="REPO_NOT_FOUND",
             )
 
         try:
-            result = self._github_client.create_environment(
+            self._github_client.create_environment(
                 repo_name=input_data.repo_name,
                 environment_name=input_data.environment_name,
                 wait_timer=input_data.wait_timer,
                 reviewers=input_data.reviewers if input_data.reviewers else None,
             )
+            return self._success(input_data)
+
+        except GitHubClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="GITHUB_ERROR",
+                details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
+            )
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[CreateEnvironmentOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        input_data = CreateEnvironmentInput(**kwargs)
 
-            # Build environment URL
-            settings = self._settings or self._github_client.settings
-            env_url = f"https://github.com/{settings.github_org}/{input_data.repo_name}/settings/environments/{input_data.environment_name}"
+        if not await self._github_client.arepo_exists(input_data.repo_name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.repo_name}' not found",
+                error_code="REPO_NOT_FOUND",
+            )
 
-            output = CreateEnvironmentOutput(
+        try:
+            await self._github_client.acreate_environment(
                 repo_name=input_data.repo_name,
                 environment_name=input_data.environment_name,
                 wait_timer=input_data.wait_timer,
-                reviewers=input_data.reviewers,
-                url=env_url,
-            )
-
-            return ToolResult.success(
-                data=output.model_dump(),
-                message=f"Environment '{input_data.environment_name}' created for {input_data.repo_name}",
+                reviewers=input_data.reviewers if input_data.reviewers else None,
             )
+            return self._success(input_data)
 
         except GitHubClientError as e:
             raise ToolError(
                 message=e.message,
                 code="GITHUB_ERROR",
                 details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
             )
+
+    def _success(self, input_data: CreateEnvironmentInput) -> ToolResult[CreateEnvironmentOutput]:
+        """Build the result of a successful call."""
+        # Build environment URL
+        settings = self._settings or self._github_client.settings
+        env_url = f"https://github.com/{settings.github_org}/{input_data.repo_name}/settings/environments/{input_data.environment_name}"
+
+        output = CreateEnvironmentOutput(
+            repo_name=input_data.repo_name,
+            environment_name=input_data.environment_name,
+            wait_timer=input_data.wait_timer,
+            reviewers=input_data.reviewers,
+            url=env_url,
+        )
+
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=f"Environment '{input_data.environment_name}' created for {input_data.repo_name}",
+        )
@@ -59,16 +59,24 @@ visibility, features (issues, wiki, projects), and initialization options."""
     category = "github"
     audit_event_type = AuditEventType.REPO_CREATE
 
+    writes = ("github:repo:{name}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared GitHub client."""
         super().__init__(audit_service=audit_service)
-        self._github_client = GitHubClient(settings=settings)
+        self._github_client = github_client or GitHubClient(settings=settings)
+
+    def cache_tags(self, **kwargs: Any) -> set[str]:
+        """The repository is named by the ``name`` parameter; it joins organization-wide reads."""
+        return {f"github:repo:{kwargs.get('name')}", "github:org"}
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -142,7 +150,7 @@ visibility, features (issues, wiki, projects), and initialization options."""
         # Validate input
         errors = self.validate_input(**kwargs)
         if errors:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error="; ".join(errors),
                 error_code="VALIDATION_ERROR",
             )
@@ -152,7 +160,7 @@ visibility, features (issues, wiki, projects), and initialization options."""
 
         # Check if repo already exists
         if self._github_client.repo_exists(input_data.name):
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Repository '{input_data.name}' already exists",
                 error_code="REPO_EXISTS",
             )
@@ -191,5 +199,59 @@ visibility, features (issues, wiki, projects), and initialization options."""
                 message=e.message,
                 code="GITHUB_ERROR",
                 details={"status_code": e.status_code},
-                retryable=e.status_code in [500, 502, 503, 504] if e.status_code else False,
+                retryable=e.retryable,
+                retry_after=e.retry_after,
+            )
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[CreateRepoOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
+            )
+
+        input_data = CreateRepoInput(**kwargs)
+
+        if await self._github_client.arepo_exists(input_data.name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.name}' already exists",
+                error_code="REPO_EXISTS",
+            )
+
+        try:
+            repo = await self._github_client.acreate_repo(
+                name=input_data.name,
+                description=input_data.description,
+                private=input_data.private,
+                auto_init=input_data.auto_init,
+                has_issues=input_data.has_issues,
+                has_wiki=input_data.has_wiki,
+                has_projects=input_data.has_projects,
+                template_repo=input_data.template_repo,
+            )
+
+            output = CreateRepoOutput(
+                name=repo["name"],
+                full_name=repo["full_name"],
+                html_url=repo["html_url"],
+                clone_url=repo["clone_url"],
+                ssh_url=repo["ssh_url"],
+                private=repo["private"],
+                default_branch=repo.get("default_branch") or "main",
+            )
+
+            return ToolResult.success(
+                data=output.model_dump(),
+                message=f"Repository '{output.full_name}' created successfully",
+            )
+
+        except GitHubClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="GITHUB_ERROR",
+                details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
             )
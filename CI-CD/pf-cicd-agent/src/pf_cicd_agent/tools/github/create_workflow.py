@@ -15,12 +15,26 @@ from pf_cicd_agent.audit.service import AuditService
 from pf_cicd_agent.config.settings import Settings
 
 
+class WorkflowFile(BaseModel):
+    """A workflow of a multi-workflow commit."""
+
+    workflow_name: str = Field(..., description="Workflow filename (e.g., ci.yml)")
+    workflow_content: str = Field(..., description="YAML content of the workflow")
+
+
 class CreateWorkflowInput(BaseModel):
     """Input schema for create workflow tool."""
 
     repo_name: str = Field(..., description="Repository name")
-    workflow_name: str = Field(..., description="Workflow filename (e.g., ci.yml)")
-    workflow_content: str = Field(..., description="YAML content of the workflow")
+    workflow_name: str | None = Field(
+        default=None, description="Workflow filename (e.g., ci.yml)"
+    )
+    workflow_content: str | None = Field(
+        default=None, description="YAML content of the workflow"
+    )
+    workflows: list[WorkflowFile] = Field(
+        default_factory=list, description="Several workflows to commit together"
+    )
     commit_message: str = Field(
         default="Add workflow", description="Commit message for the workflow file"
     )
@@ -31,10 +45,12 @@ class CreateWorkflowOutput(BaseModel):
     """Output schema for create workflow tool."""
 
     repo_name: str
-    workflow_name: str
-    workflow_path: str
+    workflow_name: str | None
+    workflow_path: str | None
+    workflow_paths: list[str]
     commit_sha: str
     branch: str
+    changed: bool = True
 
 
 class CreateWorkflowTool(BaseTool):
@@ -48,21 +64,29 @@ class CreateWorkflowTool(BaseTool):
     description = """Create or update a GitHub Actions workflow file.
 
 Workflows are defined in YAML and placed in .github/workflows/.
-This tool creates the file and commits it to the repository."""
+This tool creates the file and commits it to the repository. To add a
+set of workflows (e.g. ci.yml and deploy-{env}.yml), pass them together in
+`workflows` instead: they are committed in a single commit."""
     version = "1.0.0"
     category = "github"
     audit_event_type = AuditEventType.WORKFLOW_CREATE
 
+    # Commits to the same branch race on the branch head
+    reads = ("github:repo:{repo_name}",)
+    writes = ("github:repo:{repo_name}:branch:{branch}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared GitHub client."""
         super().__init__(audit_service=audit_service)
-        self._github_client = GitHubClient(settings=settings)
+        self._github_client = github_client or GitHubClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -79,6 +103,27 @@ This tool creates the file and commits it to the repository."""
                     "type": "string",
                     "description": "YAML content of the GitHub Actions workflow",
                 },
+                "workflows": {
+                    "type": "array",
+                    "description": (
+                        "Several workflows to create in one commit "
+                        "(instead of workflow_name and workflow_content)"
+                    ),
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "workflow_name": {
+                                "type": "string",
+                                "description": "Workflow filename",
+                            },
+                            "workflow_content": {
+                                "type": "string",
+                                "description": "YAML content of the workflow",
+                            },
+                        },
+                        "required": ["workflow_name", "workflow_content"],
+                    },
+                },
                 "commit_message": {
                     "type": "string",
                     "description": "Commit message",
@@ -90,20 +135,47 @@ This tool creates the file and commits it to the repository."""
                     "default": "main",
                 },
             },
-            "required": ["repo_name", "workflow_name", "workflow_content"],
+            "required": ["repo_name"],
         }
 
     def validate_input(self, **kwargs: Any) -> list[str]:
         """Validate input parameters."""
+        workflows = kwargs.get("workflows") or []
+        if not workflows:
+            return self._validate_workflow(
+                kwargs.get("workflow_name", ""), kwargs.get("workflow_content", "")
+            )
+
+        errors = []
+        if kwargs.get("workflow_name") or kwargs.get("workflow_content"):
+            errors.append("Use either workflows or workflow_name/workflow_content, not both")
+
+        seen = set()
+        for index, workflow in enumerate(workflows):
+            if not isinstance(workflow, dict):
+                errors.append(f"workflows[{index}]: must be an object")
+                continue
+            name = workflow.get("workflow_name", "")
+            errors.extend(
+                f"workflows[{index}]: {error}"
+                for error in self._validate_workflow(name, workflow.get("workflow_content", ""))
+            )
+            if name in seen:
+                errors.append(f"workflows[{index}]: Workflow '{name}' is listed twice")
+            seen.add(name)
+
+        return errors
+
+    @staticmethod
+    def _validate_workflow(workflow_name: str, workflow_content: str) -> list[str]:
+        """Validate the name and content of one workflow."""
         errors = []
 
-        workflow_name = kwargs.get("workflow_name", "")
         if not workflow_name:
             errors.append("Workflow name is required")
         elif not workflow_name.endswith((".yml", ".yaml")):
             errors.append("Workflow name must end with .yml or .yaml")
 
-        workflow_content = kwargs.get("workflow_content", "")
         if not workflow_content:
             errors.append("Workflow content is required")
         elif "name:" not in workflow_content:
@@ -126,7 +198,7 @@ This tool creates the file and commits it to the repository."""
         # Validate input
         errors = self.validate_input(**kwargs)
         if errors:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error="; ".join(errors),
                 error_code="VALIDATION_ERROR",
             )
@@ -135,35 +207,82 @@ This tool creates the file and commits it to the repository."""
 
         # Check repo exists
         if not self._github_client.repo_exists(input_data.repo_name):
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Repository '{input_data.repo_name}' not found",
                 error_code="REPO_NOT_FOUND",
             )
 
         try:
-            # Build workflow path
-            workflow_path = f".github/workflows/{input_data.workflow_name}"
-
-            # Create/update the file
-            result = self._github_client.create_file(
-                repo_name=input_data.repo_name,
-                path=workflow_path,
-                content=input_data.workflow_content,
-                message=input_data.commit_message,
-                branch=input_data.branch,
+            files = self._files(input_data)
+            if input_data.workflows:
+                # The whole set lands in one commit
+                result = self._github_client.commit_files(
+                    repo_name=input_data.repo_name,
+                    files=files,
+                    message=input_data.commit_message,
+                    branch=input_data.branch,
+                )
+            else:
+                # Create/update the file
+                [(workflow_path, content)] = files.items()
+                result = self._github_client.create_file(
+                    repo_name=input_data.repo_name,
+                    path=workflow_path,
+                    content=content,
+                    message=input_data.commit_message,
+                    branch=input_data.branch,
+                )
+
+            return self._success(
+                input_data, list(files), result["sha"], result.get("changed", True)
             )
 
-            output = CreateWorkflowOutput(
-                repo_name=input_data.repo_name,
-                workflow_name=input_data.workflow_name,
-                workflow_path=workflow_path,
-                commit_sha=result["sha"],
-                branch=input_data.branch,
+        except GitHubClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="GITHUB_ERROR",
+                details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
             )
 
-            return ToolResult.success(
-                data=output.model_dump(),
-                message=f"Workflow '{input_data.workflow_name}' created in {input_data.repo_name}",
+    async def aexecute(self, **kwargs: Any) -> ToolResult[CreateWorkflowOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
+            )
+
+        input_data = CreateWorkflowInput(**kwargs)
+
+        if not await self._github_client.arepo_exists(input_data.repo_name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.repo_name}' not found",
+                error_code="REPO_NOT_FOUND",
+            )
+
+        try:
+            files = self._files(input_data)
+            if input_data.workflows:
+                result = await self._github_client.acommit_files(
+                    repo_name=input_data.repo_name,
+                    files=files,
+                    message=input_data.commit_message,
+                    branch=input_data.branch,
+                )
+            else:
+                [(workflow_path, content)] = files.items()
+                result = await self._github_client.acreate_file(
+                    repo_name=input_data.repo_name,
+                    path=workflow_path,
+                    content=content,
+                    message=input_data.commit_message,
+                    branch=input_data.branch,
+                )
+            return self._success(
+                input_data, list(files), result["sha"], result.get("changed", True)
             )
 
         except GitHubClientError as e:
@@ -171,4 +290,57 @@ This tool creates the file and commits it to the repository."""
                 message=e.message,
                 code="GITHUB_ERROR",
                 details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
+            )
+
+    @staticmethod
+    def _files(input_data: CreateWorkflowInput) -> dict[str, str]:
+        """Workflow contents by repository path."""
+        workflows = input_data.workflows or [
+            WorkflowFile(
+                workflow_name=input_data.workflow_name or "",
+                workflow_content=input_data.workflow_content or "",
+            )
+        ]
+        return {
+            f".github/workflows/{workflow.workflow_name}": workflow.workflow_content
+            for workflow in workflows
+        }
+
+    def _success(
+        self,
+        input_data: CreateWorkflowInput,
+        workflow_paths: list[str],
+        commit_sha: str,
+        changed: bool,
+    ) -> ToolResult[CreateWorkflowOutput]:
+        """
+        Build the result of a successful call.
+
+        ``changed`` is False when the workflows already had the given
+        contents, so no commit was made and ``commit_sha`` is the branch head.
+        """
+        output = CreateWorkflowOutput(
+            repo_name=input_data.repo_name,
+            workflow_name=input_data.workflow_name,
+            workflow_path=None if input_data.workflows else workflow_paths[0],
+            workflow_paths=workflow_paths,
+            commit_sha=commit_sha,
+            branch=input_data.branch,
+            changed=changed,
+        )
+
+        if input_data.workflows and not changed:
+            message = (
+                f"{len(workflow_paths)} workflows in {input_data.repo_name} already up to date "
+                f"at {commit_sha[:7]}"
+            )
+        elif input_data.workflows:
+            message = (
+                f"{len(workflow_paths)} workflows committed to {input_data.repo_name} "
+                f"in {commit_sha[:7]}"
             )
+        else:
+            message = f"Workflow '{input_data.workflow_name}' created in {input_data.repo_name}"
+        return ToolResult.success(data=output.model_dump(), message=message)
@@ -0,0 +1,205 @@
+"""
+GitHub Conditional Request Cache.
+
+Stores GitHub GET responses with their ETag and Last-Modified validators
+and revalidates them with ``If-None-Match`` / ``If-Modified-Since``. A 304
+answer does not count against the rate limit and is served from the cached
+body, so repeated reads of repositories, branches, public keys and contents
+are nearly free. Entries live in memory and, optionally, in a SQLite file
+so they survive restarts.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+import structlog
+
+
+logger = structlog.get_logger(__name__)
+
+# Larger bodies (e.g. big file contents) are not cached
+MAX_BODY_BYTES = 1_000_000
+
+# Headers describing the transfer rather than the (already decoded) body
+_TRANSFER_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding"})
+
+
+@dataclass
+class CachedResponse:
+    """A stored GET response and its validators."""
+
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: bytes
+
+
+def cache_key(path: str, authorization: str | None, accept: str | None) -> str:
+    """
+    Build the cache key of a request.
+
+    The key covers the credential (hashed, so tokens never reach the
+    store) and the requested media type as well as the URL, so responses
+    are never shared across tokens or representations.
+
+    Args:
+        path: Request path with query string
+        authorization: Authorization header value
+        accept: Accept header value
+
+    Returns:
+        Hex digest
+    """
+    token = (authorization or "").split(" ")[-1]
+    scope = hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.sha256(f"{scope}\n{accept or ''}\n{path}".encode()).hexdigest()
+
+
+class ConditionalCache:
+    """
+    Store of GitHub responses for conditional requests.
+
+    The most recently used entries are kept in memory. With a path, every
+    entry is also written to SQLite and read back on a memory miss; the
+    file holds response bodies of private repositories, so it is created
+    readable by the owner only.
+    """
+
+    def __init__(self, max_entries: int = 512, path: str | Path | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries in memory and on disk
+            path: Optional SQLite file for a cache that survives restarts
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._db = self._open(Path(path).expanduser())
+
+    @staticmethod
+    def _open(path: Path) -> sqlite3.Connection:
+        """Open (creating if needed) the SQLite store."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "headers TEXT NOT NULL, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        db.commit()
+        logger.info("github_http_cache_opened", path=str(path))
+        return db
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get the stored response of a request, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CachedResponse(row[0], row[1], json.loads(row[2]), bytes(row[3]))
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store a response that carries a validator."""
+        if not (entry.etag or entry.last_modified) or len(entry.body) > MAX_BODY_BYTES:
+            return
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, julianday('now'))",
+                (key, entry.etag, entry.last_modified, json.dumps(entry.headers), entry.body),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+    def record(self, revalidated: bool) -> None:
+        """Count a conditional request answered with 304 (hit) or a new body (miss)."""
+        with self._lock:
+            if revalidated:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """Keep an entry in memory; caller holds the lock."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def conditional_headers(entry: CachedResponse | None) -> dict[str, str]:
+    """Validators to send with a request for a cached response."""
+    if entry is None:
+        return {}
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def revalidated_headers(entry: CachedResponse, headers: Mapping[str, str]) -> dict[str, str]:
+    """Cached headers refreshed with those of a 304 (new validators, current rate limit)."""
+    merged = dict(entry.headers)
+    merged.update({k.lower(): v for k, v in headers.items() if k.lower() not in _TRANSFER_HEADERS})
+    return merged
+
+
+def store_response(
+    cache: ConditionalCache,
+    key: str,
+    headers: Mapping[str, str],
+    body: bytes,
+) -> None:
+    """Store a 200 response if it carries a validator."""
+    lowered = {k.lower(): v for k, v in headers.items() if k.lower() not in _TRANSFER_HEADERS}
+    cache.put(
+        key,
+        CachedResponse(lowered.get("etag"), lowered.get("last-modified"), lowered, body),
+    )
@@ -15,6 +15,32 @@ from pf_cicd_agent.audit.service import AuditService
 from pf_cicd_agent.config.settings import Settings
 
 
+def validate_secret(secret_name: str, secret_value: str) -> list[str]:
+    """
+    Validate a secret name and value against GitHub's rules.
+
+    Args:
+        secret_name: Secret name
+        secret_value: Secret value
+
+    Returns:
+        List of validation errors (empty if valid)
+    """
+    errors = []
+
+    if not secret_name:
+        errors.append("Secret name is required")
+    elif not secret_name.replace("_", "").isalnum():
+        errors.append("Secret name must be alphanumeric with underscores")
+    elif secret_name.startswith("GITHUB_"):
+        errors.append("Secret name cannot start with GITHUB_")
+
+    if not secret_value:
+        errors.append("Secret value is required")
+
+    return errors
+
+
 class SetSecretInput(BaseModel):
     """Input schema for set secret tool."""
 
@@ -52,16 +78,24 @@ Environment secrets are scoped to a specific deployment environment."""
     category = "github"
     audit_event_type = AuditEventType.SECRET_SET
 
+    reads = (
+        "github:repo:{repo_name}",
+        "github:repo:{repo_name}:environment:{environment_name}",
+    )
+    writes = ("github:repo:{repo_name}:secret:{secret_name}",)
+
     def __init__(
         self,
         audit_service: AuditService | None = None,
         settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
     ) -> None:
-        """Initialize the tool."""
+        """Initialize the tool, optionally with a shared GitHub client."""
         super().__init__(audit_service=audit_service)
-        self._github_client = GitHubClient(settings=settings)
+        self._github_client = github_client or GitHubClient(settings=settings)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
         """Get JSON schema for tool input."""
         return {
             "type": "object",
@@ -88,21 +122,7 @@ Environment secrets are scoped to a specific deployment environment."""
 
     def validate_input(self, **kwargs: Any) -> list[str]:
         """Validate input parameters."""
-        errors = []
-
-        secret_name = kwargs.get("secret_name", "")
-        if not secret_name:
-            errors.append("Secret name is required")
-        elif not secret_name.replace("_", "").isalnum():
-            errors.append("Secret name must be alphanumeric with underscores")
-        elif secret_name.startswith("GITHUB_"):
-            errors.append("Secret name cannot start with GITHUB_")
-
-        secret_value = kwargs.get("secret_value", "")
-        if not secret_value:
-            errors.append("Secret value is required")
-
-        return errors
+        return validate_secret(kwargs.get("secret_name", ""), kwargs.get("secret_value", ""))
 
     def execute(self, **kwargs: Any) -> ToolResult[SetSecretOutput]:
         """
@@ -117,7 +137,7 @@ Environment secrets are scoped to a specific deployment environment."""
         # Validate input
         errors = self.validate_input(**kwargs)
         if errors:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error="; ".join(errors),
                 error_code="VALIDATION_ERROR",
             )
@@ -126,7 +146,7 @@ Environment secrets are scoped to a specific deployment environment."""
 
         # Check repo exists
         if not self._github_client.repo_exists(input_data.repo_name):
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Repository '{input_data.repo_name}' not found",
                 error_code="REPO_NOT_FOUND",
             )
@@ -150,21 +170,72 @@ Environment secrets are scoped to a specific deployment environment."""
                 )
                 scope = "repository"
 
-            output = SetSecretOutput(
-                repo_name=input_data.repo_name,
-                secret_name=input_data.secret_name,
-                environment_name=input_data.environment_name,
-                scope=scope,
+            return self._success(input_data, scope)
+
+        except GitHubClientError as e:
+            raise ToolError(
+                message=e.message,
+                code="GITHUB_ERROR",
+                details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
             )
 
-            return ToolResult.success(
-                data=output.model_dump(),
-                message=f"Secret '{input_data.secret_name}' set successfully ({scope})",
+    async def aexecute(self, **kwargs: Any) -> ToolResult[SetSecretOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
             )
 
+        input_data = SetSecretInput(**kwargs)
+
+        if not await self._github_client.arepo_exists(input_data.repo_name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.repo_name}' not found",
+                error_code="REPO_NOT_FOUND",
+            )
+
+        try:
+            if input_data.environment_name:
+                await self._github_client.aset_environment_secret(
+                    repo_name=input_data.repo_name,
+                    environment_name=input_data.environment_name,
+                    secret_name=input_data.secret_name,
+                    secret_value=input_data.secret_value,
+                )
+                scope = f"environment:{input_data.environment_name}"
+            else:
+                await self._github_client.aset_repo_secret(
+                    repo_name=input_data.repo_name,
+                    secret_name=input_data.secret_name,
+                    secret_value=input_data.secret_value,
+                )
+                scope = "repository"
+
+            return self._success(input_data, scope)
+
         except GitHubClientError as e:
             raise ToolError(
                 message=e.message,
                 code="GITHUB_ERROR",
                 details={"status_code": e.status_code},
+                retryable=e.retryable,
+                retry_after=e.retry_after,
             )
+
+    def _success(self, input_data: SetSecretInput, scope: str) -> ToolResult[SetSecretOutput]:
+        """Build the result of a successful call (the value is not returned)."""
+        output = SetSecretOutput(
+            repo_name=input_data.repo_name,
+            secret_name=input_data.secret_name,
+            environment_name=input_data.environment_name,
+            scope=scope,
+        )
+
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=f"Secret '{input_data.secret_name}' set successfully ({scope})",
+        )
@@ -0,0 +1,274 @@
+"""
+Set Secrets Tool.
+
+Sets many repository and environment secrets in one call: each scope's
+public key is fetched once, values are sealed locally and written
+concurrently, and the result reports the outcome of every secret.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from pf_cicd_agent.tools.base import BaseTool, ToolResult, ToolError
+from pf_cicd_agent.tools.github.client import GitHubClient, GitHubClientError
+from pf_cicd_agent.tools.github.set_secret import validate_secret
+from pf_cicd_agent.audit.models import AuditEventType
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.config.settings import Settings
+
+
+class SecretSpec(BaseModel):
+    """A secret to set."""
+
+    name: str = Field(..., description="Secret name")
+    value: str = Field(..., description="Secret value")
+    environment_name: str | None = Field(
+        default=None, description="Environment name (for environment secrets)"
+    )
+
+
+class SetSecretsInput(BaseModel):
+    """Input schema for set secrets tool."""
+
+    repo_name: str = Field(..., description="Repository name")
+    secrets: list[SecretSpec] = Field(..., description="Secrets to set")
+
+
+class SecretOutcome(BaseModel):
+    """Outcome of one secret (the value is not returned)."""
+
+    secret_name: str
+    environment_name: str | None
+    scope: str
+    status: str
+    error: str | None = None
+
+
+class SetSecretsOutput(BaseModel):
+    """Output schema for set secrets tool."""
+
+    repo_name: str
+    secrets: list[SecretOutcome]
+    set_count: int
+    failed_count: int
+
+
+class SetSecretsTool(BaseTool):
+    """
+    Tool for setting many repository or environment secrets at once.
+
+    Fetches the public key of the repository and of each environment once,
+    seals every value locally and stores them with concurrent requests.
+    A failing secret does not stop the others.
+    """
+
+    name = "set_secrets"
+    description = """Set several secrets of a GitHub repository and its environments in one call.
+
+Prefer this over repeated set_secret calls when provisioning more than one
+secret. Each entry sets a repository secret, or an environment secret when
+environment_name is given. The result lists which secrets were set and
+which failed."""
+    version = "1.0.0"
+    category = "github"
+    audit_event_type = AuditEventType.SECRET_SET
+
+    def __init__(
+        self,
+        audit_service: AuditService | None = None,
+        settings: Settings | None = None,
+        github_client: GitHubClient | None = None,
+    ) -> None:
+        """Initialize the tool, optionally with a shared GitHub client."""
+        super().__init__(audit_service=audit_service)
+        self._github_client = github_client or GitHubClient(settings=settings)
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        """Get JSON schema for tool input."""
+        return {
+            "type": "object",
+            "properties": {
+                "repo_name": {
+                    "type": "string",
+                    "description": "Repository name",
+                },
+                "secrets": {
+                    "type": "array",
+                    "description": "Secrets to set",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": (
+                                    "Secret name (uppercase with underscores recommended)"
+                                ),
+                            },
+                            "value": {
+                                "type": "string",
+                                "description": "Secret value",
+                            },
+                            "environment_name": {
+                                "type": "string",
+                                "description": (
+                                    "Environment name for environment-scoped secrets (optional)"
+                                ),
+                            },
+                        },
+                        "required": ["name", "value"],
+                    },
+                    "minItems": 1,
+                },
+            },
+            "required": ["repo_name", "secrets"],
+        }
+
+    def resource_access(self, **kwargs: Any) -> tuple[set[str], set[str]]:
+        """Read the repository and each environment, write each secret."""
+        repo = f"github:repo:{kwargs.get('repo_name')}"
+        reads, writes = {repo}, set()
+        for secret in kwargs.get("secrets") or []:
+            if not isinstance(secret, dict):
+                continue
+            if secret.get("environment_name"):
+                reads.add(f"{repo}:environment:{secret['environment_name']}")
+            writes.add(f"{repo}:secret:{secret.get('name')}")
+        return reads, writes
+
+    def validate_input(self, **kwargs: Any) -> list[str]:
+        """Validate input parameters."""
+        errors = []
+
+        secrets = kwargs.get("secrets") or []
+        if not secrets:
+            errors.append("At least one secret is required")
+
+        seen = set()
+        for index, secret in enumerate(secrets):
+            if not isinstance(secret, dict):
+                errors.append(f"secrets[{index}]: must be an object")
+                continue
+            name = secret.get("name", "")
+            errors.extend(
+                f"secrets[{index}]: {error}"
+                for error in validate_secret(name, secret.get("value", ""))
+            )
+            key = (name, secret.get("environment_name"))
+            if key in seen:
+                errors.append(f"secrets[{index}]: Secret '{name}' is listed twice")
+            seen.add(key)
+
+        return errors
+
+    def execute(self, **kwargs: Any) -> ToolResult[SetSecretsOutput]:
+        """
+        Execute the set secrets tool.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult with the outcome of each secret (values are not returned)
+        """
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
+            )
+
+        input_data = SetSecretsInput(**kwargs)
+
+        if not self._github_client.repo_exists(input_data.repo_name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.repo_name}' not found",
+                error_code="REPO_NOT_FOUND",
+            )
+
+        outcomes = self._github_client.set_secrets(
+            repo_name=input_data.repo_name,
+            secrets=[secret.model_dump() for secret in input_data.secrets],
+        )
+        return self._result(input_data, outcomes)
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[SetSecretsOutput]:
+        """Async counterpart of execute() using the async GitHub API."""
+        errors = self.validate_input(**kwargs)
+        if errors:
+            return ToolResult.failure(
+                error="; ".join(errors),
+                error_code="VALIDATION_ERROR",
+            )
+
+        input_data = SetSecretsInput(**kwargs)
+
+        if not await self._github_client.arepo_exists(input_data.repo_name):
+            return ToolResult.failure(
+                error=f"Repository '{input_data.repo_name}' not found",
+                error_code="REPO_NOT_FOUND",
+            )
+
+        outcomes = await self._github_client.aset_secrets(
+            repo_name=input_data.repo_name,
+            secrets=[secret.model_dump() for secret in input_data.secrets],
+        )
+        return self._result(input_data, outcomes)
+
+    def _result(
+        self,
+        input_data: SetSecretsInput,
+        outcomes: list[dict[str, Any]],
+    ) -> ToolResult[SetSecretsOutput]:
+        """
+        Build the result from the per-secret outcomes.
+
+        Raises:
+            ToolError: If no secret could be set
+        """
+        failures: list[GitHubClientError] = [o["error"] for o in outcomes if o["error"]]
+        if failures and len(failures) == len(outcomes):
+            raise ToolError(
+                message=failures[0].message,
+                code="GITHUB_ERROR",
+                details={"status_code": failures[0].status_code, "failed": len(failures)},
+                retryable=all(e.retryable for e in failures),
+                retry_after=max((e.retry_after or 0 for e in failures), default=0) or None,
+            )
+
+        output = SetSecretsOutput(
+            repo_name=input_data.repo_name,
+            secrets=[
+                SecretOutcome(
+                    secret_name=outcome["name"],
+                    environment_name=outcome["environment_name"],
+                    scope=(
+                        f"environment:{outcome['environment_name']}"
+                        if outcome["environment_name"]
+                        else "repository"
+                    ),
+                    status="failed" if outcome["error"] else "set",
+                    error=outcome["error"].message if outcome["error"] else None,
+                )
+                for outcome in outcomes
+            ],
+            set_count=len(outcomes) - len(failures),
+            failed_count=len(failures),
+        )
+
+        if failures:
+            return ToolResult.partial(
+                data=output.model_dump(),
+                message=(
+                    f"Set {output.set_count} of {len(outcomes)} secrets; "
+                    f"{len(failures)} failed"
+                ),
+                error="; ".join(
+                    f"{o.secret_name}: {o.error}" for o in output.secrets if o.error
+                ),
+            )
+        return ToolResult.success(
+            data=output.model_dump(),
+            message=f"Set {output.set_count} secrets successfully",
+        )
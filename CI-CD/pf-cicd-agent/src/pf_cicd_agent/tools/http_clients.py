@@ -0,0 +1,39 @@
+"""
+Async HTTP Client Lifecycle.
+
+The async provider APIs use pooled httpx clients whose connections belong
+to the event loop that opened them, so a client is replaced when another
+loop starts using it.
+"""
+
+import asyncio
+
+import httpx
+import structlog
+
+
+logger = structlog.get_logger(__name__)
+
+
+async def aclose_replaced(
+    client: httpx.AsyncClient,
+    loop: asyncio.AbstractEventLoop | None,
+) -> None:
+    """
+    Close a client replaced because another event loop uses it now.
+
+    The client is closed on its own loop while that loop runs in another
+    thread, otherwise on this one. Connections of a loop that is already
+    closed cannot be shut down cleanly; that is logged.
+
+    Args:
+        client: Replaced client
+        loop: Event loop the client was used on
+    """
+    try:
+        if loop is not None and loop.is_running() and loop is not asyncio.get_running_loop():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+        else:
+            await client.aclose()
+    except RuntimeError as e:
+        logger.warning("async_client_close_failed", error=str(e))
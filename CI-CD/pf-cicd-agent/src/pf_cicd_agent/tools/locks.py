@@ -0,0 +1,245 @@
+"""
+Resource Locks.
+
+Tools declare the resources each call reads and writes (see
+BaseTool.resource_access). The registry holds the matching locks for the
+duration of the call, so concurrent calls on unrelated resources run in
+parallel while conflicting calls (two writes, or a read and a write, of
+the same resource) are serialized in arrival order.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
+from typing import AsyncIterator, Iterable, Iterator
+
+import structlog
+
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+
+
+logger = structlog.get_logger(__name__)
+
+
+class _Request:
+    """A call's claim on a set of resources, granted all at once."""
+
+    __slots__ = ("reads", "writes", "granted", "event", "future", "loop")
+
+    def __init__(self, reads: Iterable[str], writes: Iterable[str]) -> None:
+        self.writes = frozenset(writes)
+        self.reads = frozenset(reads) - self.writes
+        self.granted = False
+        self.event: threading.Event | None = None
+        self.future: asyncio.Future[None] | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def keys(self) -> list[str]:
+        """All resources of the request, for messages."""
+        return sorted(self.reads | self.writes)
+
+    def conflicts(self, other: "_Request") -> bool:
+        """Whether the two requests may not hold their locks at the same time."""
+        return bool(
+            self.writes & (other.reads | other.writes) or self.reads & other.writes
+        )
+
+    def wake(self) -> None:
+        """Resume the waiting caller; the manager lock is held."""
+        if self.event is not None:
+            self.event.set()
+        elif self.future is not None and self.loop is not None:
+            # RuntimeError: the loop has closed; nobody is waiting any more
+            with suppress(RuntimeError):
+                self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    """Complete a waiter's future unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
+class ResourceLockManager:
+    """
+    Readers-writer locks keyed by resource name.
+
+    A call takes all of its locks at once, so calls cannot deadlock on
+    each other. Waiting calls are granted in arrival order: a call never
+    overtakes an earlier waiting call it conflicts with, which keeps a
+    stream of reads from starving a write. Threads and coroutines on any
+    event loop can share one manager.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the manager."""
+        self._readers: dict[str, int] = {}
+        self._writers: set[str] = set()
+        self._queue: list[_Request] = []
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.timeouts = 0
+        self.waited_seconds = 0.0
+
+    @contextmanager
+    def hold(self, reads: Iterable[str], writes: Iterable[str]) -> Iterator[None]:
+        """
+        Hold the locks of a call for the duration of a block.
+
+        Args:
+            reads: Resources the call reads
+            writes: Resources the call writes
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes while waiting
+        """
+        request = _Request(reads, writes)
+        if request.reads or request.writes:
+            with self._lock:
+                if not self._enqueue(request):
+                    request.event = threading.Event()
+            if request.event is not None:
+                started = time.monotonic()
+                if not request.event.wait(deadline.remaining()):
+                    self._give_up(request, started)
+                self._log_wait(request, started)
+        try:
+            yield
+        finally:
+            self._release(request)
+
+    @asynccontextmanager
+    async def ahold(self, reads: Iterable[str], writes: Iterable[str]) -> AsyncIterator[None]:
+        """
+        Async counterpart of hold().
+
+        Args:
+            reads: Resources the call reads
+            writes: Resources the call writes
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes while waiting
+        """
+        request = _Request(reads, writes)
+        if request.reads or request.writes:
+            with self._lock:
+                if not self._enqueue(request):
+                    request.loop = asyncio.get_running_loop()
+                    request.future = request.loop.create_future()
+            if request.future is not None:
+                started = time.monotonic()
+                try:
+                    async with asyncio.timeout(deadline.remaining()):
+                        await request.future
+                except TimeoutError:
+                    self._give_up(request, started)
+                except BaseException:
+                    if not self._withdraw(request):
+                        self._release(request)
+                    raise
+                self._log_wait(request, started)
+        try:
+            yield
+        finally:
+            self._release(request)
+
+    def _enqueue(self, request: _Request) -> bool:
+        """Grant a request or queue it; the manager lock is held. Returns whether granted."""
+        if self._available(request, self._queue):
+            self._grant(request)
+            return True
+        self._queue.append(request)
+        return False
+
+    def _available(self, request: _Request, ahead: list[_Request]) -> bool:
+        """Whether a request conflicts with no held lock and no earlier waiter."""
+        if any(key in self._writers for key in request.reads | request.writes):
+            return False
+        if any(self._readers.get(key) for key in request.writes):
+            return False
+        return not any(request.conflicts(other) for other in ahead)
+
+    def _grant(self, request: _Request) -> None:
+        """Take a request's locks; the manager lock is held."""
+        for key in request.reads:
+            self._readers[key] = self._readers.get(key, 0) + 1
+        self._writers.update(request.writes)
+        request.granted = True
+
+    def _release(self, request: _Request) -> None:
+        """Drop a granted request's locks and wake the waiters that can now run."""
+        if not request.granted:
+            return
+        with self._lock:
+            request.granted = False
+            for key in request.reads:
+                self._readers[key] -= 1
+                if not self._readers[key]:
+                    del self._readers[key]
+            self._writers.difference_update(request.writes)
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant queued requests in arrival order; the manager lock is held."""
+        ahead: list[_Request] = []
+        for waiting in list(self._queue):
+            if self._available(waiting, ahead):
+                self._queue.remove(waiting)
+                self._grant(waiting)
+                waiting.wake()
+            else:
+                ahead.append(waiting)
+
+    def _withdraw(self, request: _Request) -> bool:
+        """Remove a waiting request from the queue. Returns False if it was granted meanwhile."""
+        with self._lock:
+            if request.granted:
+                return False
+            self._queue.remove(request)
+            # Later requests may only have been waiting behind this one
+            self._dispatch()
+            return True
+
+    def _give_up(self, request: _Request, started: float) -> None:
+        """
+        Stop waiting at the deadline, unless the locks were granted just in time.
+
+        Raises:
+            DeadlineExceeded: If the request was still waiting
+        """
+        if not self._withdraw(request):
+            return
+
+        with self._lock:
+            self.timeouts += 1
+        current = deadline.current_deadline()
+        logger.warning(
+            "resource_lock_timeout",
+            resources=request.keys,
+            waited_seconds=round(time.monotonic() - started, 2),
+        )
+        raise DeadlineExceeded(
+            f"Deadline exceeded waiting for {', '.join(request.keys)}, "
+            "which another tool call is using",
+            timeout=current.seconds if current is not None else None,
+        )
+
+    def _log_wait(self, request: _Request, started: float) -> None:
+        """Record and log a call that had to wait for its locks."""
+        waited = time.monotonic() - started
+        with self._lock:
+            self.waits += 1
+            self.waited_seconds += waited
+        logger.info("resource_lock_waited", resources=request.keys, seconds=round(waited, 2))
+
+    def stats(self) -> dict[str, float]:
+        """Lock wait statistics."""
+        with self._lock:
+            return {
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "waited_seconds": round(self.waited_seconds, 1),
+            }
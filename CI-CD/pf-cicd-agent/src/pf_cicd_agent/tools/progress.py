@@ -0,0 +1,57 @@
+"""
+Tool Progress Events.
+
+A progress sink is set around each tool execution and carried in a context
+variable, so provider clients, polling loops and SSH sessions deep inside a
+tool can report intermediate events (droplet status changes, connection
+attempts, script output lines) while the call is still running.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+import structlog
+
+
+logger = structlog.get_logger(__name__)
+
+# Receives (event, data) for each progress event of a tool call
+ProgressSink = Callable[[str, dict[str, Any]], None]
+
+_current: ContextVar[ProgressSink | None] = ContextVar("tool_progress", default=None)
+
+
+@contextmanager
+def progress_scope(sink: ProgressSink | None) -> Iterator[None]:
+    """
+    Route the progress events of a block to a sink.
+
+    Args:
+        sink: Receiver of the events (None discards them)
+    """
+    token = _current.set(sink)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def report(event: str, **data: Any) -> None:
+    """
+    Report a progress event of the tool call running in this context.
+
+    Does nothing when no sink is set. A failing sink is logged and never
+    fails the tool call.
+
+    Args:
+        event: Event name (e.g. "droplet_status", "output")
+        **data: Event details
+    """
+    sink = _current.get()
+    if sink is None:
+        return
+    try:
+        sink(event, data)
+    except Exception as e:
+        logger.warning("progress_sink_failed", progress_event=event, error=str(e))
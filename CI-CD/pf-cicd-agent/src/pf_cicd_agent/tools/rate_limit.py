@@ -0,0 +1,281 @@
+"""
+Provider Rate Limiting.
+
+A token bucket per provider keeps request bursts under the secondary
+(per-minute) limits, and the quota reported in each response's rate-limit
+headers is used to pace requests once the hourly budget runs low, so calls
+slow down before the provider starts rejecting them.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import requests
+import structlog
+from requests.adapters import HTTPAdapter
+
+from pf_cicd_agent.config.settings import Settings
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+
+
+logger = structlog.get_logger(__name__)
+
+
+class RateLimitWaitExceeded(DeadlineExceeded):
+    """Raised when waiting for provider quota would overrun the call's deadline."""
+
+    code = "RATE_LIMITED"
+
+
+class RateLimiter:
+    """
+    Request scheduler for one provider.
+
+    Every request takes a token from a bucket refilled at
+    ``requests_per_second`` (up to ``burst``). Once the remaining hourly
+    quota drops below ``reserve_fraction`` of the limit, requests are also
+    spaced so the rest of the quota lasts until it resets; when it is used
+    up, requests wait for the reset.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_second: float,
+        burst: int,
+        reserve_fraction: float = 0.1,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            provider: Provider name
+            requests_per_second: Sustained request rate
+            burst: Bucket capacity
+            reserve_fraction: Share of the quota below which requests are paced
+        """
+        self.provider = provider
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.reserve_fraction = reserve_fraction
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._next_paced_at = 0.0
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_at: float | None = None  # epoch seconds
+        self._waited_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Wait until a request may be sent.
+
+        Raises:
+            RateLimitWaitExceeded: If the wait would overrun the call's deadline
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.info("rate_limit_wait", provider=self.provider, seconds=round(wait, 2))
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """
+        Async counterpart of acquire().
+
+        Raises:
+            RateLimitWaitExceeded: If the wait would overrun the call's deadline
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.info("rate_limit_wait", provider=self.provider, seconds=round(wait, 2))
+            await asyncio.sleep(wait)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled_at) * self.requests_per_second
+            )
+            self._refilled_at = now
+            wait = max(
+                (1 - self._tokens) / self.requests_per_second if self._tokens < 1 else 0.0,
+                self._quota_wait(now),
+            )
+
+            left = deadline.remaining(wait)
+            if left is not None and left < wait:
+                raise RateLimitWaitExceeded(
+                    f"{self.provider} rate limit needs a {wait:.0f}s wait, "
+                    f"more than the {left:.0f}s this call has left",
+                    retry_after=wait,
+                )
+
+            self._tokens -= 1
+            if self._remaining is not None:
+                self._remaining -= 1
+            self._waited_seconds += wait
+            return wait
+
+    def update(self, limit: int | None, remaining: int | None, reset_at: float | None) -> None:
+        """
+        Record the quota reported by the provider.
+
+        Args:
+            limit: Requests allowed per window
+            remaining: Requests left in the window
+            reset_at: Epoch time the window resets
+        """
+        if limit is None or remaining is None or limit < 0 or remaining < 0:
+            return
+        with self._lock:
+            self._limit = limit
+            self._remaining = remaining
+            self._reset_at = reset_at
+
+    def update_from_headers(self, headers: Any) -> None:
+        """
+        Record the quota from response headers.
+
+        Understands GitHub (``X-RateLimit-*``) and Digital Ocean
+        (``RateLimit-*``) header names. GitHub quotas other than the core
+        REST API one (GraphQL, search) are ignored.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        def read(name: str) -> float | None:
+            value = headers.get(f"x-ratelimit-{name}") or headers.get(f"ratelimit-{name}")
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        if headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        limit, remaining, reset_at = read("limit"), read("remaining"), read("reset")
+        self.update(
+            int(limit) if limit is not None else None,
+            int(remaining) if remaining is not None else None,
+            reset_at,
+        )
+
+    def status(self) -> dict[str, Any]:
+        """Remaining budget for status output."""
+        with self._lock:
+            reset_in = None
+            if self._reset_at is not None:
+                reset_in = max(0, round(self._reset_at - time.time()))
+            return {
+                "provider": self.provider,
+                "limit": self._limit,
+                "remaining": self._remaining,
+                "reset_in_seconds": reset_in,
+                "waited_seconds": round(self._waited_seconds, 1),
+            }
+
+    def _quota_wait(self, now: float) -> float:
+        """Wait imposed by the remaining hourly quota; caller holds the lock."""
+        if self._limit is None or self._remaining is None or self._reset_at is None:
+            return 0.0
+
+        until_reset = max(0.0, self._reset_at - time.time())
+        if self._remaining <= 0:
+            return until_reset
+        if self._remaining >= self._limit * self.reserve_fraction:
+            return 0.0
+
+        # Spread what is left of the quota over the rest of the window
+        interval = until_reset / self._remaining
+        slot = max(now, self._next_paced_at)
+        self._next_paced_at = slot + interval
+        return slot - now
+
+
+class MeteredAdapter(HTTPAdapter):
+    """
+    HTTP adapter bounding each request by a timeout and the tool call's
+    deadline, and pacing requests with the provider's rate limiter.
+
+    Mounted on a provider's session, it meters every HTTP request, however
+    many an operation sends.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None,
+        rate_limiter: RateLimiter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+        operation = f"{request.method} {request.path_url}"
+        deadline.check(operation)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        kwargs["timeout"] = deadline.remaining(kwargs.get("timeout") or self.timeout)
+        try:
+            response = super().send(request, **kwargs)
+        except requests.Timeout:
+            # A timeout cut short by the deadline is reported as such
+            deadline.check(operation)
+            raise
+        if self.rate_limiter:
+            self.rate_limiter.update_from_headers(response.headers)
+        return response
+
+
+class RateLimitScheduler:
+    """The rate limiters of all providers."""
+
+    def __init__(self, limiters: list[RateLimiter]) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            limiters: One limiter per provider
+        """
+        self._limiters = {limiter.provider: limiter for limiter in limiters}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RateLimitScheduler":
+        """
+        Build limiters for GitHub and Digital Ocean from settings.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            RateLimitScheduler
+        """
+        return cls(
+            [
+                RateLimiter(
+                    "github",
+                    requests_per_second=settings.rate_limit_github_per_second,
+                    burst=settings.rate_limit_github_burst,
+                    reserve_fraction=settings.rate_limit_reserve_fraction,
+                ),
+                RateLimiter(
+                    "digitalocean",
+                    requests_per_second=settings.rate_limit_do_per_second,
+                    burst=settings.rate_limit_do_burst,
+                    reserve_fraction=settings.rate_limit_reserve_fraction,
+                ),
+            ]
+        )
+
+    def for_provider(self, provider: str) -> RateLimiter | None:
+        """Get the limiter for a provider."""
+        return self._limiters.get(provider)
+
+    def status(self) -> list[dict[str, Any]]:
+        """Remaining budget of every provider."""
+        return [limiter.status() for limiter in self._limiters.values()]
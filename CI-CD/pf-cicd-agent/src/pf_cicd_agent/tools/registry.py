@@ -4,11 +4,18 @@ Tool Registry.
 Implements WBS-2.1.2: Tool registry for managing available tools.
 """
 
-from typing import Any, Type
+import asyncio
+import threading
+from typing import Any, Callable, Type
 
 import structlog
 
 from pf_cicd_agent.tools.base import BaseTool, ToolResult
+from pf_cicd_agent.tools.cache import ResultCache
+from pf_cicd_agent.tools.circuit_breaker import CircuitBreakerBoard
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+from pf_cicd_agent.tools.locks import ResourceLockManager
+from pf_cicd_agent.tools.retry import RetryPolicy
 from pf_cicd_agent.audit.service import AuditService
 
 
@@ -22,38 +29,67 @@ class ToolRegistry:
     Provides:
     - Tool registration and discovery
     - Tool execution by name
+    - Optional result caching and de-duplication of identical calls
+    - Serialization of concurrent calls on the same resources
     - Tool definition export for Claude
     """
 
-    def __init__(self, audit_service: AuditService | None = None) -> None:
+    def __init__(
+        self,
+        audit_service: AuditService | None = None,
+        retry_policy: RetryPolicy | None = None,
+        result_cache: ResultCache | None = None,
+        default_timeout: float | None = None,
+        circuit_breakers: CircuitBreakerBoard | None = None,
+        resource_locks: ResourceLockManager | None = None,
+    ) -> None:
         """
         Initialize the registry.
 
         Args:
             audit_service: Optional audit service for tool logging
+            retry_policy: Retry policy for tools that do not define their own
+            result_cache: Optional cache for tool results
+            default_timeout: Execution timeout (s) for tools that do not define their own
+            circuit_breakers: Optional per-provider circuit breakers shared by tools
+            resource_locks: Lock manager for tool resources (a private one by default)
         """
         self._tools: dict[str, BaseTool] = {}
+        self._factories: dict[str, Callable[[], BaseTool]] = {}
         self._tool_classes: dict[str, Type[BaseTool]] = {}
         self._audit_service = audit_service
-
-    def register(self, tool_class: Type[BaseTool]) -> None:
+        self._retry_policy = retry_policy
+        self.result_cache = result_cache
+        self._default_timeout = default_timeout
+        self.circuit_breakers = circuit_breakers
+        self.resource_locks = resource_locks or ResourceLockManager()
+        self._definitions: list[dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def register(self, tool_class: Type[BaseTool], **tool_kwargs: Any) -> None:
         """
         Register a tool class.
 
+        The tool is instantiated on first use, so registering tools that a
+        session never calls costs nothing.
+
         Args:
             tool_class: Tool class to register
+            **tool_kwargs: Extra constructor arguments (e.g. shared clients)
         """
-        # Create instance with audit service
-        tool_instance = tool_class(audit_service=self._audit_service)
-        name = tool_instance.name
+        name = tool_class.name
 
-        if name in self._tools:
+        if name in self._tool_classes:
             logger.warning("tool_override", tool=name)
 
-        self._tools[name] = tool_instance
+        self._tools.pop(name, None)
+        self._factories[name] = lambda: tool_class(
+            audit_service=self._audit_service, **tool_kwargs
+        )
         self._tool_classes[name] = tool_class
+        self._definitions = None
 
-        logger.info("tool_registered", tool=name, category=tool_instance.category)
+        logger.info("tool_registered", tool=name, category=tool_class.category)
 
     def register_instance(self, tool: BaseTool) -> None:
         """
@@ -64,12 +100,25 @@ class ToolRegistry:
         """
         name = tool.name
 
-        if name in self._tools:
+        if name in self._tool_classes:
             logger.warning("tool_override", tool=name)
 
+        self._apply_defaults(tool)
+        self._factories.pop(name, None)
         self._tools[name] = tool
+        self._tool_classes[name] = type(tool)
+        self._definitions = None
         logger.info("tool_registered", tool=name, category=tool.category)
 
+    def _apply_defaults(self, tool: BaseTool) -> None:
+        """Give a tool the registry's retry policy, timeout and provider circuit breaker."""
+        if tool.retry_policy is None and self._retry_policy is not None:
+            tool.retry_policy = self._retry_policy
+        if tool.timeout_seconds is None and self._default_timeout is not None:
+            tool.timeout_seconds = self._default_timeout
+        if tool.circuit_breaker is None and self.circuit_breakers is not None:
+            tool.circuit_breaker = self.circuit_breakers.for_provider(tool.category)
+
     def unregister(self, name: str) -> bool:
         """
         Unregister a tool.
@@ -80,16 +129,18 @@ class ToolRegistry:
         Returns:
             True if tool was removed, False if not found
         """
-        if name in self._tools:
-            del self._tools[name]
-            self._tool_classes.pop(name, None)
+        if name in self._tool_classes:
+            self._tools.pop(name, None)
+            self._factories.pop(name, None)
+            del self._tool_classes[name]
+            self._definitions = None
             logger.info("tool_unregistered", tool=name)
             return True
         return False
 
     def get(self, name: str) -> BaseTool | None:
         """
-        Get a tool by name.
+        Get a tool by name, instantiating it on first use.
 
         Args:
             name: Tool name
@@ -97,7 +148,19 @@ class ToolRegistry:
         Returns:
             Tool instance or None
         """
-        return self._tools.get(name)
+        tool = self._tools.get(name)
+        if tool is not None or name not in self._factories:
+            return tool
+
+        with self._lock:
+            tool = self._tools.get(name)
+            if tool is None:
+                tool = self._factories[name]()
+                self._apply_defaults(tool)
+                self._tools[name] = tool
+                del self._factories[name]
+                logger.debug("tool_instantiated", tool=name)
+        return tool
 
     def has(self, name: str) -> bool:
         """
@@ -109,9 +172,9 @@ class ToolRegistry:
         Returns:
             True if registered
         """
-        return name in self._tools
+        return name in self._tool_classes
 
-    def execute(self, name: str, **kwargs: Any) -> ToolResult[Any]:
+    def execute(self, name: str, /, **kwargs: Any) -> ToolResult[Any]:
         """
         Execute a tool by name.
 
@@ -124,12 +187,90 @@ class ToolRegistry:
         """
         tool = self.get(name)
         if tool is None:
-            return ToolResult.error(
+            return ToolResult.failure(
                 error=f"Tool '{name}' not found",
                 error_code="TOOL_NOT_FOUND",
             )
 
-        return tool.run(**kwargs)
+        return self._run(tool, kwargs)
+
+    async def aexecute(self, name: str, /, **kwargs: Any) -> ToolResult[Any]:
+        """
+        Execute a tool by name without blocking the event loop.
+
+        Tools with a native async implementation are awaited directly;
+        others run in a worker thread (see BaseTool.aexecute).
+
+        Args:
+            name: Tool name
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult from execution
+        """
+        tool = self.get(name)
+        if tool is None:
+            return ToolResult.failure(
+                error=f"Tool '{name}' not found",
+                error_code="TOOL_NOT_FOUND",
+            )
+
+        return await self._arun(tool, kwargs)
+
+    def _run(self, tool: BaseTool, kwargs: dict[str, Any]) -> ToolResult[Any]:
+        """
+        Validate arguments and run a tool under its resource locks.
+
+        Runs through the result cache if one is configured; a call served
+        from the cache or coalesced with one in flight takes no locks.
+        """
+        violations = tool.check_input(kwargs)
+        if violations:
+            return tool.reject_input(kwargs, violations)
+
+        reads, writes = tool.resource_access(**kwargs)
+
+        def run() -> ToolResult[Any]:
+            try:
+                with self.resource_locks.hold(reads, writes):
+                    return tool.run(**kwargs)
+            except DeadlineExceeded as e:
+                return self._lock_timeout(tool, e)
+
+        if self.result_cache is None:
+            return run()
+        return self.result_cache.run(tool, kwargs, run)
+
+    async def _arun(self, tool: BaseTool, kwargs: dict[str, Any]) -> ToolResult[Any]:
+        """Async counterpart of _run()."""
+        violations = tool.check_input(kwargs)
+        if violations:
+            if tool.audit_service is None:
+                return tool.reject_input(kwargs, violations)
+            return await asyncio.to_thread(tool.reject_input, kwargs, violations)
+
+        reads, writes = tool.resource_access(**kwargs)
+
+        async def run() -> ToolResult[Any]:
+            try:
+                async with self.resource_locks.ahold(reads, writes):
+                    return await tool.arun(**kwargs)
+            except DeadlineExceeded as e:
+                return self._lock_timeout(tool, e)
+
+        if self.result_cache is None:
+            return await run()
+        return await self.result_cache.arun(tool, kwargs, run)
+
+    @staticmethod
+    def _lock_timeout(tool: BaseTool, error: DeadlineExceeded) -> ToolResult[Any]:
+        """Build the result of a call whose deadline passed while waiting for its locks."""
+        logger.warning("tool_lock_timeout", tool=tool.name, error=error.message)
+        return ToolResult.failure(
+            error=error.message,
+            error_code=error.code,
+            metadata={"timeout_seconds": error.timeout},
+        )
 
     def list_tools(self) -> list[str]:
         """
@@ -138,7 +279,7 @@ class ToolRegistry:
         Returns:
             List of tool names
         """
-        return list(self._tools.keys())
+        return list(self._tool_classes)
 
     def list_by_category(self, category: str) -> list[str]:
         """
@@ -151,17 +292,36 @@ class ToolRegistry:
             List of matching tool names
         """
         return [
-            name for name, tool in self._tools.items() if tool.category == category
+            name for name, tool_class in self._tool_classes.items()
+            if tool_class.category == category
         ]
 
     def get_definitions(self) -> list[dict[str, Any]]:
         """
         Get tool definitions for Claude API.
 
+        Definitions are built once and reused until a tool is registered
+        or unregistered.
+
         Returns:
             List of tool definitions in Anthropic format
         """
-        return [tool.to_anthropic_tool() for tool in self._tools.values()]
+        if self._definitions is None:
+            self._definitions = [self._definition(name) for name in list(self._tool_classes)]
+        return list(self._definitions)
+
+    def _definition(self, name: str) -> dict[str, Any]:
+        """
+        Get a tool's definition, from its class unless it is already instantiated.
+
+        Describing the tools for the model does not build them (or the
+        provider clients they create). Tools with an instance-level
+        get_input_schema() are built to describe them.
+        """
+        tool_class = self._tool_classes[name]
+        if name in self._tools or not tool_class.has_class_schema():
+            return self.get(name).to_anthropic_tool()  # type: ignore[union-attr]
+        return tool_class.class_definition()
 
     def get_definitions_by_category(self, category: str) -> list[dict[str, Any]]:
         """
@@ -173,11 +333,7 @@ class ToolRegistry:
         Returns:
             List of tool definitions
         """
-        return [
-            tool.to_anthropic_tool()
-            for tool in self._tools.values()
-            if tool.category == category
-        ]
+        return [self._definition(name) for name in self.list_by_category(category)]
 
     def get_tool_info(self, name: str) -> dict[str, Any] | None:
         """
@@ -189,26 +345,27 @@ class ToolRegistry:
         Returns:
             Tool info dict or None
         """
-        tool = self.get(name)
-        if tool is None:
+        tool_class = self._tool_classes.get(name)
+        if tool_class is None:
             return None
 
         return {
-            "name": tool.name,
-            "description": tool.description,
-            "version": tool.version,
-            "category": tool.category,
-            "input_schema": tool.get_input_schema(),
+            "name": name,
+            "description": tool_class.description,
+            "version": tool_class.version,
+            "category": tool_class.category,
+            "input_schema": self._definition(name)["input_schema"],
         }
 
     def __len__(self) -> int:
-        return len(self._tools)
+        return len(self._tool_classes)
 
     def __contains__(self, name: str) -> bool:
-        return name in self._tools
+        return name in self._tool_classes
 
     def __iter__(self):
-        return iter(self._tools.values())
+        """Iterate over the tools, instantiating those not used yet (see get_definitions)."""
+        return iter([self.get(name) for name in list(self._tool_classes)])
 
 
 # Global registry instance
@@ -0,0 +1,106 @@
+"""
+Tool Retry Policies.
+
+Exponential backoff with jitter and a total time budget, used by
+BaseTool.run to retry transient ToolErrors before they reach the model.
+"""
+
+import random
+
+from pydantic import BaseModel, Field
+
+from pf_cicd_agent.config.settings import Settings
+
+
+# HTTP status codes that indicate a transient provider failure
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_transient_status(status_code: int | None) -> bool:
+    """
+    Check whether an HTTP status code indicates a transient failure.
+
+    Args:
+        status_code: HTTP status code
+
+    Returns:
+        True if the request may succeed when retried
+    """
+    return status_code in TRANSIENT_STATUS_CODES
+
+
+class RetryPolicy(BaseModel):
+    """Retry policy for a tool."""
+
+    max_attempts: int = Field(default=3, ge=1, description="Total attempts, including the first")
+    base_delay: float = Field(default=1.0, ge=0, description="Delay before the first retry (s)")
+    max_delay: float = Field(default=30.0, ge=0, description="Upper bound for backoff delays (s)")
+    multiplier: float = Field(default=2.0, ge=1, description="Backoff growth factor")
+    jitter: float = Field(
+        default=0.5,
+        ge=0,
+        le=1,
+        description="Fraction of each backoff delay that is randomized",
+    )
+    total_budget: float = Field(
+        default=60.0,
+        gt=0,
+        description="Maximum seconds from the first attempt to the start of the last",
+    )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RetryPolicy":
+        """
+        Build the default policy from settings.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            RetryPolicy
+        """
+        return cls(
+            max_attempts=settings.tool_retry_max_attempts,
+            base_delay=settings.tool_retry_base_delay,
+            max_delay=settings.tool_retry_max_delay,
+            total_budget=settings.tool_retry_budget_seconds,
+        )
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """
+        Get the delay before the next attempt.
+
+        A server-provided Retry-After is honoured as-is; otherwise the delay
+        grows exponentially with jitter.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            elapsed: Seconds since the first attempt started
+            retry_after: Delay requested by the provider, if any
+
+        Returns:
+            Seconds to wait, or None if no further attempt fits the policy
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if retry_after is not None:
+            delay = max(0.0, retry_after)
+        else:
+            backoff = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+            delay = backoff * (1 - self.jitter * random.random())
+
+        if elapsed + delay > self.total_budget:
+            return None
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# For tools whose operations are not idempotent (e.g. creating droplets)
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,164 @@
+"""
+Tool Result Serialization.
+
+Renders ToolResult objects as compact JSON for tool_result blocks, capping
+field sizes and moving large blobs into the artifact store.
+"""
+
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+from pf_cicd_agent.tools.artifacts import ArtifactStore
+from pf_cicd_agent.tools.base import ToolResult
+
+
+class ToolResultSerializer:
+    """
+    Serializes tool results for the model.
+
+    - Emits compact JSON instead of a Python repr
+    - Drops empty fields (None and empty strings)
+    - Truncates long lists
+    - Replaces strings longer than ``max_field_chars`` with a preview and an
+      artifact handle the model can read with the fetch_artifact tool
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        max_field_chars: int = 2000,
+        max_result_chars: int = 8000,
+        max_list_items: int = 50,
+    ) -> None:
+        """
+        Initialize the serializer.
+
+        Args:
+            store: Artifact store for oversized fields
+            max_field_chars: Maximum characters kept inline per string field
+            max_result_chars: Maximum characters for the whole serialized result
+            max_list_items: Maximum items kept inline per list
+        """
+        self.store = store
+        self.max_field_chars = max_field_chars
+        self.max_result_chars = max_result_chars
+        self.max_list_items = max_list_items
+
+    def serialize(self, tool_name: str, result: ToolResult[Any]) -> str:
+        """
+        Serialize a tool result to tool_result content.
+
+        Args:
+            tool_name: Name of the tool that produced the result
+            result: Tool result to serialize
+
+        Returns:
+            Compact JSON string
+        """
+        return self.dumps_capped(
+            self.to_payload(tool_name, result), self._summary(result), f"{tool_name}.result"
+        )
+
+    def dumps_capped(self, payload: dict[str, Any], summary: dict[str, Any], label: str) -> str:
+        """
+        Dump a payload within the result size cap.
+
+        A payload longer than ``max_result_chars`` is stored as an artifact
+        and replaced with the summary, a preview and the artifact handle.
+
+        Args:
+            payload: Full payload
+            summary: Short fields kept inline when the payload is too long
+            label: Artifact label
+
+        Returns:
+            Compact JSON string
+        """
+        text = self.dumps(payload)
+        if len(text) <= self.max_result_chars:
+            return text
+
+        handle = self.store.put(text, label=label)
+        return self.dumps(
+            {
+                **summary,
+                "truncated": True,
+                "artifact": handle,
+                "size": len(text),
+                "preview": text[: self.max_field_chars],
+            }
+        )
+
+    def to_payload(self, tool_name: str, result: ToolResult[Any]) -> dict[str, Any]:
+        """
+        Build the compacted, JSON-ready payload for a tool result.
+
+        Field caps apply, but not the overall result size cap.
+
+        Args:
+            tool_name: Name of the tool that produced the result
+            result: Tool result to compact
+
+        Returns:
+            Payload dict
+        """
+        payload = self._summary(result)
+        if result.data is not None:
+            payload["data"] = self._compact(result.data, f"{tool_name}.data")
+        if result.error and result.metadata:
+            payload["details"] = self._compact(result.metadata, f"{tool_name}.details")
+        return payload
+
+    @staticmethod
+    def _summary(result: ToolResult[Any]) -> dict[str, Any]:
+        """Status, message and error fields of a result."""
+        summary: dict[str, Any] = {"status": result.status.value, "message": result.message}
+        if result.error and result.error != result.message:
+            summary["error"] = result.error
+        if result.error_code:
+            summary["error_code"] = result.error_code
+        return summary
+
+    def _compact(self, value: Any, path: str) -> Any:
+        """Recursively compact a value."""
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+
+        if isinstance(value, dict):
+            return {
+                key: self._compact(item, f"{path}.{key}")
+                for key, item in value.items()
+                if item is not None and item != ""
+            }
+
+        if isinstance(value, (list, tuple)):
+            items = [self._compact(item, f"{path}[{i}]") for i, item in enumerate(value)]
+            if len(items) > self.max_list_items:
+                elided = len(items) - self.max_list_items
+                items = items[: self.max_list_items] + [f"... {elided} more items"]
+            return items
+
+        if isinstance(value, str) and len(value) > self.max_field_chars:
+            return self._offload(value, path)
+
+        return value
+
+    def _offload(self, text: str, label: str) -> dict[str, Any]:
+        """Store a long string and return its preview and handle."""
+        handle = self.store.put(text, label=label)
+
+        # Keep the head and, mostly, the tail: logs fail at the end
+        head = self.max_field_chars // 4
+        tail = self.max_field_chars - head
+        return {
+            "preview": f"{text[:head]}\n...\n{text[-tail:]}",
+            "artifact": handle,
+            "size": len(text),
+        }
+
+    @staticmethod
+    def dumps(payload: dict[str, Any]) -> str:
+        """Dump JSON without insignificant whitespace."""
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
@@ -0,0 +1,42 @@
+"""
+Tests for history compaction.
+"""
+
+from pf_cicd_agent.agents.compaction import HistoryCompactor
+
+
+def _exchange(call_id: str, output: str) -> list[dict]:
+    return [
+        {
+            "role": "assistant",
+            "content": [{"type": "tool_use", "id": call_id, "name": "check_repos", "input": {}}],
+        },
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": call_id, "content": output}],
+        },
+    ]
+
+
+def test_earlier_exchanges_of_the_current_turn_are_truncated():
+    messages = [
+        {"role": "user", "content": "check every repository"},
+        *_exchange("t1", "a" * 4000),
+        *_exchange("t2", "b" * 4000),
+        *_exchange("t3", "c" * 4000),
+    ]
+    compactor = HistoryCompactor(token_budget=1500, keep_turns=2, stale_content_chars=100)
+
+    compacted = compactor.compact(messages)
+
+    results = [m["content"][0]["content"] for m in compacted[2::2]]
+    assert [len(result) < 200 for result in results] == [True, True, False]
+    assert results[-1] == "c" * 4000
+    assert [m["role"] for m in compacted] == [m["role"] for m in messages]
+    assert compactor.estimate_tokens(compacted) <= 1500
+
+
+def test_history_within_budget_is_unchanged():
+    messages = [{"role": "user", "content": "hi"}, *_exchange("t1", "ok")]
+
+    assert HistoryCompactor(token_budget=1000).compact(messages) is messages
@@ -0,0 +1,243 @@
+"""
+Tests for the orchestrators' tool-use loop.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pf_cicd_agent.agents.async_orchestrator import AsyncCICDOrchestrator
+from pf_cicd_agent.agents.budget import TurnBudget
+from pf_cicd_agent.agents.orchestrator import CICDOrchestrator
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.base import BaseTool, ToolResult
+from pf_cicd_agent.tools.registry import ToolRegistry
+
+
+def _tool_use(tool_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        type="tool_use", id=tool_id, name="fetch_artifact", input={"artifact_id": "x"}
+    )
+
+
+def _block_stop(tool_id: str) -> SimpleNamespace:
+    return SimpleNamespace(type="content_block_stop", content_block=_tool_use(tool_id))
+
+
+class DroppedStream:
+    """Message stream that fails after its tool_use blocks were streamed."""
+
+    def __init__(self, events: list[SimpleNamespace]) -> None:
+        self.events = events
+
+    def __enter__(self) -> "DroppedStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def __iter__(self):
+        yield from self.events
+        raise ConnectionError("stream dropped")
+
+    async def __aenter__(self) -> "DroppedStream":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+        raise ConnectionError("stream dropped")
+
+
+@pytest.fixture
+def agent_settings(settings):
+    return settings.model_copy(update={"agent_max_concurrent_tools": 1})
+
+
+def _drop_stream_after(agent, tool_ids: list[str]) -> list:
+    """Make the agent's next stream fail after the given tool_use blocks; collect dispatches."""
+    events = [_block_stop(tool_id) for tool_id in tool_ids]
+    agent._client = SimpleNamespace(
+        messages=SimpleNamespace(stream=lambda **kwargs: DroppedStream(events))
+    )
+    dispatched = []
+    dispatch = agent._dispatch_tool_call
+
+    def record(tool_call):
+        dispatch(tool_call)
+        dispatched.append(agent._dispatched[tool_call.id])
+
+    agent._dispatch_tool_call = record
+    return dispatched
+
+
+def test_dropped_stream_cancels_queued_calls(agent_settings):
+    agent = CICDOrchestrator(settings=agent_settings)
+    started, release = threading.Event(), threading.Event()
+    agent._executor.submit(lambda: (started.set(), release.wait()))
+    started.wait()
+    dispatched = _drop_stream_after(agent, ["t1", "t2"])
+
+    try:
+        with pytest.raises(ConnectionError):
+            agent._stream_response()
+        assert agent._dispatched == {}
+        assert len(dispatched) == 2 and all(future.cancelled() for future in dispatched)
+    finally:
+        release.set()
+        agent.close()
+
+
+async def test_async_dropped_stream_cancels_dispatched_calls(agent_settings):
+    agent = AsyncCICDOrchestrator(settings=agent_settings)
+    dispatched = _drop_stream_after(agent, ["t1", "t2"])
+
+    try:
+        with pytest.raises(ConnectionError):
+            await agent._astream_response()
+        assert agent._dispatched == {}
+        assert len(dispatched) == 2 and all(task.done() for task in dispatched)
+    finally:
+        await agent.aclose()
+
+
+def test_close_releases_provider_clients(agent_settings, tmp_path):
+    agent_settings = agent_settings.model_copy(
+        update={
+            "github_http_cache_enabled": True,
+            "github_http_cache_path": str(tmp_path / "github.sqlite"),
+        }
+    )
+    agent = CICDOrchestrator(settings=agent_settings)
+    agent.do_client.session
+
+    agent.close()
+
+    assert agent.github_client.http_cache._db is None
+    assert agent.do_client._session is None
+
+
+class SlowTool(BaseTool):
+    """Tool that waits out its deadline."""
+
+    name = "slow_tool"
+    timeout_seconds = 60.0
+
+    @classmethod
+    def get_input_schema(cls) -> dict:
+        return {"type": "object", "properties": {}}
+
+    def execute(self, **kwargs) -> ToolResult:
+        deadline.sleep(self.timeout_seconds, "waiting")
+        return ToolResult.success()
+
+
+def test_timeout_reports_the_turn_budget_cap(agent_settings):
+    agent = CICDOrchestrator(settings=agent_settings)
+    agent.tools.register_instance(SlowTool())
+    agent._budget = TurnBudget(max_iterations=1, max_tool_calls=1, max_wall_clock_seconds=0.05)
+
+    try:
+        result = agent._execute_tool("slow_tool", {})
+    finally:
+        agent.close()
+
+    assert result.error_code == "TIMEOUT"
+    assert "AGENT_MAX_TURN_SECONDS" in result.error and "60s limit" in result.error
+    assert result.metadata["turn_budget_seconds"] == 0
+
+
+def test_injected_registry_creates_no_provider_clients(agent_settings):
+    agent = CICDOrchestrator(settings=agent_settings, tool_registry=ToolRegistry())
+
+    try:
+        assert agent.github_client is None and agent.do_client is None
+        assert [tool["name"] for tool in agent.get_available_tools()] == ["fetch_artifact"]
+        agent.end_session()
+    finally:
+        agent.close()
+
+
+class ThreadRecordingAudit(AuditService):
+    """Audit service recording the thread of each write."""
+
+    def __init__(self, settings) -> None:
+        super().__init__(settings=settings)
+        self.threads: list[int] = []
+
+    def log_event(self, *args, **kwargs):
+        self.threads.append(threading.get_ident())
+        return super().log_event(*args, **kwargs)
+
+
+def _reply(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        stop_reason="end_turn",
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+    )
+
+
+async def test_async_chat_writes_audit_events_off_the_event_loop(agent_settings):
+    audit = ThreadRecordingAudit(agent_settings)
+    agent_settings = agent_settings.model_copy(update={"agent_stream_responses": False})
+    agent = AsyncCICDOrchestrator(settings=agent_settings, audit_service=audit)
+
+    async def create(**kwargs):
+        return _reply("done")
+
+    agent._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    try:
+        await agent.astart_session()
+        assert await agent.achat("hello") == "done"
+        await agent.aend_session()
+    finally:
+        await agent.aclose()
+
+    assert audit.threads and threading.get_ident() not in audit.threads
+    with pytest.raises(TypeError, match="achat"):
+        agent.chat("hello")
+
+
+def test_end_session_deletes_artifacts(agent_settings):
+    agent = CICDOrchestrator(settings=agent_settings)
+    try:
+        agent.artifacts.put("x" * 10_000, label="bootstrap_droplet.stdout")
+
+        summary = agent.end_session()
+
+        assert summary["artifacts_deleted"] == 1 and len(agent.artifacts) == 0
+    finally:
+        agent.close()
+    assert not agent.artifacts.directory.exists()
+
+
+def test_plan_report_is_capped(agent_settings):
+    agent = CICDOrchestrator(settings=agent_settings)
+    outcomes = {
+        str(index): SimpleNamespace(
+            step=SimpleNamespace(id=str(index), tool="check_repos"),
+            status=SimpleNamespace(value="succeeded"),
+            result=ToolResult.success(data={"repos": ["r" * 1000]}),
+            reason=None,
+        )
+        for index in range(20)
+    }
+    executor = SimpleNamespace(outcomes=outcomes, succeeded=True)
+
+    try:
+        report = json.loads(agent._plan_report(executor))
+
+        assert len(json.dumps(report)) < agent_settings.agent_tool_result_max_chars
+        assert report["truncated"] and report["status"] == "succeeded"
+        assert [step["id"] for step in report["steps"]] == [str(i) for i in range(20)]
+        full = json.loads(agent.artifacts.get(report["artifact"]))
+        assert full["steps"][0]["result"]["data"]["repos"] == ["r" * 1000]
+    finally:
+        agent.close()
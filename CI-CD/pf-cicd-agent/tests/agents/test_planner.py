@@ -0,0 +1,166 @@
+"""
+Tests for plan validation and the DAG executor.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from pf_cicd_agent.agents.planner import DAGExecutor, ExecutionPlan, PlanStep, StepStatus
+from pf_cicd_agent.tools.base import ToolResult
+
+
+TOOLS = {"create_repo", "create_droplet", "create_dns", "set_secret"}
+
+
+def _plan(*steps: dict[str, Any]) -> ExecutionPlan:
+    return ExecutionPlan(summary="test", steps=[PlanStep(**step) for step in steps])
+
+
+def test_valid_plan_has_no_errors():
+    plan = _plan(
+        {"id": "repo", "tool": "create_repo", "input": {}},
+        {"id": "secret", "tool": "set_secret", "input": {}, "depends_on": ["repo"]},
+    )
+
+    assert plan.validate_plan(TOOLS) == []
+
+
+def test_cycles_are_rejected():
+    plan = _plan(
+        {"id": "a", "tool": "create_repo", "input": {}, "depends_on": ["c"]},
+        {"id": "b", "tool": "create_repo", "input": {"x": "${steps.a.data.name}"}},
+        {"id": "c", "tool": "create_repo", "input": {}, "depends_on": ["b"]},
+    )
+
+    assert plan.validate_plan(TOOLS) == ["Plan dependencies contain a cycle"]
+
+
+def test_unknown_dependencies_and_tools_are_rejected():
+    plan = _plan(
+        {"id": "dns", "tool": "create_dns", "input": {"data": "${steps.droplet.data.ip}"}},
+        {"id": "repo", "tool": "delete_repo", "input": {}, "depends_on": ["org"]},
+    )
+
+    assert plan.validate_plan(TOOLS) == [
+        "Step 'dns' depends on unknown step 'droplet'",
+        "Step 'repo' uses unknown tool 'delete_repo'",
+        "Step 'repo' depends on unknown step 'org'",
+    ]
+
+
+class Steps:
+    """Step runner recording the resolved input of each step."""
+
+    def __init__(self, results: dict[str, ToolResult[Any]]) -> None:
+        self.results = results
+        self.inputs: dict[str, dict[str, Any]] = {}
+
+    def __call__(self, step: PlanStep, tool_input: dict[str, Any]) -> ToolResult[Any]:
+        self.inputs[step.id] = tool_input
+        return self.results.get(step.id) or ToolResult.success(data={})
+
+    async def arun(self, step: PlanStep, tool_input: dict[str, Any]) -> ToolResult[Any]:
+        return self(step, tool_input)
+
+
+def _run(plan: ExecutionPlan, steps: Steps, mode: str) -> DAGExecutor:
+    executor = DAGExecutor(plan)
+    if mode == "sync":
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            executor.run(steps, pool)
+    else:
+        asyncio.run(executor.arun(steps.arun))
+    return executor
+
+
+@pytest.fixture(params=["sync", "async"])
+def mode(request) -> str:
+    return request.param
+
+
+def test_references_are_resolved_from_step_results(mode):
+    plan = _plan(
+        {"id": "droplet", "tool": "create_droplet", "input": {"name": "web"}},
+        {
+            "id": "dns",
+            "tool": "create_dns",
+            "input": {
+                "data": "${steps.droplet.data.networks.0.ip}",
+                "comment": "web at ${steps.droplet.data.networks.0.ip}",
+                "tags": ["${steps.droplet.data.tags}"],
+            },
+        },
+    )
+    steps = Steps(
+        {"droplet": ToolResult.success(data={"networks": [{"ip": "203.0.113.1"}], "tags": ["a"]})}
+    )
+
+    executor = _run(plan, steps, mode)
+
+    assert executor.succeeded
+    assert steps.inputs["dns"] == {
+        "data": "203.0.113.1",
+        "comment": "web at 203.0.113.1",
+        "tags": [["a"]],
+    }
+
+
+def test_unresolved_reference_fails_the_step(mode):
+    plan = _plan(
+        {"id": "droplet", "tool": "create_droplet", "input": {}},
+        {"id": "dns", "tool": "create_dns", "input": {"data": "${steps.droplet.data.ip}"}},
+    )
+
+    outcomes = _run(plan, Steps({}), mode).outcomes
+
+    assert outcomes["dns"].status == StepStatus.FAILED
+    assert outcomes["dns"].reason == "Unresolved reference: steps.droplet.data.ip"
+
+
+def test_dependents_of_a_failed_step_are_skipped(mode):
+    plan = _plan(
+        {"id": "repo", "tool": "create_repo", "input": {}},
+        {"id": "secret", "tool": "set_secret", "input": {}, "depends_on": ["repo"]},
+        {"id": "dns", "tool": "create_dns", "input": {"x": "${steps.secret.data.name}"}},
+        {"id": "droplet", "tool": "create_droplet", "input": {}},
+    )
+    steps = Steps({"repo": ToolResult.failure("name taken", error_code="REPO_EXISTS")})
+
+    executor = _run(plan, steps, mode)
+
+    assert not executor.succeeded
+    assert {step_id: o.status for step_id, o in executor.outcomes.items()} == {
+        "repo": StepStatus.FAILED,
+        "secret": StepStatus.SKIPPED,
+        "dns": StepStatus.SKIPPED,
+        "droplet": StepStatus.SUCCEEDED,
+    }
+    assert executor.outcomes["repo"].reason == "name taken"
+    assert executor.outcomes["dns"].reason == "Depends on failed step 'repo'"
+    assert set(steps.inputs) == {"repo", "droplet"}
+
+
+def test_sync_and_async_runs_agree():
+    plan = _plan(
+        {"id": "repo", "tool": "create_repo", "input": {"name": "app"}},
+        {"id": "droplet", "tool": "create_droplet", "input": {"name": "${steps.repo.data.name}"}},
+        {"id": "dns", "tool": "create_dns", "input": {"data": "${steps.droplet.data.ip}"}},
+        {"id": "secret", "tool": "set_secret", "input": {}, "depends_on": ["repo"]},
+    )
+
+    def results() -> dict[str, ToolResult[Any]]:
+        return {
+            "repo": ToolResult.success(data={"name": "app"}),
+            "droplet": ToolResult.failure("quota exceeded"),
+        }
+
+    sync_steps, async_steps = Steps(results()), Steps(results())
+    sync_run, async_run = _run(plan, sync_steps, "sync"), _run(plan, async_steps, "async")
+
+    assert sync_steps.inputs == async_steps.inputs
+    assert {k: (o.status, o.reason) for k, o in sync_run.outcomes.items()} == {
+        k: (o.status, o.reason) for k, o in async_run.outcomes.items()
+    }
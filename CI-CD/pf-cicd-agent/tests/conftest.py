@@ -0,0 +1,100 @@
+"""
+Shared test fixtures.
+"""
+
+import contextlib
+import json
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from pf_cicd_agent.config.settings import Settings
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Settings with placeholder credentials, independent of the environment."""
+    return Settings(
+        _env_file=None,
+        anthropic_api_key="test-key",
+        github_token="test-token",
+        github_org="org",
+        do_api_token="test-token",
+        do_ssh_key_fingerprint="00:00",
+        supabase_url="http://localhost",
+        supabase_anon_key="test-key",
+        supabase_service_role_key="test-key",
+        audit_enabled=False,
+        github_http_cache_enabled=False,
+    )
+
+
+class FakeAPI:
+    """
+    Local HTTP server answering JSON requests from a route table.
+
+    Routes map ``"METHOD /path"`` to a handler returning a status, a JSON
+    body and optionally extra headers; every request received is recorded.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, Callable[[dict[str, Any] | None], tuple[Any, ...]]] = {}
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self) -> None:
+                route = f"{self.command} {self.path}"
+                with api._lock:
+                    api.requests.append(route)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                handler = api.routes.get(route)
+                status, data, *extra = handler(body) if handler else (404, {"message": "Not Found"})
+                payload = json.dumps(data).encode()
+                # The client may have given up waiting (e.g. at its deadline)
+                with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                    self.send_response(status)
+                    for name, value in (extra[0] if extra else {}).items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+
+    def route(
+        self,
+        route: str,
+        status: int = 200,
+        data: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Answer a route with a fixed response."""
+        self.routes[route] = lambda _body: (status, data, headers or {})
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def fake_api() -> Iterator[FakeAPI]:
+    """A running FakeAPI."""
+    api = FakeAPI()
+    yield api
+    api.close()
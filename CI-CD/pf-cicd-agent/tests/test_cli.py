@@ -0,0 +1,53 @@
+"""
+Tests for the command line interface.
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from pf_cicd_agent import cli
+
+
+class RecordingAgent:
+    """Orchestrator stand-in recording how the chat command built it."""
+
+    created: list["RecordingAgent"] = []
+
+    def __init__(self, settings, progress_callback) -> None:
+        self.settings = settings
+        self.progress_callback = progress_callback
+        RecordingAgent.created.append(self)
+
+    def start_session(self) -> str:
+        return "session-id"
+
+    def end_session(self) -> dict:
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize(
+    ("setting", "args", "streamed"),
+    [
+        pytest.param(False, [], False, id="setting-off"),
+        pytest.param(True, [], True, id="setting-on"),
+        pytest.param(False, ["--stream"], True, id="flag-overrides-off"),
+        pytest.param(True, ["--no-stream"], False, id="flag-overrides-on"),
+    ],
+)
+def test_chat_streaming_follows_the_setting_unless_overridden(
+    monkeypatch, settings, setting, args, streamed
+):
+    settings = settings.model_copy(update={"agent_stream_responses": setting})
+    monkeypatch.setattr(cli, "Settings", lambda: settings)
+    monkeypatch.setattr(cli, "CICDOrchestrator", RecordingAgent)
+    monkeypatch.setattr(RecordingAgent, "created", [])
+
+    result = CliRunner().invoke(cli.app, ["chat", *args], input="exit\n")
+
+    assert result.exit_code == 0, result.output
+    [agent] = RecordingAgent.created
+    assert agent.settings.agent_stream_responses is streamed
+    assert isinstance(agent.progress_callback, cli.StreamingProgress) is streamed
@@ -0,0 +1,114 @@
+"""
+Tests for the Digital Ocean client.
+"""
+
+import time
+
+import pytest
+
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+from pf_cicd_agent.tools.digitalocean import client as client_module
+from pf_cicd_agent.tools.digitalocean.client import DOClient
+from pf_cicd_agent.tools.rate_limit import RateLimiter
+
+
+class CountingLimiter(RateLimiter):
+    """Rate limiter counting the tokens taken."""
+
+    def __init__(self) -> None:
+        super().__init__("digitalocean", requests_per_second=1000, burst=1000)
+        self.acquired = 0
+
+    def acquire(self) -> None:
+        self.acquired += 1
+        super().acquire()
+
+
+FINGERPRINT = ":".join(["ab"] * 16)
+
+
+def _droplet(status: str = "active") -> dict:
+    return {
+        "id": 1,
+        "name": "web",
+        "status": status,
+        "networks": {"v4": [{"type": "public", "ip_address": "203.0.113.1"}], "v6": []},
+        "features": [],
+    }
+
+
+@pytest.fixture
+def do_client(settings, fake_api, monkeypatch):
+    """A DOClient talking to the fake API, metered by a CountingLimiter."""
+    monkeypatch.setattr(client_module, "API_URL", fake_api.url)
+    fake_api.route("GET /droplets/1?per_page=200", data={"droplet": _droplet()})
+    return DOClient(settings=settings, rate_limiter=CountingLimiter())
+
+
+def test_looked_up_droplet_requests_are_metered(do_client, fake_api):
+    fake_api.route("DELETE /droplets/1", status=204)
+
+    droplet = do_client.get_droplet(1)
+    assert droplet._session is do_client.session
+    do_client.wait_for_droplet(droplet)
+    assert do_client.delete_droplet(1)
+
+    assert fake_api.requests == [
+        "GET /droplets/1?per_page=200",
+        "GET /droplets/1?per_page=200",
+        "GET /droplets/1?per_page=200",
+        "DELETE /droplets/1",
+    ]
+    assert do_client.rate_limiter.acquired == len(fake_api.requests)
+
+
+def test_listed_droplets_are_bound_to_the_session(do_client, fake_api):
+    fake_api.route("GET /droplets/?per_page=200", data={"droplets": [_droplet()]})
+
+    droplet = do_client.get_droplet_by_name("web")
+    droplet.load()
+
+    assert droplet._session is do_client.session
+    assert do_client.rate_limiter.acquired == len(fake_api.requests) == 2
+
+
+def test_posts_are_metered(do_client, fake_api):
+    fake_api.route(
+        "POST /droplets/",
+        status=202,
+        data={"droplet": _droplet("new"), "links": {"actions": [{"id": 7}]}},
+        headers={"RateLimit-Limit": "5000", "RateLimit-Remaining": "4999"},
+    )
+
+    droplet = do_client.create_droplet("web", ssh_keys=[FINGERPRINT])
+
+    assert droplet.id == 1
+    assert fake_api.requests == ["POST /droplets/"]
+    assert do_client.rate_limiter.acquired == 1
+    assert do_client.rate_limiter.status()["remaining"] == 4999
+
+
+def test_hung_post_is_cut_short_by_the_deadline(do_client, fake_api):
+    def hang(body):
+        time.sleep(1)
+        return 202, {"droplet": _droplet("new")}
+
+    fake_api.routes["POST /droplets/"] = hang
+
+    started = time.monotonic()
+    with deadline.deadline_scope(0.2), pytest.raises(DeadlineExceeded):
+        do_client.create_droplet("web", ssh_keys=[FINGERPRINT])
+
+    assert time.monotonic() - started < 0.9
+
+
+def test_looked_up_droplet_stops_at_the_deadline(do_client, fake_api):
+    droplet = do_client.get_droplet(1)
+
+    with deadline.deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            do_client.wait_for_droplet(droplet)
+
+    assert fake_api.requests == ["GET /droplets/1?per_page=200"]
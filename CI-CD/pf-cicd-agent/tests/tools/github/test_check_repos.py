@@ -0,0 +1,45 @@
+"""
+Tests for the check repos tool's drift detection.
+"""
+
+import pytest
+
+from pf_cicd_agent.tools.github.check_repos import CheckReposInput, find_drift, matching_rule
+
+
+@pytest.mark.parametrize(
+    ("branch", "expected"),
+    [
+        ("main", "main"),
+        ("release/v1.2", "release/v1.*"),
+        ("release/v2.0", "release/*"),
+        ("feature/x", "*"),
+        ("release", "*"),
+    ],
+)
+def test_the_most_specific_rule_applies(branch, expected):
+    patterns = ["*", "release/*", "main", "release/v1.*", "ma*"]
+
+    assert matching_rule(branch, patterns) == expected
+
+
+def test_no_rule_matches():
+    assert matching_rule("main", ["release/*"]) is None
+
+
+def test_drift_is_checked_against_the_most_specific_rule():
+    rule = {
+        "required_reviews": 0,
+        "dismiss_stale_reviews": False,
+        "require_code_owner_reviews": False,
+        "required_status_checks": [],
+        "enforce_admins": False,
+    }
+    state = {
+        "default_branch": "main",
+        "branch_protection": {"*": rule, "release/*": {**rule, "required_reviews": 2}},
+        "environments": [],
+    }
+    expected = CheckReposInput(branch_protection={"release/v1": {"required_reviews": 2}})
+
+    assert find_drift(state, expected) == []
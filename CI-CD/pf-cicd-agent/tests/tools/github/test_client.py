@@ -0,0 +1,246 @@
+"""
+Tests for the GitHub client.
+"""
+
+import asyncio
+import functools
+import time
+
+import github
+import pytest
+from nacl.encoding import Base64Encoder
+from nacl.public import PrivateKey
+
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.deadline import DeadlineExceeded
+from pf_cicd_agent.tools.github import client as client_module
+from pf_cicd_agent.tools.github.client import GitHubClient, GitHubClientError
+from pf_cicd_agent.tools.rate_limit import RateLimiter
+
+
+class CountingLimiter(RateLimiter):
+    """Rate limiter counting the tokens taken."""
+
+    def __init__(self) -> None:
+        super().__init__("github", requests_per_second=1000, burst=1000)
+        self.acquired = 0
+
+    def acquire(self) -> None:
+        self.acquired += 1
+        super().acquire()
+
+
+def _repo(name: str) -> dict:
+    return {"name": name, "full_name": f"org/{name}", "url": f"/repos/org/{name}"}
+
+
+@pytest.fixture
+def github_client(settings, fake_api, monkeypatch):
+    """A GitHubClient talking to the fake API, metered by a CountingLimiter."""
+    monkeypatch.setattr(
+        client_module,
+        "Github",
+        functools.partial(
+            github.Github,
+            base_url=fake_api.url,
+            seconds_between_requests=0,
+            seconds_between_writes=0,
+        ),
+    )
+    fake_api.route("GET /repos/org/app", data=_repo("app"))
+    fake_api.route("GET /repos/org/app/branches/main", data={"name": "main"})
+    return GitHubClient(settings=settings, rate_limiter=CountingLimiter())
+
+
+def test_cached_repository_requests_are_metered(github_client, fake_api):
+    repo = github_client.get_repo("app")
+    assert github_client.get_repo("app") is repo
+
+    repo.get_branch("main")
+    github_client.get_repo("app").get_branch("main")
+
+    assert fake_api.requests == [
+        "GET /repos/org/app",
+        "GET /repos/org/app/branches/main",
+        "GET /repos/org/app/branches/main",
+    ]
+    assert github_client.rate_limiter.acquired == len(fake_api.requests)
+
+
+def test_paginated_list_takes_a_token_per_page(github_client, fake_api):
+    fake_api.route("GET /orgs/org", data={"login": "org", "url": "/orgs/org"})
+    fake_api.route(
+        "GET /orgs/org/repos",
+        data=[_repo("a")],
+        headers={"Link": f'<{fake_api.url}/orgs/org/repos?page=2>; rel="next"'},
+    )
+    fake_api.route("GET /orgs/org/repos?page=2", data=[_repo("b")])
+
+    assert [repo.name for repo in github_client.org.get_repos()] == ["a", "b"]
+    assert github_client.org.login == "org"
+    assert github_client.rate_limiter.acquired == len(fake_api.requests) == 3
+
+
+def test_cached_repository_stops_at_the_deadline(github_client, fake_api):
+    repo = github_client.get_repo("app")
+
+    with deadline.deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            github_client.get_repo("app").get_branch("main")
+        with pytest.raises(DeadlineExceeded):
+            repo.get_branch("main")
+
+    assert fake_api.requests == ["GET /repos/org/app"]
+
+
+@pytest.fixture
+def public_key(fake_api):
+    """Serve a public key for the repository's secrets."""
+    key = PrivateKey.generate().public_key.encode(Base64Encoder).decode()
+    fake_api.route(
+        "GET /repos/org/app/actions/secrets/public-key", data={"key_id": "1", "key": key}
+    )
+
+
+def _disconnect(body):
+    raise ConnectionResetError("dropped")
+
+
+def test_set_secrets_reports_network_errors_per_secret(github_client, fake_api, public_key):
+    fake_api.route("PUT /repos/org/app/actions/secrets/A", status=201, data={})
+    fake_api.routes["PUT /repos/org/app/actions/secrets/B"] = _disconnect
+
+    outcomes = github_client.set_secrets(
+        "app", [{"name": "A", "value": "a"}, {"name": "B", "value": "b"}]
+    )
+
+    assert [o["name"] for o in outcomes] == ["A", "B"]
+    assert outcomes[0]["error"] is None
+    assert outcomes[1]["error"].message.startswith("Failed to set secret")
+    assert outcomes[1]["error"].retryable
+
+
+def test_set_secrets_workers_keep_the_deadline(github_client, fake_api, public_key):
+    with deadline.deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            github_client.set_secrets("app", [{"name": "A", "value": "a"}])
+
+    assert fake_api.requests == []
+
+
+def test_commit_files_meters_every_blob(github_client, fake_api):
+    ref = {"ref": "refs/heads/main", "object": {"sha": "c0", "type": "commit"}}
+    fake_api.route("POST /repos/org/app/git/blobs", status=201, data={"sha": "b1"})
+    fake_api.route("GET /repos/org/app/git/ref/heads/main", data=ref)
+    fake_api.route(
+        "GET /repos/org/app/git/commits/c0", data={"sha": "c0", "tree": {"sha": "t0"}}
+    )
+    fake_api.route("POST /repos/org/app/git/trees", status=201, data={"sha": "t1"})
+    fake_api.route("POST /repos/org/app/git/commits", status=201, data={"sha": "c1"})
+    fake_api.route("PATCH /repos/org/app/git/ref/heads/main", data=ref)
+
+    info = github_client.commit_files("app", {"a.yml": "a", "b.yml": "b"}, "Add workflows")
+
+    assert info["sha"] == "c1" and info["changed"]
+    assert fake_api.requests.count("POST /repos/org/app/git/blobs") == 2
+    assert github_client.rate_limiter.acquired == len(fake_api.requests) == 8
+
+
+def test_commit_files_workers_keep_the_deadline(github_client, fake_api):
+    github_client.get_repo("app")
+
+    with deadline.deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            github_client.commit_files("app", {"a.yml": "a"}, "Add workflow")
+
+    assert fake_api.requests == ["GET /repos/org/app"]
+
+
+@pytest.fixture
+def async_api(fake_api, monkeypatch):
+    """Point the async API at the fake API."""
+    monkeypatch.setattr(client_module, "API_URL", fake_api.url)
+    return fake_api
+
+
+async def test_arequest_wraps_network_errors(github_client, async_api):
+    async_api.routes["GET /repos/org/app"] = _disconnect
+
+    with pytest.raises(GitHubClientError) as raised:
+        await github_client.arequest("GET", "/repos/org/app", error="Failed to get repository")
+
+    assert raised.value.message.startswith("Failed to get repository")
+    assert raised.value.retryable
+    await github_client.aclose()
+
+
+def test_async_client_of_a_previous_loop_is_closed(github_client, async_api):
+    first = asyncio.run(github_client.aclient())
+    second = asyncio.run(github_client.aclient())
+
+    assert first is not second
+    assert first.is_closed and not second.is_closed
+
+
+def test_close_closes_the_conditional_cache_store(settings, tmp_path):
+    settings = settings.model_copy(
+        update={
+            "github_http_cache_enabled": True,
+            "github_http_cache_path": str(tmp_path / "github.sqlite"),
+        }
+    )
+    client = GitHubClient(settings=settings)
+    assert client.http_cache._db is not None
+
+    client.close()
+
+    assert client.http_cache._db is None
+
+
+def _rule(pattern: str) -> dict:
+    return {
+        "pattern": pattern,
+        "requiresApprovingReviews": True,
+        "requiredApprovingReviewCount": 1,
+        "dismissesStaleReviews": False,
+        "requiresCodeOwnerReviews": False,
+        "requiresStatusChecks": False,
+        "requiredStatusCheckContexts": [],
+        "isAdminEnforced": False,
+    }
+
+
+def _page(nodes: list[dict], cursor: str | None = None) -> dict:
+    return {"pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}, "nodes": nodes}
+
+
+def _graphql(body: dict) -> tuple:
+    """Answer repos_state queries: one rule and environment per page, two pages each."""
+    variables = body["variables"]
+    if "n0" in variables:
+        node = {
+            "name": "app",
+            "isArchived": False,
+            "defaultBranchRef": {"name": "main"},
+            "branchProtectionRules": _page([_rule("main")], "rules-1"),
+            "environments": _page([{"name": "staging"}], "envs-1"),
+        }
+        return 200, {"data": {"r0": node}}
+    if "branchProtectionRules" in body["query"]:
+        assert variables == {"org": "org", "name": "app", "cursor": "rules-1"}
+        return 200, {"data": {"repository": {"branchProtectionRules": _page([_rule("release/*")])}}}
+    assert variables["cursor"] == "envs-1"
+    return 200, {"data": {"repository": {"environments": _page([{"name": "production"}])}}}
+
+
+def test_repos_state_reads_every_page_of_rules_and_environments(github_client, fake_api):
+    fake_api.routes["POST /graphql"] = _graphql
+
+    [state] = github_client.repos_state(["app"]).values()
+
+    assert sorted(state["branch_protection"]) == ["main", "release/*"]
+    assert state["environments"] == ["staging", "production"]
+    assert fake_api.requests == ["POST /graphql"] * 3
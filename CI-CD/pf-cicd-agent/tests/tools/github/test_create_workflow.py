@@ -0,0 +1,45 @@
+"""
+Tests for the create workflow tool's report.
+"""
+
+from typing import Any
+
+import pytest
+
+from pf_cicd_agent.tools.github.create_workflow import CreateWorkflowTool
+
+
+class StubClient:
+    """GitHub client whose commit leaves the branch as it was or moves it."""
+
+    def __init__(self, changed: bool) -> None:
+        self.changed = changed
+
+    def repo_exists(self, repo_name: str) -> bool:  # noqa: ARG002
+        return True
+
+    def commit_files(self, **kwargs: Any) -> dict[str, Any]:
+        return {"paths": list(kwargs["files"]), "sha": "abcdef0123", "changed": self.changed}
+
+
+WORKFLOWS = [
+    {"workflow_name": "ci.yml", "workflow_content": "name: CI\non: push\n"},
+    {"workflow_name": "deploy.yml", "workflow_content": "name: Deploy\non: release\n"},
+]
+
+
+@pytest.mark.parametrize(
+    ("changed", "message"),
+    [
+        (True, "2 workflows committed to app in abcdef0"),
+        (False, "2 workflows in app already up to date at abcdef0"),
+    ],
+)
+def test_report_says_whether_a_commit_was_made(changed, message):
+    tool = CreateWorkflowTool(github_client=StubClient(changed))
+
+    result = tool.run(repo_name="app", workflows=WORKFLOWS)
+
+    assert result.is_success
+    assert result.message == message
+    assert result.data["changed"] is changed
@@ -0,0 +1,37 @@
+"""
+Tests for the artifact store.
+"""
+
+from pf_cicd_agent.tools.artifacts import ArtifactStore, FetchArtifactTool
+
+
+def test_oldest_artifacts_are_deleted_beyond_the_limit(tmp_path):
+    store = ArtifactStore(directory=tmp_path, max_chars=10)
+    first = store.put("a" * 6)
+    second = store.put("b" * 6)
+
+    assert first not in store and store.get(first) is None
+    assert store.get(second) == "b" * 6
+    assert [path.name for path in tmp_path.iterdir()] == [f"{second}.txt"]
+
+    result = FetchArtifactTool(store=store).run(handle=first)
+    assert result.error_code == "ARTIFACT_NOT_FOUND"
+
+
+def test_close_deletes_the_temporary_directory():
+    store = ArtifactStore()
+    store.put("output")
+
+    store.close()
+
+    assert len(store) == 0 and not store.directory.exists()
+
+
+def test_clear_keeps_a_configured_directory(tmp_path):
+    store = ArtifactStore(directory=tmp_path)
+    store.put("output")
+
+    assert store.clear() == 1
+    store.close()
+
+    assert tmp_path.exists() and not any(tmp_path.iterdir())
@@ -0,0 +1,256 @@
+"""
+Tests for BaseTool execution: retries, deadlines and the circuit breaker.
+"""
+
+import threading
+from typing import Any
+
+import pytest
+from structlog.testing import capture_logs
+
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.tools import base, deadline
+from pf_cicd_agent.tools.base import BaseTool, ToolError, ToolResult
+from pf_cicd_agent.tools.circuit_breaker import CircuitBreaker, CircuitState
+from pf_cicd_agent.tools.rate_limit import RateLimitWaitExceeded
+from pf_cicd_agent.tools.retry import NO_RETRY, RetryPolicy
+
+
+class FailingTool(BaseTool):
+    """Tool raising a given exception."""
+
+    name = "failing_tool"
+    category = "github"
+    retry_policy = NO_RETRY
+
+    def __init__(self, error: Exception, breaker: CircuitBreaker) -> None:
+        super().__init__()
+        self.error = error
+        self.circuit_breaker = breaker
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        return {"type": "object", "properties": {}}
+
+    def execute(self, **kwargs: Any) -> ToolResult[Any]:  # noqa: ARG002
+        raise self.error
+
+
+def _deadline_error() -> Exception:
+    with deadline.deadline_scope(0.0):
+        try:
+            deadline.check("request")
+        except deadline.DeadlineExceeded as e:
+            return e
+    raise AssertionError("deadline did not expire")
+
+
+@pytest.mark.parametrize(
+    ("error", "code", "event"),
+    [
+        pytest.param(
+            RateLimitWaitExceeded("github rate limit", retry_after=600),
+            "RATE_LIMITED",
+            "tool_rate_limited",
+            id="rate_limited",
+        ),
+        pytest.param(_deadline_error(), "TIMEOUT", "tool_timeout", id="timeout"),
+    ],
+)
+def test_deadline_errors_do_not_open_the_circuit(error, code, event):
+    breaker = CircuitBreaker("github", failure_threshold=1)
+    tool = FailingTool(error, breaker)
+
+    with capture_logs() as logs:
+        result = tool.run()
+
+    assert result.error_code == code
+    assert breaker.state == CircuitState.CLOSED
+    assert [log["event"] for log in logs if log["log_level"] == "error"] == [event]
+
+
+def test_provider_failures_open_the_circuit():
+    breaker = CircuitBreaker("github", failure_threshold=1)
+    tool = FailingTool(ToolError("server error", code="GITHUB_ERROR", retryable=True), breaker)
+
+    assert tool.run().error_code == "GITHUB_ERROR"
+    assert breaker.state == CircuitState.OPEN
+    assert tool.run().error_code == "CIRCUIT_OPEN"
+
+
+async def test_rate_limited_trial_call_frees_its_slot():
+    breaker = CircuitBreaker("github", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure("down")
+    tool = FailingTool(RateLimitWaitExceeded("github rate limit", retry_after=600), breaker)
+
+    assert (await tool.arun()).error_code == "RATE_LIMITED"
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    tool.error = ToolError("not found", code="GITHUB_ERROR")
+    assert (await tool.arun()).error_code == "GITHUB_ERROR"
+    assert breaker.state == CircuitState.CLOSED
+
+
+class BreakerAudit(AuditService):
+    """Audit service recording the thread of each write and whether the breaker was locked."""
+
+    breaker: CircuitBreaker
+
+    def __init__(self, settings) -> None:
+        super().__init__(settings=settings)
+        self.writes: list[tuple[int, bool]] = []
+
+    def log_event(self, *args, **kwargs):
+        self.writes.append((threading.get_ident(), self.breaker._lock.locked()))
+        return super().log_event(*args, **kwargs)
+
+
+def test_circuit_transitions_are_audited_outside_the_lock(settings):
+    audit = BreakerAudit(settings)
+    audit.breaker = CircuitBreaker("github", failure_threshold=1, audit_service=audit)
+
+    audit.breaker.record_failure("down")
+
+    assert audit.breaker.state == CircuitState.OPEN
+    assert audit.writes == [(threading.get_ident(), False)]
+
+
+async def test_async_circuit_transitions_are_audited_off_the_event_loop(settings):
+    audit = BreakerAudit(settings)
+    audit.breaker = CircuitBreaker(
+        "github", failure_threshold=1, reset_timeout=0.0, audit_service=audit
+    )
+    error = ToolError("server error", code="GITHUB_ERROR", retryable=True)
+    tool = FailingTool(error, audit.breaker)
+
+    assert (await tool.arun()).error_code == "GITHUB_ERROR"
+    tool.error = ToolError("not found", code="GITHUB_ERROR")
+    assert (await tool.arun()).error_code == "GITHUB_ERROR"
+
+    # open, half-open, closed
+    assert len(audit.writes) == 3
+    assert all(thread != threading.get_ident() and not locked for thread, locked in audit.writes)
+
+
+@pytest.mark.parametrize(
+    ("attempt", "delay"),
+    [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (5, None)],
+)
+def test_backoff_grows_to_the_max_delay(attempt, delay):
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=5.0, jitter=0, total_budget=60)
+
+    assert policy.next_delay(attempt, elapsed=0) == delay
+
+
+def test_jitter_shortens_the_backoff(monkeypatch):
+    policy = RetryPolicy(base_delay=2.0, jitter=0.5)
+    monkeypatch.setattr("random.random", lambda: 1.0)
+
+    assert policy.next_delay(1, elapsed=0) == 1.0
+
+
+def test_retry_after_overrides_the_backoff():
+    policy = RetryPolicy(max_attempts=3, max_delay=1.0, total_budget=60)
+
+    assert policy.next_delay(1, elapsed=0, retry_after=20.0) == 20.0
+    assert policy.next_delay(1, elapsed=0, retry_after=-1.0) == 0.0
+    assert policy.next_delay(1, elapsed=50, retry_after=20.0) is None
+
+
+class FlakyTool(BaseTool):
+    """Tool failing with given errors before it succeeds."""
+
+    name = "flaky_tool"
+    category = "github"
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0.5, jitter=0)
+
+    def __init__(self, *errors: ToolError) -> None:
+        super().__init__()
+        self.errors = list(errors)
+        self.calls = 0
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        return {"type": "object", "properties": {}}
+
+    def execute(self, **kwargs: Any) -> ToolResult[Any]:  # noqa: ARG002
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return ToolResult.success(data={"ok": True})
+
+    async def aexecute(self, **kwargs: Any) -> ToolResult[Any]:
+        return self.execute(**kwargs)
+
+
+def _transient(retry_after: float | None = None) -> ToolError:
+    return ToolError("unavailable", code="GITHUB_ERROR", retryable=True, retry_after=retry_after)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Delays BaseTool waited between attempts, without waiting."""
+    delays: list[float] = []
+    monkeypatch.setattr(base.time, "sleep", delays.append)
+    return delays
+
+
+def test_transient_errors_are_retried_with_backoff(sleeps):
+    tool = FlakyTool(_transient(), _transient())
+
+    result = tool.run()
+
+    assert result.is_success
+    assert result.metadata["attempts"] == tool.calls == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_after_sets_the_delay(sleeps):
+    tool = FlakyTool(_transient(retry_after=7.0))
+
+    assert tool.run().is_success
+    assert sleeps == [7.0]
+
+
+def test_exhausted_retries_report_the_attempts(sleeps):
+    tool = FlakyTool(_transient(), _transient(), _transient())
+
+    result = tool.run()
+
+    assert result.error_code == "GITHUB_ERROR"
+    assert result.metadata["attempts"] == tool.calls == 3
+    assert len(sleeps) == 2
+
+
+def test_non_retryable_errors_are_not_retried(sleeps):
+    tool = FlakyTool(ToolError("not found", code="REPO_NOT_FOUND"))
+
+    result = tool.run()
+
+    assert result.error_code == "REPO_NOT_FOUND"
+    assert tool.calls == 1
+    assert sleeps == []
+    assert "attempts" not in result.metadata
+
+
+def test_retry_is_not_started_past_the_deadline(sleeps):
+    tool = FlakyTool(_transient(retry_after=5.0))
+    tool.timeout_seconds = 1.0
+
+    result = tool.run()
+
+    assert result.error_code == "GITHUB_ERROR"
+    assert tool.calls == 1
+    assert sleeps == []
+
+
+async def test_async_retries_match_sync():
+    tool = FlakyTool(_transient(), _transient(retry_after=0.02))
+    tool.retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01, jitter=0)
+
+    with capture_logs() as logs:
+        result = await tool.arun()
+
+    assert result.is_success
+    assert result.metadata["attempts"] == tool.calls == 3
+    assert [log["delay_seconds"] for log in logs if log["event"] == "tool_retry"] == [0.01, 0.02]
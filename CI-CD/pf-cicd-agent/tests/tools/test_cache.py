@@ -0,0 +1,96 @@
+"""
+Tests for the tool result cache.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pf_cicd_agent.tools.base import BaseTool, ToolResult
+from pf_cicd_agent.tools.cache import ResultCache
+from pf_cicd_agent.tools.github.check_repos import CheckReposTool
+from pf_cicd_agent.tools.github.create_repo import CreateRepoTool
+from pf_cicd_agent.tools.github.set_secret import SetSecretTool
+
+
+class RecordingTool(BaseTool):
+    """Tool counting its calls."""
+
+    name = "recording_tool"
+
+    def __init__(self, cacheable: bool) -> None:
+        super().__init__()
+        self.cacheable = cacheable
+        self.calls = 0
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        return {"type": "object", "properties": {}}
+
+    def execute(self, **kwargs: Any) -> ToolResult[Any]:
+        self.calls += 1
+        return ToolResult.success()
+
+
+def _run_twice_concurrently(cache: ResultCache, tool: RecordingTool) -> list[ToolResult[Any]]:
+    """Run two identical calls, the second while the first is in flight."""
+    started, release = threading.Event(), threading.Event()
+
+    def first() -> ToolResult[Any]:
+        started.set()
+        release.wait(5)
+        return tool.run()
+
+    def second() -> ToolResult[Any]:
+        try:
+            return tool.run()
+        finally:
+            release.set()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(cache.run, tool, {"repo_name": "app"}, first)
+        started.wait(5)
+        follower = executor.submit(cache.run, tool, {"repo_name": "app"}, second)
+        if tool.cacheable:
+            while cache.stats()["coalesced"] == 0:
+                threading.Event().wait(0.001)
+            release.set()
+        return [leader.result(), follower.result()]
+
+
+def test_identical_reads_in_flight_are_coalesced():
+    cache = ResultCache()
+    tool = RecordingTool(cacheable=True)
+
+    results = _run_twice_concurrently(cache, tool)
+
+    assert tool.calls == 1
+    assert [result.metadata.get("coalesced") for result in results] == [None, True]
+
+
+def test_identical_writes_in_flight_both_run():
+    cache = ResultCache()
+    tool = RecordingTool(cacheable=False)
+
+    results = _run_twice_concurrently(cache, tool)
+
+    assert tool.calls == 2
+    assert not any(result.metadata.get("coalesced") for result in results)
+    assert cache.stats()["coalesced"] == 0
+
+
+def test_repository_changes_invalidate_organization_reports(settings):
+    cache = ResultCache()
+    check_repos = CheckReposTool(settings=settings)
+    report = ToolResult.success(data={"repos": []})
+    cache.run(check_repos, {}, lambda: report)
+    cache.run(check_repos, {"repo_names": ["other"]}, lambda: report)
+    assert cache.stats()["entries"] == 2
+
+    failed = ToolResult.failure("failed")
+    cache.run(SetSecretTool(settings=settings), {"repo_name": "app"}, lambda: failed)
+    assert cache.stats()["entries"] == 1
+
+    created = ToolResult.success()
+    cache.run(CreateRepoTool(settings=settings), {"name": "other"}, lambda: created)
+    assert cache.stats()["entries"] == 0
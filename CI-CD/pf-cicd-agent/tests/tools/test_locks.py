@@ -0,0 +1,119 @@
+"""
+Tests for the resource lock manager and its use by the registry.
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+from pf_cicd_agent.tools import deadline
+from pf_cicd_agent.tools.base import BaseTool, ToolResult
+from pf_cicd_agent.tools.locks import ResourceLockManager
+from pf_cicd_agent.tools.registry import ToolRegistry
+
+
+def _try_hold(locks: ResourceLockManager, reads: set[str], writes: set[str]) -> bool:
+    """Whether a call from another thread gets its locks before a short deadline."""
+    acquired = []
+
+    def hold() -> None:
+        with deadline.deadline_scope(0.05):
+            try:
+                with locks.hold(reads, writes):
+                    acquired.append(True)
+            except deadline.DeadlineExceeded:
+                acquired.append(False)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    thread.join()
+    return acquired[0]
+
+
+def test_readers_share_a_resource():
+    locks = ResourceLockManager()
+
+    with locks.hold({"repo"}, set()):
+        assert _try_hold(locks, {"repo"}, set())
+
+    assert locks.stats()["waits"] == 0
+
+
+def test_writer_excludes_readers_and_writers():
+    locks = ResourceLockManager()
+
+    with locks.hold(set(), {"repo"}):
+        assert not _try_hold(locks, {"repo"}, set())
+        assert not _try_hold(locks, set(), {"repo"})
+        assert _try_hold(locks, set(), {"other"})
+
+    assert _try_hold(locks, set(), {"repo"})
+    assert locks.stats()["timeouts"] == 2
+
+
+def test_reader_excludes_writers():
+    locks = ResourceLockManager()
+
+    with locks.hold({"repo"}, set()):
+        assert not _try_hold(locks, set(), {"repo"})
+
+
+async def test_waiters_are_granted_in_arrival_order():
+    locks = ResourceLockManager()
+    granted: list[str] = []
+    done = {name: asyncio.Event() for name in ("writer 1", "reader 1", "writer 2", "reader 2")}
+
+    async def call(name: str, reads: set[str], writes: set[str]) -> None:
+        async with locks.ahold(reads, writes):
+            granted.append(name)
+            await done[name].wait()
+
+    tasks = [asyncio.create_task(call("writer 1", set(), {"repo"}))]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(call("reader 1", {"repo"}, set())),
+        asyncio.create_task(call("writer 2", set(), {"repo"})),
+        # Compatible with reader 1, but may not overtake writer 2
+        asyncio.create_task(call("reader 2", {"repo"}, set())),
+    ]
+    await asyncio.sleep(0.01)
+
+    for name in done:
+        assert granted[-1] == name
+        done[name].set()
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(*tasks)
+    assert granted == list(done)
+    assert locks.stats()["waits"] == 3
+
+
+class WritingTool(BaseTool):
+    """Tool writing a repository."""
+
+    name = "writing_tool"
+    description = "Writes a repository"
+    category = "github"
+    writes = ("github:repo:{repo_name}",)
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        return {"type": "object", "properties": {"repo_name": {"type": "string"}}}
+
+    def execute(self, **kwargs: Any) -> ToolResult[Any]:  # noqa: ARG002
+        return ToolResult.success()
+
+
+def test_call_waiting_past_its_deadline_for_locks_times_out():
+    registry = ToolRegistry()
+    registry.register(WritingTool)
+
+    with registry.resource_locks.hold(set(), {"github:repo:app"}):
+        with deadline.deadline_scope(0.05):
+            result = registry.execute("writing_tool", repo_name="app")
+        assert registry.execute("writing_tool", repo_name="other").is_success
+
+    assert result.error_code == "TIMEOUT"
+    assert "github:repo:app" in result.error
+    assert result.metadata["timeout_seconds"] == 0.05
+    assert registry.execute("writing_tool", repo_name="app").is_success
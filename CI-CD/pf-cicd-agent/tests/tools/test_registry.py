@@ -0,0 +1,103 @@
+"""
+Tests for the tool registry.
+"""
+
+from typing import Any
+
+from pf_cicd_agent.audit.service import AuditService
+from pf_cicd_agent.tools.base import BaseTool, ToolResult
+from pf_cicd_agent.tools.registry import ToolRegistry
+
+
+class CountingTool(BaseTool):
+    """Tool counting its instantiations."""
+
+    name = "counting_tool"
+    description = "Counts instantiations"
+    category = "github"
+    instances = 0
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        type(self).instances += 1
+
+    @classmethod
+    def get_input_schema(cls) -> dict[str, Any]:
+        return {"type": "object", "properties": {"repo_name": {"type": "string"}}}
+
+    def execute(self, **kwargs: Any) -> ToolResult[Any]:
+        return ToolResult.success()
+
+
+def test_describing_tools_does_not_instantiate_them(monkeypatch):
+    monkeypatch.setattr(CountingTool, "instances", 0)
+    registry = ToolRegistry()
+    registry.register(CountingTool)
+
+    definitions = registry.get_definitions()
+    info = registry.get_tool_info("counting_tool")
+    by_category = registry.get_definitions_by_category("github")
+
+    assert CountingTool.instances == 0
+    assert definitions == by_category == [CountingTool.class_definition()]
+    assert info["input_schema"] == CountingTool.get_input_schema()
+
+    registry.execute("counting_tool")
+    assert CountingTool.instances == 1
+
+
+class ConfiguredTool(CountingTool):
+    """Tool whose schema depends on the instance."""
+
+    name = "configured_tool"
+
+    def get_input_schema(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {}, "maxProperties": self.instances}
+
+
+def test_instance_schemas_are_described_by_the_tool(monkeypatch):
+    monkeypatch.setattr(CountingTool, "instances", 0)
+    registry = ToolRegistry()
+    registry.register(ConfiguredTool)
+
+    [definition] = registry.get_definitions()
+
+    assert definition["input_schema"]["maxProperties"] == 1
+
+
+def test_validators_are_compiled_once_per_class():
+    first, second = CountingTool(), CountingTool()
+    configured = ConfiguredTool()
+
+    assert first.input_validator is second.input_validator
+    assert configured.input_validator is not ConfiguredTool().input_validator
+
+
+def _rejected_event(audit: AuditService):
+    [event] = audit.get_session_events()
+    assert event.success is False and event.error_code == "VALIDATION_ERROR"
+    return event
+
+
+def test_rejected_input_is_audited(settings):
+    audit = AuditService(settings=settings)
+    registry = ToolRegistry(audit_service=audit)
+    registry.register(CountingTool)
+
+    result = registry.execute("counting_tool", repo_name=42)
+
+    assert result.error_code == "VALIDATION_ERROR"
+    event = _rejected_event(audit)
+    assert event.metadata["violations"] == [{"field": "repo_name", "rule": "type"}]
+    assert "42" not in event.error_message
+
+
+async def test_async_rejected_input_is_audited(settings):
+    audit = AuditService(settings=settings)
+    registry = ToolRegistry(audit_service=audit)
+    registry.register(CountingTool)
+
+    result = await registry.aexecute("counting_tool", repo_name=42)
+
+    assert result.error_code == "VALIDATION_ERROR"
+    _rejected_event(audit)